@@ -0,0 +1,50 @@
+import os
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.stats_analytics import StatsAnalytics
+
+
+YEARS = 10
+
+
+
+def make_history(years=YEARS):
+    rng = random.Random(1)
+    today = date.today()
+    stats = {}
+    for ago in range(years * 365):
+        if rng.random() < 0.8:
+            count = rng.randint(1, 12)
+            stats[(today - timedelta(days=ago)).isoformat()] = {'pomodoros': count, 'work_time': count * 1500}
+    return stats
+
+
+
+def bench_analytics(repeats=20):
+    stats = make_history()
+
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        analytics = StatsAnalytics(stats)
+        analytics.weekly()
+        analytics.monthly()
+        analytics.yearly()
+        analytics.rolling_average(7)
+        analytics.rolling_average(30)
+        analytics.weekday_distribution()
+        analytics.summary()
+        timings.append(time.perf_counter() - started)
+
+    print(f'{YEARS}-year history ({len(stats)} active days): '
+          f'best {min(timings) * 1000:.2f} ms, median {sorted(timings)[repeats // 2] * 1000:.2f} ms')
+
+
+
+if __name__ == '__main__':
+    bench_analytics()
@@ -0,0 +1,77 @@
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.stats_manager import StatsManager
+
+
+YEARS = 20
+
+
+
+def make_history(years=YEARS):
+    rng = random.Random(1)
+    today = date.today()
+    stats = {}
+    for ago in range(years * 365):
+        if rng.random() < 0.8:
+            count = rng.randint(1, 12)
+            stats[(today - timedelta(days=ago)).isoformat()] = {'pomodoros': count, 'work_time': count * 1500}
+    return stats
+
+
+
+def cold_manager(stats_file):
+    stats_manager = StatsManager()
+    stats_manager.stats_file = stats_file
+    return stats_manager
+
+
+
+def timed(func):
+    started = time.perf_counter()
+    result = func()
+    return result, (time.perf_counter() - started) * 1000
+
+
+
+def bench_archive():
+    temp_dir = tempfile.mkdtemp()
+    stats_file = os.path.join(temp_dir, 'aPomodoro_stats.json')
+    with open(stats_file, 'w', encoding='utf-8') as f:
+        json.dump(make_history(), f, indent=2)
+
+    size_before = os.path.getsize(stats_file)
+    general, load_before = timed(lambda: cold_manager(stats_file).get_general_stats())
+
+    _, archive_time = timed(lambda: cold_manager(stats_file).archive_stats())
+
+    size_after = os.path.getsize(stats_file)
+    archive_size = sum(os.path.getsize(os.path.join(root, name))
+                       for root, _, names in os.walk(temp_dir) for name in names if name.endswith('.seg'))
+    stats_manager = cold_manager(stats_file)
+    archived_general, load_after = timed(stats_manager.get_general_stats)
+    _, recent_days = timed(lambda: stats_manager.get_days(0, 60))
+    _, old_days = timed(lambda: stats_manager.get_days(10 * 365, 60))
+    _, analytics = timed(lambda: stats_manager.get_analytics().summary())
+
+    assert archived_general == general
+    print(f'{YEARS}-year history: hot file {size_before / 1024:.0f} KB -> {size_after / 1024:.1f} KB, '
+          f'archive {archive_size / 1024:.0f} KB, archiving took {archive_time:.0f} ms')
+    print(f'all-time stats from a cold start: {load_before:.1f} ms -> {load_after:.1f} ms')
+    print(f'history page: recent {recent_days:.2f} ms, ten years back {old_days:.2f} ms (one segment unpacked); '
+          f'trends {analytics:.1f} ms')
+
+    shutil.rmtree(temp_dir)
+
+
+
+if __name__ == '__main__':
+    bench_archive()
@@ -0,0 +1,58 @@
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.stats_recovery import salvage_stats
+
+
+RECORDS = 500_000
+
+
+
+def make_file(path, records=RECORDS):
+    # Ключи только по формату похожи на даты - нужен просто очень большой файл
+    data = {'_meta': {'journal_seq': 0}}
+    for i in range(records):
+        data[f'{1000 + i // 372:04d}-{i // 31 % 12 + 1:02d}-{i % 31 + 1:02d}'] = {'pomodoros': i % 9, 'work_time': i % 9 * 1500}
+    text = json.dumps(data, indent=2)
+    # Обрываем файл посередине и портим одну запись, как после сбоя записи
+    middle = len(text) // 2
+    damaged = text[:middle] + '\x00\x00' + text[middle + 2:len(text) * 9 // 10]
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(damaged)
+    return len(damaged)
+
+
+
+def bench_recovery():
+    temp_dir = tempfile.mkdtemp()
+    path = os.path.join(temp_dir, 'aPomodoro_stats.json')
+    size = make_file(path)
+
+    started = time.perf_counter()
+    stats, _, report = salvage_stats(path)
+    elapsed = time.perf_counter() - started
+
+    # Отдельный прогон под tracemalloc: он сильно замедляет разбор
+    del stats
+    tracemalloc.start()
+    salvage_stats(path)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f'{size / 1024 / 1024:.1f} MB damaged file: {report["days"]} days recovered, '
+          f'{report["dropped"]} dropped in {elapsed:.2f} s ({size / 1024 / 1024 / elapsed:.1f} MB/s)')
+    print(f'peak memory {peak / 1024 / 1024:.1f} MB, almost all of it the recovered days')
+
+    os.remove(path)
+    os.rmdir(temp_dir)
+
+
+
+if __name__ == '__main__':
+    bench_recovery()
@@ -0,0 +1,118 @@
+import os
+import sys
+import time
+from types import SimpleNamespace
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from main import PomodoroApp
+from src.core.timer_state import TimerState
+from src.ui.display_renderer import DisplayRenderer
+from src.ui.progress_ring import arc_step
+
+
+class CountingWidget:
+    def __init__(self):
+        self.calls = 0
+
+    def configure(self, **options):
+        self.calls += 1
+
+    def set(self, value):
+        self.calls += 1
+
+    def title(self, text):
+        self.calls += 1
+
+    def set_text(self, text):
+        self.calls += 1
+
+    def set_color(self, color):
+        self.calls += 1
+
+
+
+class CountingRing(CountingWidget):
+    def __init__(self):
+        super().__init__()
+        self.step = None
+
+    def set_progress(self, progress):
+        # Как ProgressRing: перерисовка только при сдвиге дуги
+        step = arc_step(progress)
+        if step != self.step:
+            self.step = step
+            self.calls += 1
+
+
+
+def make_app():
+    app = SimpleNamespace(
+        renderer=DisplayRenderer(),
+        timer_state=TimerState(),
+        colors={
+            'pomodoro': {'text': '#ff0505', 'circle': '#ff0505'},
+            'short_break': {'text': '#51c1e6', 'circle': '#51c1e6'},
+            'long_break': {'text': '#0048f0', 'circle': '#0048f0'}
+        },
+        root=CountingWidget(),
+        status_label=CountingWidget(),
+        cycle_label=CountingWidget(),
+        ring=CountingRing()
+    )
+    for name in ('format_time', 'get_current_colors', 'update_display', 'update_title'):
+        setattr(app, name, getattr(PomodoroApp, name).__get__(app))
+    return app
+
+
+
+def run(cycles=4):
+    app = make_app()
+    state = app.timer_state
+    ticks = 0
+    started = time.perf_counter()
+
+    for _ in range(cycles * 2):
+        state.is_running = True
+        for remaining in range(state.get_initial_time(), -1, -1):
+            state.current_time = remaining
+            app.update_display()
+            ticks += 1
+        state.is_running = False
+        state.next_period()
+        app.update_display()
+        ticks += 1
+
+    elapsed = time.perf_counter() - started
+    renderer = app.renderer
+    print(f'ticks:                    {ticks}')
+    print(f'widget calls requested:   {renderer.requested_calls / ticks:.2f} per tick')
+    print(f'widget calls applied:     {renderer.applied_calls / ticks:.2f} per tick')
+    print(f'ring arc redraws:         {app.ring.calls / ticks:.2f} per tick (text and colour included)')
+    print(f'update_display cost:      {elapsed / ticks * 1e6:.1f} us per tick (fake widgets)')
+
+
+
+def run_hidden(seconds=25 * 60):
+    # Свёрнутое окно: на тик обновляется только заголовок
+    app = make_app()
+    state = app.timer_state
+    state.is_running = True
+    widget_calls = [widget.calls for widget in (app.status_label, app.cycle_label, app.ring)]
+
+    started = time.perf_counter()
+    for remaining in range(seconds, -1, -1):
+        state.current_time = remaining
+        app.update_title()
+    elapsed = time.perf_counter() - started
+
+    untouched = widget_calls == [widget.calls for widget in (app.status_label, app.cycle_label, app.ring)]
+    print(f'hidden title updates:     {app.root.calls / (seconds + 1):.2f} per tick, '
+          f'other widgets untouched: {untouched}')
+    print(f'update_title cost:        {elapsed / (seconds + 1) * 1e6:.1f} us per tick')
+
+
+
+if __name__ == '__main__':
+    run()
+    run_hidden()
@@ -0,0 +1,51 @@
+import os
+import sys
+import time
+import tkinter as tk
+
+import customtkinter as ctk
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.ui.progress_ring import ProgressRing
+
+
+def bench_animation(fps=30, seconds=5.0, period=25 * 60, speedup=1.0):
+    # Нужен дисплей: меряем настоящую отрисовку Tk, а не заглушки.
+    # Кольцу нужен родитель customtkinter - от него берётся масштабирование
+    try:
+        root = ctk.CTk()
+    except tk.TclError as e:
+        print(f'No display available, skipping ring benchmark: {e}')
+        return
+
+    ring = ProgressRing(root, size=300, fps=fps, bg='#2b2b2b')
+    ring.pack()
+    ring.set_color('#ff0505')
+    ring.set_text('25:00')
+    root.update()
+
+    # Как в приложении: кадры ставятся на границы шагов дуги, длительность
+    # периода в секундах реального времени с учётом ускорения
+    started = time.monotonic()
+    ring.start_animation(lambda: max(0.0, 1 - (time.monotonic() - started) * speedup / period),
+                         lambda: period / speedup)
+
+    cpu_started = time.process_time()
+    wall_started = time.perf_counter()
+    root.after(int(seconds * 1000), root.quit)
+    root.mainloop()
+    cpu = time.process_time() - cpu_started
+    wall = time.perf_counter() - wall_started
+
+    ring.stop_animation()
+    root.destroy()
+    print(f'{fps} fps, {period / speedup:.0f} s period, {wall:.1f} s: {ring.frames_requested} frames, '
+          f'{ring.frames_drawn} arc redraws, CPU {cpu / wall * 100:.1f}%')
+
+
+
+if __name__ == '__main__':
+    # Обычный помидор и ускоренный период, где дуга сдвигается почти каждый кадр
+    bench_animation()
+    bench_animation(speedup=25 * 60 / 20.0)
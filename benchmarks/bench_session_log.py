@@ -0,0 +1,74 @@
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.session_log import RECORD_FORMAT, SessionLog
+
+
+YEARS = 5
+SESSIONS_PER_DAY = 16
+
+
+
+def fill_log(log, years=YEARS):
+    # Пишем сразу весь файл данных, индекс соберётся при первом чтении
+    rng = random.Random(1)
+    start = time.time() - years * 365 * 86400
+    periods = (0, 1, 0, 1, 0, 1, 0, 2)
+    chunks = []
+    for day in range(years * 365):
+        moment = start + day * 86400 + 8 * 3600
+        for i in range(SESSIONS_PER_DAY):
+            period = periods[i % len(periods)]
+            length = 1500 if period == 0 else 300
+            status = 0 if rng.random() < 0.9 else 1
+            chunks.append(RECORD_FORMAT.pack(moment, moment + length, length, rng.randint(0, 2), period, status))
+            moment += length + rng.randint(0, 600)
+    with open(log.data_file, 'wb') as f:
+        f.write(b''.join(chunks))
+    return len(chunks)
+
+
+
+def bench_session_log(repeats=20):
+    temp_dir = tempfile.mkdtemp()
+    log = SessionLog()
+    log.data_file = os.path.join(temp_dir, 'aPomodoro_sessions.bin')
+    count = fill_log(log)
+
+    started = time.perf_counter()
+    len(log)
+    rebuild = time.perf_counter() - started
+
+    reopened = SessionLog()
+    reopened.data_file = log.data_file
+    started = time.perf_counter()
+    len(reopened)
+    load = time.perf_counter() - started
+
+    now = time.time()
+    for name, func in (('heatmap, all time', lambda: reopened.hour_heatmap()),
+                       ('summary, last 30 days', lambda: reopened.summary(now - 30 * 86400, now)),
+                       ('records, last 7 days', lambda: reopened.query(now - 7 * 86400, now))):
+        timings = []
+        for _ in range(repeats):
+            started = time.perf_counter()
+            func()
+            timings.append(time.perf_counter() - started)
+        print(f'{name}: best {min(timings) * 1000:.2f} ms')
+
+    print(f'{count} sessions over {YEARS} years: index rebuild {rebuild * 1000:.1f} ms, '
+          f'index load {load * 1000:.1f} ms')
+
+    for name in os.listdir(temp_dir):
+        os.remove(os.path.join(temp_dir, name))
+    os.rmdir(temp_dir)
+
+
+
+if __name__ == '__main__':
+    bench_session_log()
@@ -0,0 +1,88 @@
+import os
+import random
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.session_scheduler import SessionScheduler
+
+
+SESSIONS = 10_000
+
+
+
+def bench_virtual_throughput(sessions=SESSIONS, periods=20):
+    now = [0.0]
+    transitions = [0]
+
+    def on_finished(session, completed, next_period):
+        transitions[0] += 1
+
+    scheduler = SessionScheduler(clock=lambda: now[0], on_period_finished=on_finished)
+    rng = random.Random(1)
+    for i in range(sessions):
+        scheduler.add_session(i, pomodoro_time=rng.randint(1200, 1800))
+
+    started = time.perf_counter()
+    while transitions[0] < sessions * periods:
+        now[0] = scheduler.next_deadline()
+        scheduler.run_due()
+    elapsed = time.perf_counter() - started
+
+    print(f'virtual clock: {transitions[0]} transitions in {elapsed:.2f} s '
+          f'({transitions[0] / elapsed:,.0f}/s)')
+
+
+
+def bench_real_time(sessions=SESSIONS, seconds=5.0):
+    transitions = [0]
+
+    def on_finished(session, completed, next_period):
+        transitions[0] += 1
+
+    scheduler = SessionScheduler(on_period_finished=on_finished)
+    rng = random.Random(2)
+    for i in range(sessions):
+        # Укороченные периоды, чтобы за время замера сработали тысячи сессий
+        scheduler.add_session(i, pomodoro_time=rng.uniform(1, 60),
+                              short_break_time=5, long_break_time=15)
+
+    thread = threading.Thread(target=scheduler.run_forever)
+    cpu_started = time.process_time()
+    wall_started = time.perf_counter()
+    thread.start()
+    time.sleep(seconds)
+    scheduler.stop()
+    thread.join()
+    cpu = time.process_time() - cpu_started
+    wall = time.perf_counter() - wall_started
+
+    print(f'real time:     {sessions} sessions, {transitions[0]} transitions, '
+          f'{scheduler.wakeups} wakeups in {wall:.1f} s, CPU {cpu / wall * 100:.1f}%')
+
+
+
+def bench_idle(sessions=SESSIONS, seconds=3.0):
+    scheduler = SessionScheduler()
+    for i in range(sessions):
+        scheduler.add_session(i)
+
+    thread = threading.Thread(target=scheduler.run_forever)
+    cpu_started = time.process_time()
+    thread.start()
+    time.sleep(seconds)
+    scheduler.stop()
+    thread.join()
+    cpu = time.process_time() - cpu_started
+
+    print(f'idle:          {sessions} running 25-minute sessions, '
+          f'{scheduler.wakeups} wakeups in {seconds:.0f} s, CPU {cpu / seconds * 100:.2f}%')
+
+
+
+if __name__ == '__main__':
+    bench_virtual_throughput()
+    bench_real_time()
+    bench_idle()
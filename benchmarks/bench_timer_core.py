@@ -0,0 +1,29 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.simulation import CycleSimulation
+
+
+TRANSITIONS = 2_000_000
+
+
+
+def bench_cycles(transitions=TRANSITIONS):
+    report = CycleSimulation().run(transitions)
+
+    print(f'transitions:   {report["transitions"]:,} '
+          f'({report["transitions_per_second"]:,.0f}/s)')
+    print(f'virtual time:  {report["virtual_seconds"] / 86400 / 365:.1f} years')
+    print(f'completed:     {report["completed"]}')
+    print(f'totals:        {report["totals"]["pomodoros"]:,} pomodoros on '
+          f'{report["totals"]["active_days"]:,} days')
+    print(f'violations:    {len(report["violations"])}')
+    for violation in report['violations']:
+        print(f'  {violation}')
+
+
+
+if __name__ == '__main__':
+    bench_cycles()
@@ -0,0 +1,64 @@
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.core.stats_manager import StatsManager
+from src.core.stats_transfer import export_stats, import_stats
+
+
+RECORDS = 1_000_000
+
+
+
+def make_csv(path, records=RECORDS):
+    # Одна строка на помидор, как в выгрузках других трекеров, за 30 лет
+    rng = random.Random(1)
+    today = date.today()
+    dates = [(today - timedelta(days=ago)).isoformat() for ago in range(30 * 365)]
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write('date,work_time\n')
+        for _ in range(records):
+            f.write(f'{rng.choice(dates)}T{rng.randint(6, 22):02d}:{rng.randint(0, 59):02d}:00,'
+                    f'{rng.choice((1500, 1500, 1800, 3000))}\n')
+
+
+
+def fresh_manager(temp_dir, name):
+    stats_manager = StatsManager()
+    stats_manager.stats_file = os.path.join(temp_dir, name, 'aPomodoro_stats.json')
+    os.makedirs(os.path.dirname(stats_manager.stats_file))
+    return stats_manager
+
+
+
+def bench_transfer():
+    temp_dir = tempfile.mkdtemp()
+    path = os.path.join(temp_dir, 'history.csv')
+    make_csv(path)
+    size = os.path.getsize(path) / 1024 / 1024
+
+    for label, workers in (('one process', 1), (f'pool of {os.cpu_count()}', None)):
+        stats_manager = fresh_manager(temp_dir, label.replace(' ', '_'))
+        started = time.perf_counter()
+        report = import_stats(stats_manager, path, workers=workers)
+        elapsed = time.perf_counter() - started
+        print(f'import {RECORDS} records ({size:.0f} MB), {label}: {elapsed:.2f} s '
+              f'({report["records"] / elapsed / 1000:.0f}k records/s), {report["days"]} days')
+
+    export_path = os.path.join(temp_dir, 'export.jsonl')
+    started = time.perf_counter()
+    count = export_stats(stats_manager, export_path)
+    print(f'export {count} days to JSON Lines: {(time.perf_counter() - started) * 1000:.0f} ms')
+
+    shutil.rmtree(temp_dir)
+
+
+
+if __name__ == '__main__':
+    bench_transfer()
@@ -1,41 +1,158 @@
-import customtkinter as ctk
-from src.core.timer_state import TimerState
-from src.utils.sound_manager import SoundManager
-from src.utils.settings_manager import SettingsManager
-from src.core.stats_manager import StatsManager
-from src.ui.ui_windows import UIWindows
 import sys
-
-ctk.set_appearance_mode('dark')
-ctk.set_default_color_theme('blue')
+import threading
+
+from src.utils.startup_profiler import StartupProfiler
+
+profiler = StartupProfiler()
+
+with profiler.phase('import customtkinter'):
+    import customtkinter as ctk
+
+# Окна, статистика и pygame импортируются при первом обращении
+with profiler.phase('import app modules'):
+    from src.core.timer_state import TimerState
+    from src.core.timer_engine import TimerEngine
+    from src.core.session_checkpoint import SessionCheckpoint, missed_pomodoro_days
+    from src.core.session_log import SessionLog, SessionTracker
+    from src.utils.sound_manager import SoundManager
+    from src.utils.settings_manager import SettingsManager
+    from src.utils.background_writer import BackgroundWriter
+    from src.ui.display_renderer import DisplayRenderer
+    from src.ui.progress_ring import ProgressRing
+    from src.ui.render_policy import RenderPolicy
+    from src.ui.tk_scheduler import TkScheduler
+
+# Частота кадров анимации кольца, пока таймер идёт
+RING_FPS = 30
+# Окно видно, но без фокуса - кольцу хватит нескольких кадров в секунду
+BACKGROUND_RING_FPS = 5
+# Статистику держит другой процесс: сохранение помидора повторяется в фоне
+# примерно полторы минуты, прежде чем сдаться
+STATS_SAVE_RETRIES = 30
 
 
 class PomodoroApp:
-    def __init__(self):
-        self.root = ctk.CTk()
-        self.root.title('aPomodoro')
-        self.root.after(100, lambda: self.root.state('zoomed'))
-        self.root.minsize(600, 700)
-        self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
-        self.timer_state = TimerState()
-        self.sound_manager = SoundManager()
-        self.settings_manager = SettingsManager()
-        self.stats_manager = StatsManager()
+    def __init__(self, profiler=profiler, persist=True):
+        self.profiler = profiler
+        # Замер запуска (--profile-startup) не должен ничего записывать на диск
+        self.persist = persist
+
+        with profiler.phase('Tk init'):
+            self.root = ctk.CTk()
+            self.root.title('aPomodoro')
+            self.root.after(100, lambda: self.root.state('zoomed'))
+            self.root.minsize(600, 700)
+            self.root.protocol("WM_DELETE_WINDOW", self.on_closing)
+
+        with profiler.phase('app state init'):
+            self.timer_state = TimerState()
+            self.writer = BackgroundWriter()
+            self.sound_manager = SoundManager(async_init=True)
+            self.settings_manager = SettingsManager()
+            self.checkpoint = SessionCheckpoint()
+            self.session_log = SessionLog()
+            self.session_tracker = SessionTracker(self.timer_state.wall_clock)
+            self._stats_manager = None
+            self._stats_lock = threading.Lock()
+            self._ui_windows = None
+
+            self.engine = TimerEngine(self.timer_state, TkScheduler(self.root))
+            self.engine.subscribe('tick', self.on_tick)
+            self.engine.subscribe('period_started', self.on_timer_started)
+            self.engine.subscribe('period_resumed', self.on_timer_started)
+            self.engine.subscribe('period_paused', self.on_timer_stopped)
+            self.engine.subscribe('period_finished', self.on_period_finished)
+            self.engine.subscribe('timer_reset', self.on_timer_reset)
+            # Контрольная точка пишется только на переходах состояния, не на тиках
+            for event in ('period_started', 'period_resumed', 'period_paused',
+                          'period_finished', 'timer_reset'):
+                self.engine.subscribe(event, self.save_checkpoint)
+            self.engine.subscribe('period_started', self.session_tracker.begin)
+            self.engine.subscribe('period_paused', lambda period: self.session_tracker.pause())
+            self.engine.subscribe('period_resumed', lambda period: self.session_tracker.resume())
+            self.engine.subscribe('period_finished', lambda *args: self.finish_session('completed'))
+            self.engine.subscribe('timer_reset', lambda: self.finish_session('reset'))
+            self.renderer = DisplayRenderer()
+            self.colors = {
+                'pomodoro': {'text': '#ff0505', 'circle': '#ff0505'},
+                'short_break': {'text': '#51c1e6', 'circle': '#51c1e6'},
+                'long_break': {'text': '#0048f0', 'circle': '#0048f0'}
+            }
+            self.settings_manager.load_settings(self.timer_state)
+            resume = self.restore_session()
+            self.sound_manager.prefetch([self.timer_state.pomodoro_sound,
+                                         self.timer_state.short_break_sound,
+                                         self.timer_state.long_break_sound])
+
+        with profiler.phase('create_interface'):
+            self.create_interface()
+
+        with profiler.phase('first update_display'):
+            self.update_display()
+
+        self.render_policy = RenderPolicy(self.root, self.on_render_mode_changed)
+        if resume:
+            self.engine.start()
+
+        # Проверка файла статистики не должна задерживать первый кадр
+        if self.persist:
+            self.writer.submit(self.check_stats_file)
+        self.root.after(1500, self.prebuild_windows)
+
+
+
+    @property
+    def stats_manager(self):
+        with self._stats_lock:
+            if self._stats_manager is None:
+                self._stats_manager = create_stats_manager()
+            return self._stats_manager
+
+
+
+    def restore_session(self):
+        completed, resume = self.checkpoint.restore(self.timer_state, self.engine.auto_start_delay)
+        days = missed_pomodoro_days(completed)
+        if days and self.persist:
+            self.writer.submit(self.checkpoint.commit_catch_up, self.stats_manager, days,
+                               self.checkpoint.pack(self.timer_state))
+        return resume
+
+
+
+    def save_checkpoint(self, *args):
+        if not self.persist:
+            return
+        self.writer.submit(self.checkpoint.write, self.checkpoint.pack(self.timer_state),
+                           key='checkpoint')
+
+
+
+    def finish_session(self, status):
+        record = self.session_tracker.finish(status)
+        if record is not None and self.persist:
+            self.writer.submit(self.session_log.append, record)
 
+
+
+    def check_stats_file(self):
         try:
             self.stats_manager.get_general_stats()
+            if self.stats_manager.recovery_report is not None:
+                # Файл прочитан по частям - переписываем его из спасённых дней
+                self.stats_manager.repair_stats_file()
+            # Прошедшие годы уезжают в сжатый архив, горячий файл остаётся маленьким
+            self.stats_manager.archive_stats()
         except Exception:
             self.stats_manager.repair_stats_file()
 
-        self.timer_job = None
-        self.colors = {
-            'pomodoro': {'text': '#ff0505', 'circle': '#ff0505'},
-            'short_break': {'text': '#51c1e6', 'circle': '#51c1e6'},
-            'long_break': {'text': '#0048f0', 'circle': '#0048f0'}
-        }
-        self.settings_manager.load_settings(self.timer_state)
-        self.create_interface()
-        self.update_display()
+
+
+    def report_startup(self):
+        with self.profiler.phase('first frame'):
+            self.root.update_idletasks()
+        print(self.profiler.report())
+        self.on_closing()
 
 
 
@@ -56,16 +173,9 @@ class PomodoroApp:
                                         font=ctk.CTkFont(size=20))
         self.cycle_label.pack(pady=(0, 20))
 
-        self.time_frame = ctk.CTkFrame(main_frame, width=300, height=300, corner_radius=150)
-        self.time_frame.pack(pady=(0, 20))
-        self.time_frame.pack_propagate(False)
-
-        self.time_label = ctk.CTkLabel(self.time_frame, text='',
-                                       font=ctk.CTkFont(size=48, weight='bold'))
-        self.time_label.place(relx=0.5, rely=0.5, anchor='center')
-
-        self.progress = ctk.CTkProgressBar(main_frame, width=400, height=20)
-        self.progress.pack(pady=(0, 30))
+        self.ring = ProgressRing(main_frame, size=300, fps=RING_FPS,
+                                 font=ctk.CTkFont(size=48, weight='bold'))
+        self.ring.pack(pady=(0, 30))
 
         self.create_control_buttons(main_frame)
 
@@ -122,134 +232,156 @@ class PomodoroApp:
 
 
     def get_current_colors(self):
-        if self.timer_state.is_pomodoro_mode:
-            return self.colors['pomodoro']
-        else:
-            if self.timer_state.cycle_count == 0:
-                return self.colors['long_break']
-            else:
-                return self.colors['short_break']
+        return self.colors[self.timer_state.get_current_period()]
 
 
 
     def update_display(self):
-        self.time_label.configure(text=self.format_time(self.timer_state.current_time))
+        render = self.renderer
+        time_text = self.format_time(self.timer_state.current_time)
         colors = self.get_current_colors()
         status = self.timer_state.get_current_period_name()
-        self.status_label.configure(text=status, text_color=colors['text'])
-        self.time_frame.configure(fg_color=colors['circle'])
-        self.progress.configure(progress_color=colors['text'])
-        initial_time = self.timer_state.get_initial_time()
-        progress_value = self.timer_state.current_time / initial_time if initial_time > 0 else 0
-        self.progress.set(progress_value)
 
-        if self.timer_state.is_running:
-            self.root.title(f'{self.format_time(self.timer_state.current_time)} - aPomodoro')
-        else:
-            self.root.title('aPomodoro')
+        render.update(self.ring, 'text', time_text, self.ring.set_text)
+        render.update(self.ring, 'color', colors['circle'], self.ring.set_color)
+        render.configure(self.status_label, text=status, text_color=colors['text'])
+        # Кольцо само пропускает кадры, в которых дуга не сдвинулась
+        self.ring.set_progress(self.timer_state.get_progress())
+
+        self.update_title(time_text)
 
         filled = '● ' * self.timer_state.cycle_count
         empty = '○ ' * (4 - self.timer_state.cycle_count)
-        self.cycle_label.configure(text=(filled + empty).strip())
+        render.configure(self.cycle_label, text=(filled + empty).strip())
+
+
+
+    def update_title(self, time_text=None):
+        if self.timer_state.is_running:
+            title = f'{time_text or self.format_time(self.timer_state.current_time)} - aPomodoro'
+        else:
+            title = 'aPomodoro'
+        self.renderer.update(self.root, 'title', title, self.root.title)
+
+
+
+    def on_render_mode_changed(self, mode, previous):
+        self.engine.set_ticks_enabled(mode != 'none')
+        if self.render_policy.is_visible and previous in ('title', 'none'):
+            # Пока окно было скрыто, виджеты не обновлялись - перерисовываем всё
+            self.renderer.invalidate()
+            self.update_display()
+        self.sync_ring_animation()
+
+
+
+    def sync_ring_animation(self):
+        if self.timer_state.is_running and self.render_policy.is_visible:
+            self.ring.fps = RING_FPS if self.render_policy.mode == 'full' else BACKGROUND_RING_FPS
+            self.ring.start_animation(self.timer_state.get_progress, self.timer_state.get_initial_time)
+        else:
+            self.ring.stop_animation()
 
 
 
     def start_timer(self):
-        self.timer_state.is_running = True
-        self.start_btn.configure(state='disabled')
-        self.pause_btn.configure(state='normal')
-        self.tick()
+        self.engine.start()
 
 
 
     def pause_timer(self):
-        self.timer_state.is_running = False
-        self.start_btn.configure(state='normal')
-        self.pause_btn.configure(state='disabled')
-        if self.timer_job:
-            self.root.after_cancel(self.timer_job)
-            self.timer_job = None
+        self.engine.pause()
 
 
 
     def reset_timer(self):
-        self.pause_timer()
-        self.timer_state.reset_to_pomodoro()
-        self.update_display()
+        self.engine.reset()
 
 
 
-    def tick(self):
-        if self.timer_state.is_running and self.timer_state.current_time > 0:
-            self.timer_state.current_time -= 1
+    def on_tick(self, remaining):
+        if self.render_policy.is_visible:
             self.update_display()
-            self.timer_job = self.root.after(1000, self.tick)
-        elif self.timer_state.is_running:
-            self.timer_finished()
+        else:
+            self.update_title()
+
+
+
+    def on_timer_started(self, period):
+        self.start_btn.configure(state='disabled')
+        self.pause_btn.configure(state='normal')
+        self.sync_ring_animation()
 
 
 
-    def timer_finished(self):
-        self.timer_state.is_running = False
+    def on_timer_stopped(self, period=None):
         self.start_btn.configure(state='normal')
         self.pause_btn.configure(state='disabled')
+        self.ring.stop_animation()
 
-        if self.timer_state.is_pomodoro_mode:
-            completed_mode = 'pomodoro'
-            self.stats_manager.save_completed_pomodoro(self.timer_state.pomodoro_time)
-        else:
-            if self.timer_state.cycle_count == 0:
-                completed_mode = 'long_break'
-            else:
-                completed_mode = 'short_break'
 
-        self.sound_manager.handle_timer_finished(self.timer_state, completed_mode)
 
-        next_period = self.timer_state.next_period()
+    def on_timer_reset(self):
+        self.on_timer_stopped()
+        self.update_display()
+
+
+
+    def on_period_finished(self, completed_mode, next_period):
+        self.on_timer_stopped()
+
+        if completed_mode == 'pomodoro':
+            self.writer.submit(self.stats_manager.save_completed_pomodoro,
+                               self.timer_state.pomodoro_time, retries=STATS_SAVE_RETRIES)
+
+        self.sound_manager.handle_timer_finished(self.timer_state, completed_mode)
         self.update_display()
-        self.root.after(2000, self.auto_start_next)
 
 
 
-    def auto_start_next(self):
-        self.start_timer()
+    @property
+    def ui_windows(self):
+        if self._ui_windows is None:
+            from src.ui.ui_windows import UIWindows
+            self._ui_windows = UIWindows(self.root, self.timer_state, self.settings_manager,
+                                         lambda: self.stats_manager, self.update_display)
+        return self._ui_windows
+
+
+
+    def prebuild_windows(self):
+        self.ui_windows.prebuild()
 
 
 
     def show_about(self):
-        UIWindows.show_about(self.root)
+        self.ui_windows.show_about()
 
 
 
     def show_settings(self):
-        UIWindows.show_settings(
-            self.root,
-            self.timer_state,
-            self.settings_manager,
-            self.update_display
-        )
+        self.ui_windows.show_settings()
 
 
 
     def show_stats(self):
-        try:
-            UIWindows.show_stats(self.root, self.stats_manager)
-        except Exception as e:
-            self.stats_manager.repair_stats_file()
-            try:
-                UIWindows.show_stats(self.root, self.stats_manager)
-            except Exception:
-                import tkinter.messagebox as messagebox
-                messagebox.showerror("Error", "Couldn't load statistics.\nThe statistics file will be reset..")
-                self.stats_manager.reset_stats()
+        # Окно появляется сразу, данные (и восстановление файла) догружаются в фоне
+        self.ui_windows.show_stats()
 
 
 
     def on_closing(self):
-        if self.timer_job:
-            self.root.after_cancel(self.timer_job)
-            self.timer_job = None
-        self.settings_manager.save_settings(self.timer_state)
+        # Закрытие - это пауза: при следующем запуске период продолжится с того же места
+        self.engine.pause()
+        self.engine.shutdown()
+        self.save_checkpoint()
+        self.finish_session('interrupted')
+        self.ring.stop_animation()
+        if self._ui_windows is not None:
+            self._ui_windows.close()
+        if self.persist:
+            self.writer.submit(self.settings_manager.save_settings, self.timer_state, key='settings')
+        self.writer.close()
         self.sound_manager.cleanup()
         self.root.destroy()
         sys.exit()
@@ -263,6 +395,61 @@ class PomodoroApp:
             self.on_closing()
 
 
+def create_stats_manager():
+    if '--sqlite-stats' in sys.argv:
+        from src.core.sqlite_stats_manager import SqliteStatsManager
+        return SqliteStatsManager()
+    else:
+        from src.core.stats_manager import StatsManager
+        return StatsManager()
+
+
+def run_stats_command(argv):
+    # Экспорт и импорт статистики из командной строки, без окна приложения.
+    # Возвращает код выхода или None, если команды нет
+    commands = [flag for flag in ('--export-stats', '--import-stats') if flag in argv]
+    if not commands:
+        return None
+
+    flag = commands[0]
+    index = argv.index(flag)
+    if index + 1 >= len(argv):
+        print(f"Usage: {flag} <file.csv|file.jsonl>")
+        return 2
+    path = argv[index + 1]
+
+    from src.core import stats_transfer
+    stats_manager = create_stats_manager()
+    try:
+        if flag == '--export-stats':
+            count = stats_transfer.export_stats(stats_manager, path)
+            print(f"Exported {count} days to {path}")
+            return 0
+        report = stats_transfer.import_stats(stats_manager, path)
+        print(stats_transfer.describe_import(report))
+        return 0 if report['saved'] else 1
+    except Exception as e:
+        print(f"Error transferring stats: {e}")
+        return 1
+
+
+def main():
+    status = run_stats_command(sys.argv)
+    if status is not None:
+        sys.exit(status)
+
+    ctk.set_appearance_mode('dark')
+    ctk.set_default_color_theme('blue')
+
+    profile_startup = '--profile-startup' in sys.argv
+    app = PomodoroApp(persist=not profile_startup)
+    if profile_startup:
+        app.root.after_idle(app.report_startup)
+    app.run()
+
+
 if __name__ == '__main__':
-    app = PomodoroApp()
-    app.run()
\ No newline at end of file
+    # Нужно собранному exe, чтобы процессы пула импорта не запускали приложение заново
+    import multiprocessing
+    multiprocessing.freeze_support()
+    main()
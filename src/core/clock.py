@@ -0,0 +1,52 @@
+import sys
+import time
+
+
+# Linux: CLOCK_BOOTTIME идёт и во время сна системы, но не зависит от перевода
+# настенных часов. На Windows так устроен сам time.monotonic()
+BOOTTIME = getattr(time, 'CLOCK_BOOTTIME', None)
+
+
+class MonotonicClock:
+    # Если часы считают сон, сон не нужно угадывать по скачку настенных часов
+    counts_suspend = BOOTTIME is not None or sys.platform == 'win32'
+
+    def monotonic(self):
+        if BOOTTIME is not None:
+            return time.clock_gettime(BOOTTIME)
+        return time.monotonic()
+
+    def wall(self):
+        return time.time()
+
+
+
+class VirtualClock:
+    # Сон моделируется как у time.monotonic() на macOS: монотонные часы стоят
+    counts_suspend = False
+
+    def __init__(self, start=0.0, wall_start=1700000000.0):
+        self.now = start
+        self.wall_now = wall_start
+
+    def __call__(self):
+        return self.now
+
+    def monotonic(self):
+        return self.now
+
+    def wall(self):
+        return self.wall_now
+
+    def advance(self, seconds, wall_seconds=None):
+        # wall_seconds больше seconds - система спала, монотонные часы стояли
+        if seconds < 0:
+            raise ValueError(f"Virtual clock cannot go back: {seconds}")
+        self.now += seconds
+        self.wall_now += seconds if wall_seconds is None else wall_seconds
+
+    def advance_to(self, moment):
+        # Ровно в moment, без ошибки округления now + (moment - now)
+        if moment > self.now:
+            self.wall_now += moment - self.now
+            self.now = moment
@@ -0,0 +1,72 @@
+import heapq
+import itertools
+import threading
+import time
+
+
+class Scheduler:
+    def __init__(self, clock=time.monotonic):
+        self.clock = clock
+        self._queue = []
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._running = False
+
+
+
+    def call_later(self, delay, callback, *args):
+        entry = [self.clock() + max(0.0, delay), next(self._counter), callback, args]
+        with self._condition:
+            heapq.heappush(self._queue, entry)
+            self._condition.notify()
+        return entry
+
+
+
+    def cancel(self, entry):
+        # Ленивая отмена: запись остаётся в куче и выбрасывается при извлечении
+        with self._condition:
+            entry[2] = None
+
+
+
+    def next_due(self):
+        with self._condition:
+            while self._queue and self._queue[0][2] is None:
+                heapq.heappop(self._queue)
+            return self._queue[0][0] if self._queue else None
+
+
+
+    def run_pending(self):
+        executed = 0
+        while True:
+            with self._condition:
+                while self._queue and self._queue[0][2] is None:
+                    heapq.heappop(self._queue)
+                if not self._queue or self._queue[0][0] > self.clock():
+                    return executed
+                _, _, callback, args = heapq.heappop(self._queue)
+
+            callback(*args)
+            executed += 1
+
+
+
+    def run_forever(self):
+        self._running = True
+        while self._running:
+            self.run_pending()
+            with self._condition:
+                if not self._running:
+                    break
+                due = self._queue[0][0] if self._queue else None
+                timeout = None if due is None else max(0.0, due - self.clock())
+                self._condition.wait(timeout)
+
+
+
+    def stop(self):
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
@@ -0,0 +1,194 @@
+import os
+import struct
+import sys
+import zlib
+from datetime import datetime
+
+from src.core.timer_state import POMODOROS_PER_CYCLE, advance_cycle, period_name
+from src.utils.file_utils import atomic_write_bytes
+
+
+# Запись фиксированного размера: magic, версия, флаги, цикл, дедлайн по настенным
+# часам, остаток на паузе, три длительности и CRC32 всего, что перед ним
+CHECKPOINT_MAGIC = b'APCK'
+CHECKPOINT_VERSION = 1
+CHECKPOINT_FORMAT = struct.Struct('<4sBBBxddIII')
+CHECKPOINT_SIZE = CHECKPOINT_FORMAT.size + 4
+
+FLAG_RUNNING = 1
+FLAG_POMODORO = 2
+# Догоняем не больше одного полного цикла: после долгого простоя таймер
+# не засчитывает сотни помидоров, а останавливается в начале следующего периода
+MAX_CATCH_UP_PERIODS = 2 * POMODOROS_PER_CYCLE
+
+
+def catch_up(record, now, auto_start_delay):
+    # Прокручиваем периоды, которые закончились, пока приложение было закрыто,
+    # так же, как это сделал бы работающий движок с автостартом.
+    # completed - список (период, время окончания по настенным часам, длительность)
+    completed = []
+    if not record['is_running']:
+        return dict(record), completed
+
+    record = dict(record)
+    durations = {
+        'pomodoro': record['pomodoro_time'],
+        'short_break': record['short_break_time'],
+        'long_break': record['long_break_time']
+    }
+
+    deadline = record['deadline']
+    while deadline <= now:
+        period = period_name(record['is_pomodoro_mode'], record['cycle_count'])
+        completed.append((period, deadline, durations[period]))
+        next_period, record['is_pomodoro_mode'], record['cycle_count'] = advance_cycle(
+            record['is_pomodoro_mode'], record['cycle_count'])
+        record['remaining'] = float(durations[next_period])
+
+        if auto_start_delay is None or len(completed) >= MAX_CATCH_UP_PERIODS:
+            record['is_running'] = False
+            record['deadline'] = 0.0
+            return record, completed
+        deadline += auto_start_delay + durations[next_period]
+
+    period = period_name(record['is_pomodoro_mode'], record['cycle_count'])
+    record['deadline'] = deadline
+    record['remaining'] = min(deadline - now, float(durations[period]))
+    return record, completed
+
+
+def missed_pomodoro_days(completed):
+    # Помидоры, которые закончились, пока приложение было закрыто: по дням их окончания
+    # и с длительностью из снимка, в формате merge_days
+    days = {}
+    for period, ended_at, duration in completed:
+        if period == 'pomodoro':
+            date_str = datetime.fromtimestamp(ended_at).strftime('%Y-%m-%d')
+            day = days.setdefault(date_str, {'pomodoros': 0, 'work_time': 0})
+            day['pomodoros'] += 1
+            day['work_time'] += duration
+    return days
+
+
+class SessionCheckpoint:
+    def __init__(self):
+        self.checkpoint_file = self.resource_path('aPomodoro_session.bin')
+
+    def resource_path(self, relative_path):
+        try:
+            base_path = sys._MEIPASS
+        except AttributeError:
+            base_path = os.path.abspath(os.path.dirname(__file__))
+            base_path = os.path.abspath(os.path.join(base_path, '..', '..'))
+
+        return os.path.join(base_path, relative_path)
+
+
+
+    def pack(self, timer_state):
+        # Упаковываем на потоке Tk, а пишем уже готовые байты в фоне
+        is_running = timer_state.deadline is not None
+        remaining = timer_state.get_remaining()
+        deadline = timer_state.wall_clock() + remaining if is_running else 0.0
+
+        flags = (FLAG_RUNNING if is_running else 0) | \
+                (FLAG_POMODORO if timer_state.is_pomodoro_mode else 0)
+        payload = CHECKPOINT_FORMAT.pack(
+            CHECKPOINT_MAGIC, CHECKPOINT_VERSION, flags, timer_state.cycle_count,
+            deadline, remaining, timer_state.pomodoro_time,
+            timer_state.short_break_time, timer_state.long_break_time)
+        return payload + struct.pack('<I', zlib.crc32(payload))
+
+
+
+    def write(self, data):
+        try:
+            atomic_write_bytes(self.checkpoint_file, data)
+            return True
+        except Exception as e:
+            print(f"Error saving session checkpoint: {e}")
+            return False
+
+
+
+    def commit_catch_up(self, stats_manager, days, data):
+        # Пропущенные помидоры и новое состояние пишутся одним заданием: со старой
+        # контрольной точкой следующий запуск засчитал бы те же помидоры ещё раз
+        if not stats_manager.merge_days(days):
+            return False
+        return self.write(data)
+
+
+
+    def save(self, timer_state):
+        return self.write(self.pack(timer_state))
+
+
+
+    def load(self):
+        try:
+            with open(self.checkpoint_file, 'rb') as f:
+                data = f.read(CHECKPOINT_SIZE + 1)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            print(f"Error loading session checkpoint: {e}")
+            return None
+
+        return self.unpack(data)
+
+
+
+    def unpack(self, data):
+        if len(data) != CHECKPOINT_SIZE:
+            print("Session checkpoint has wrong size, ignoring it")
+            return None
+
+        payload, (crc,) = data[:-4], struct.unpack('<I', data[-4:])
+        if zlib.crc32(payload) != crc:
+            print("Session checkpoint is corrupted, ignoring it")
+            return None
+
+        (magic, version, flags, cycle_count, deadline, remaining,
+         pomodoro_time, short_break_time, long_break_time) = CHECKPOINT_FORMAT.unpack(payload)
+        if magic != CHECKPOINT_MAGIC or version != CHECKPOINT_VERSION:
+            print("Unknown session checkpoint format, ignoring it")
+            return None
+
+        return {
+            'is_running': bool(flags & FLAG_RUNNING),
+            'is_pomodoro_mode': bool(flags & FLAG_POMODORO),
+            'cycle_count': cycle_count,
+            'deadline': deadline,
+            'remaining': remaining,
+            'pomodoro_time': pomodoro_time,
+            'short_break_time': short_break_time,
+            'long_break_time': long_break_time
+        }
+
+
+
+    def restore(self, timer_state, auto_start_delay=None):
+        # Возвращает (завершившиеся периоды как в catch_up, нужно ли продолжить отсчёт)
+        record = self.load()
+        if record is None:
+            return [], False
+
+        # Пропущенные периоды считаются с длительностями из записи, а не из текущих настроек
+        record, completed = catch_up(record, timer_state.wall_clock(), auto_start_delay)
+
+        timer_state.is_pomodoro_mode = record['is_pomodoro_mode']
+        timer_state.cycle_count = record['cycle_count']
+        timer_state.set_remaining(record['remaining'])
+        return completed, record['is_running']
+
+
+
+    def clear(self):
+        try:
+            if os.path.exists(self.checkpoint_file):
+                os.remove(self.checkpoint_file)
+            return True
+        except Exception as e:
+            print(f"Error removing session checkpoint: {e}")
+            return False
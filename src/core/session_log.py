@@ -0,0 +1,283 @@
+import os
+import struct
+import sys
+import threading
+from bisect import bisect_left
+from datetime import datetime
+
+
+# Запись сессии: начало и конец по настенным часам, чистое время работы,
+# число пауз, тип периода и чем сессия закончилась
+RECORD_FORMAT = struct.Struct('<ddIHBB')
+# Индекс по часовым корзинам: номер часа, первая запись, число записей
+# и агрегаты по помидорам в этом часе
+INDEX_FORMAT = struct.Struct('<qIIIIIIQ')
+BUCKET_SECONDS = 3600
+
+PERIODS = ('pomodoro', 'short_break', 'long_break')
+STATUSES = ('completed', 'reset', 'interrupted')
+
+
+class SessionTracker:
+    def __init__(self, wall_clock):
+        self.wall_clock = wall_clock
+        self._session = None
+
+
+
+    @property
+    def active(self):
+        return self._session is not None
+
+
+
+    def begin(self, period):
+        now = self.wall_clock()
+        self._session = {'period': period, 'start': now, 'resumed': now, 'focus_time': 0.0, 'pauses': 0}
+
+
+
+    def pause(self):
+        session = self._session
+        if session is not None and session['resumed'] is not None:
+            session['focus_time'] += self.wall_clock() - session['resumed']
+            session['resumed'] = None
+            session['pauses'] += 1
+
+
+
+    def resume(self):
+        session = self._session
+        if session is not None and session['resumed'] is None:
+            session['resumed'] = self.wall_clock()
+
+
+
+    def finish(self, status):
+        # Возвращает готовую запись для SessionLog.append или None, если сессии не было
+        session = self._session
+        if session is None:
+            return None
+        self._session = None
+
+        now = self.wall_clock()
+        focus_time = session['focus_time']
+        if session['resumed'] is not None:
+            focus_time += now - session['resumed']
+        return {
+            'start': session['start'],
+            'end': max(now, session['start']),
+            'period': session['period'],
+            'status': status,
+            'focus_time': max(0, round(focus_time)),
+            'pauses': session['pauses']
+        }
+
+
+
+class SessionLog:
+    def __init__(self):
+        self.data_file = self.resource_path('aPomodoro_sessions.bin')
+        self._lock = threading.RLock()
+        self._loaded = False
+        self._record_count = 0
+        self._buckets = []
+        self._entries = []
+
+    @property
+    def index_file(self):
+        root, _ = os.path.splitext(self.data_file)
+        return root + '.idx'
+
+    def resource_path(self, relative_path):
+        try:
+            base_path = sys._MEIPASS
+        except AttributeError:
+            base_path = os.path.abspath(os.path.dirname(__file__))
+            base_path = os.path.abspath(os.path.join(base_path, '..', '..'))
+
+        return os.path.join(base_path, relative_path)
+
+
+
+    def __len__(self):
+        with self._lock:
+            self._ensure_loaded()
+            return self._record_count
+
+
+
+    def append(self, record):
+        data = RECORD_FORMAT.pack(record['start'], record['end'], record['focus_time'],
+                                  record['pauses'], PERIODS.index(record['period']),
+                                  STATUSES.index(record['status']))
+        try:
+            with self._lock:
+                self._ensure_loaded()
+                # Пишем по смещению последней целой записи: оборванный хвост перезаписывается
+                with open(self.data_file, 'r+b' if os.path.exists(self.data_file) else 'wb') as f:
+                    f.seek(self._record_count * RECORD_FORMAT.size)
+                    f.write(data)
+                    f.truncate()
+
+                index_position = self._index_record(self._record_count, record)
+                self._record_count += 1
+                self._write_index_entry(index_position)
+            return True
+        except Exception as e:
+            print(f"Error saving session record: {e}")
+            return False
+
+
+
+    def query(self, start, end):
+        # Только записи из часовых корзин диапазона [start, end), без полного прохода
+        with self._lock:
+            self._ensure_loaded()
+            low = bisect_left(self._buckets, int(start // BUCKET_SECONDS))
+            high = bisect_left(self._buckets, -(-end // BUCKET_SECONDS))
+            if low >= high:
+                return []
+            first = self._entries[low][0]
+            last = self._entries[high - 1][0] + self._entries[high - 1][1]
+            records = self._read_records(first, last)
+
+        return [record for record in records if start <= record['start'] < end]
+
+
+
+    def hour_heatmap(self, start=None, end=None, value='pomodoros'):
+        # Матрица 7x24 (день недели x час по местному времени) только по индексу
+        fields = {'pomodoros': 2, 'completed': 3, 'reset': 4, 'pauses': 5, 'focus_time': 6}
+        if value not in fields:
+            raise ValueError(f"Unknown heatmap value: {value}")
+        field = fields[value]
+
+        heatmap = [[0] * 24 for _ in range(7)]
+        for bucket, entry in self._bucket_range(start, end):
+            if entry[field]:
+                moment = datetime.fromtimestamp(bucket * BUCKET_SECONDS)
+                heatmap[moment.weekday()][moment.hour] += entry[field]
+        return heatmap
+
+
+
+    def summary(self, start=None, end=None):
+        result = {'pomodoros': 0, 'completed': 0, 'reset': 0, 'pauses': 0, 'focus_time': 0}
+        for _, entry in self._bucket_range(start, end):
+            result['pomodoros'] += entry[2]
+            result['completed'] += entry[3]
+            result['reset'] += entry[4]
+            result['pauses'] += entry[5]
+            result['focus_time'] += entry[6]
+        return result
+
+
+
+    def _bucket_range(self, start, end):
+        # Сводки считаются с точностью до часа: корзина с границей диапазона входит целиком
+        with self._lock:
+            self._ensure_loaded()
+            low = 0 if start is None else bisect_left(self._buckets, int(start // BUCKET_SECONDS))
+            high = len(self._buckets) if end is None else \
+                bisect_left(self._buckets, -(-end // BUCKET_SECONDS))
+            return list(zip(self._buckets[low:high], self._entries[low:high]))
+
+
+
+    def _ensure_loaded(self):
+        if self._loaded:
+            return
+
+        record_count = 0
+        if os.path.exists(self.data_file):
+            record_count = os.path.getsize(self.data_file) // RECORD_FORMAT.size
+
+        self._buckets, self._entries = self._read_index()
+        if sum(entry[1] for entry in self._entries) != record_count:
+            # Индекс отстал от данных (сбой между двумя записями) - пересобираем
+            self._rebuild_index(record_count)
+        self._record_count = record_count
+        self._loaded = True
+
+
+
+    def _read_index(self):
+        buckets, entries = [], []
+        try:
+            with open(self.index_file, 'rb') as f:
+                data = f.read()
+        except FileNotFoundError:
+            return buckets, entries
+        except Exception as e:
+            print(f"Error loading session index: {e}")
+            return buckets, entries
+
+        usable = len(data) - len(data) % INDEX_FORMAT.size
+        for bucket, *entry in INDEX_FORMAT.iter_unpack(data[:usable]):
+            buckets.append(bucket)
+            entries.append(entry)
+        return buckets, entries
+
+
+
+    def _rebuild_index(self, record_count):
+        self._buckets, self._entries = [], []
+        for number, record in enumerate(self._read_records(0, record_count)):
+            self._index_record(number, record)
+
+        data = b''.join(INDEX_FORMAT.pack(bucket, *entry)
+                        for bucket, entry in zip(self._buckets, self._entries))
+        try:
+            with open(self.index_file, 'wb') as f:
+                f.write(data)
+        except Exception as e:
+            print(f"Error saving session index: {e}")
+
+
+
+    def _index_record(self, number, record):
+        bucket = int(record['start'] // BUCKET_SECONDS)
+        if not self._buckets or bucket > self._buckets[-1]:
+            self._buckets.append(bucket)
+            self._entries.append([number, 0, 0, 0, 0, 0, 0])
+        # Если часы перевели назад, запись попадает в последнюю корзину:
+        # корзины должны идти по возрастанию и покрывать записи подряд
+        entry = self._entries[-1]
+        entry[1] += 1
+        if record['period'] == 'pomodoro':
+            # Прерванная закрытием часть продолжается после запуска и заканчивается
+            # отдельной записью, поэтому как помидор не считается; время работы учитывается
+            entry[2] += record['status'] != 'interrupted'
+            entry[3] += record['status'] == 'completed'
+            entry[4] += record['status'] == 'reset'
+            entry[5] += record['pauses']
+            entry[6] += record['focus_time']
+        return len(self._entries) - 1
+
+
+
+    def _write_index_entry(self, position):
+        # Меняется только последняя корзина: переписываем её или дописываем новую
+        with open(self.index_file, 'r+b' if os.path.exists(self.index_file) else 'wb') as f:
+            f.seek(position * INDEX_FORMAT.size)
+            f.write(INDEX_FORMAT.pack(self._buckets[position], *self._entries[position]))
+            f.truncate()
+
+
+
+    def _read_records(self, first, last):
+        if last <= first:
+            return []
+        with open(self.data_file, 'rb') as f:
+            f.seek(first * RECORD_FORMAT.size)
+            data = f.read((last - first) * RECORD_FORMAT.size)
+
+        return [{
+            'start': start,
+            'end': end,
+            'focus_time': focus_time,
+            'pauses': pauses,
+            'period': PERIODS[period],
+            'status': STATUSES[status]
+        } for start, end, focus_time, pauses, period, status in RECORD_FORMAT.iter_unpack(data)]
@@ -0,0 +1,191 @@
+import heapq
+import itertools
+import threading
+import time
+
+from src.core.timer_state import advance_cycle, period_name
+
+
+class TimerSession:
+    __slots__ = ('session_id', 'pomodoro_time', 'short_break_time', 'long_break_time',
+                 'is_pomodoro_mode', 'cycle_count', 'deadline', 'remaining', 'version',
+                 'auto_start')
+
+    def __init__(self, session_id, pomodoro_time=25 * 60, short_break_time=5 * 60,
+                 long_break_time=15 * 60, auto_start=True):
+        self.session_id = session_id
+        self.pomodoro_time = pomodoro_time
+        self.short_break_time = short_break_time
+        self.long_break_time = long_break_time
+        self.is_pomodoro_mode = True
+        self.cycle_count = 0
+        self.deadline = None
+        self.remaining = float(pomodoro_time)
+        self.version = 0
+        self.auto_start = auto_start
+
+    @property
+    def is_running(self):
+        return self.deadline is not None
+
+    def get_initial_time(self):
+        return getattr(self, f'{period_name(self.is_pomodoro_mode, self.cycle_count)}_time')
+
+
+
+class SessionScheduler:
+    def __init__(self, clock=time.monotonic, on_period_finished=None):
+        self.clock = clock
+        self.on_period_finished = on_period_finished
+        self.sessions = {}
+        self.wakeups = 0
+        self._heap = []
+        self._stale = 0
+        self._counter = itertools.count()
+        self._condition = threading.Condition()
+        self._running = False
+
+
+
+    def add_session(self, session_id, start=True, **durations):
+        with self._condition:
+            if session_id in self.sessions:
+                raise ValueError(f"Session already exists: {session_id}")
+            session = TimerSession(session_id, **durations)
+            self.sessions[session_id] = session
+            if start:
+                self._start(session, self.clock())
+            return session
+
+
+
+    def remove_session(self, session_id):
+        with self._condition:
+            session = self.sessions.pop(session_id)
+            if session.is_running:
+                self._invalidate(session)
+
+
+
+    def start(self, session_id):
+        with self._condition:
+            session = self.sessions[session_id]
+            if not session.is_running:
+                self._start(session, self.clock())
+
+
+
+    def pause(self, session_id):
+        with self._condition:
+            session = self.sessions[session_id]
+            if session.is_running:
+                session.remaining = max(0.0, session.deadline - self.clock())
+                self._invalidate(session)
+
+
+
+    def remaining(self, session_id):
+        with self._condition:
+            session = self.sessions[session_id]
+            if session.is_running:
+                return max(0.0, session.deadline - self.clock())
+            return session.remaining
+
+
+
+    def next_deadline(self):
+        with self._condition:
+            self._drop_stale_head()
+            return self._heap[0][0] if self._heap else None
+
+
+
+    def run_due(self):
+        # Будим только сессии, чей дедлайн наступил - остальные не трогаем
+        finished = []
+        with self._condition:
+            now = self.clock()
+            self._drop_stale_head()
+            while self._heap and self._heap[0][0] <= now:
+                deadline, _, session, version = heapq.heappop(self._heap)
+                if version != session.version:
+                    self._stale -= 1
+                    continue
+
+                completed = period_name(session.is_pomodoro_mode, session.cycle_count)
+                next_period, session.is_pomodoro_mode, session.cycle_count = advance_cycle(
+                    session.is_pomodoro_mode, session.cycle_count)
+                session.remaining = float(session.get_initial_time())
+                session.deadline = None
+                session.version += 1
+
+                if session.auto_start:
+                    # Отсчёт от старого дедлайна, а не от now - без накопления дрейфа
+                    self._push(session, deadline + session.remaining)
+                finished.append((session, completed, next_period))
+                self._drop_stale_head()
+
+        if self.on_period_finished is not None:
+            for session, completed, next_period in finished:
+                self.on_period_finished(session, completed, next_period)
+        return len(finished)
+
+
+
+    def run_forever(self):
+        with self._condition:
+            self._running = True
+
+        while True:
+            with self._condition:
+                if not self._running:
+                    return
+                self._drop_stale_head()
+                timeout = None
+                if self._heap:
+                    timeout = max(0.0, self._heap[0][0] - self.clock())
+                if timeout is None or timeout > 0:
+                    self._condition.wait(timeout)
+                if not self._running:
+                    return
+            self.wakeups += 1
+            self.run_due()
+
+
+
+    def stop(self):
+        with self._condition:
+            self._running = False
+            self._condition.notify_all()
+
+
+
+    def _start(self, session, now):
+        self._push(session, now + session.remaining)
+
+
+
+    def _push(self, session, deadline):
+        session.deadline = deadline
+        heapq.heappush(self._heap, (deadline, next(self._counter), session, session.version))
+        if self._heap[0][2] is session:
+            # Новый ближайший дедлайн - поток планировщика должен проснуться раньше
+            self._condition.notify()
+
+
+
+    def _invalidate(self, session):
+        session.deadline = None
+        session.version += 1
+        self._stale += 1
+        if self._stale > len(self._heap) // 2:
+            self._heap = [entry for entry in self._heap if entry[3] == entry[2].version]
+            heapq.heapify(self._heap)
+            self._stale = 0
+
+
+
+    def _drop_stale_head(self):
+        while self._heap and self._heap[0][3] != self._heap[0][2].version:
+            heapq.heappop(self._heap)
+            self._stale -= 1
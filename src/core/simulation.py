@@ -0,0 +1,154 @@
+import time
+from collections import Counter
+from datetime import datetime
+
+from src.core.clock import VirtualClock
+from src.core.stats_manager import apply_day, empty_totals
+from src.core.timer_state import POMODOROS_PER_CYCLE, TimerState
+from src.utils.sound_manager import SoundManager
+
+
+class CountingSoundManager(SoundManager):
+    # Та же логика выбора звука, но без микшера: считаем, что было бы сыграно
+    def __init__(self):
+        super().__init__()
+        self.played = Counter()
+
+
+
+    def _init_mixer(self):
+        # Микшер не открываем: менеджер сразу готов, а звуки только считаются
+        self._ready.set()
+
+
+
+    def play_sound(self, key):
+        self.played[key] += 1
+
+
+
+class CycleSimulation:
+    def __init__(self, clock=None, pomodoro_time=25 * 60, short_break_time=5 * 60,
+                 long_break_time=15 * 60, auto_start_delay=2.0, notification_type='both'):
+        self.clock = clock or VirtualClock()
+        self.auto_start_delay = auto_start_delay
+        self.timer_state = TimerState(clock=self.clock)
+        self.timer_state.pomodoro_time = self.timer_state.current_time = pomodoro_time
+        self.timer_state.short_break_time = short_break_time
+        self.timer_state.long_break_time = long_break_time
+        self.timer_state.notification_type = notification_type
+        self.sound_manager = CountingSoundManager()
+
+        # Статистика копится в памяти тем же кодом, что и в StatsManager
+        self.stats = {}
+        self.totals = empty_totals()
+        self.completed = Counter()
+        self.transitions = 0
+        self.violations = []
+        self._pomodoros_in_cycle = 0
+        self._expected_elapsed = 0.0
+        self._started_at = self.clock.monotonic()
+
+
+
+    def run(self, transitions):
+        state = self.timer_state
+        clock = self.clock
+        started = time.perf_counter()
+
+        for _ in range(transitions):
+            state.start_countdown()
+            duration = state.get_remaining()
+            clock.advance_to(state.deadline)
+
+            completed_mode = state.get_current_period()
+            if state.sync_remaining() != 0:
+                self._violation(f"period {completed_mode} not finished at its deadline")
+            state.stop_countdown()
+            next_period = state.next_period()
+
+            self._record(completed_mode, next_period, duration)
+            self.sound_manager.handle_timer_finished(state, completed_mode)
+            if self.auto_start_delay:
+                clock.advance(self.auto_start_delay)
+                self._expected_elapsed += self.auto_start_delay
+
+        elapsed = time.perf_counter() - started
+        return self.report(transitions / elapsed if elapsed > 0 else 0.0)
+
+
+
+    def report(self, transitions_per_second=0.0):
+        self._check_totals()
+        return {
+            'transitions': self.transitions,
+            'transitions_per_second': transitions_per_second,
+            'completed': dict(self.completed),
+            'sounds': dict(self.sound_manager.played),
+            'totals': dict(self.totals),
+            'virtual_seconds': self.clock.monotonic() - self._started_at,
+            'violations': list(self.violations)
+        }
+
+
+
+    def _record(self, completed_mode, next_period, duration):
+        self.transitions += 1
+        self.completed[completed_mode] += 1
+        self._expected_elapsed += duration
+
+        if completed_mode == 'pomodoro':
+            self._pomodoros_in_cycle += 1
+            expected = 'long_break' if self._pomodoros_in_cycle == POMODOROS_PER_CYCLE else 'short_break'
+            if next_period != expected:
+                self._violation(f"pomodoro #{self._pomodoros_in_cycle} followed by {next_period}")
+            if next_period == 'long_break':
+                self._pomodoros_in_cycle = 0
+
+            date_str = datetime.fromtimestamp(self.clock.wall()).strftime('%Y-%m-%d')
+            apply_day(self.stats, self.totals, date_str, 1, self.timer_state.pomodoro_time)
+        elif next_period != 'pomodoro':
+            self._violation(f"{completed_mode} followed by {next_period}")
+
+        if not 0 <= self.timer_state.cycle_count < POMODOROS_PER_CYCLE:
+            self._violation(f"cycle count out of range: {self.timer_state.cycle_count}")
+
+
+
+    def _check_totals(self):
+        totals = self.totals
+        pomodoros = self.completed['pomodoro']
+        if totals['pomodoros'] != pomodoros:
+            self._violation(f"totals count {totals['pomodoros']} pomodoros, completed {pomodoros}")
+        if totals['work_time'] != pomodoros * self.timer_state.pomodoro_time:
+            self._violation(f"work time {totals['work_time']} does not match {pomodoros} pomodoros")
+        if sum(day['pomodoros'] for day in self.stats.values()) != totals['pomodoros']:
+            self._violation("per-day pomodoros do not add up to totals")
+        if totals['active_days'] != sum(1 for day in self.stats.values() if day['pomodoros'] > 0):
+            self._violation("active days do not match per-day stats")
+
+        # Длинный перерыв после четвёртого помидора, который ещё идёт, не закончен
+        pending_long_break = 1 if self.timer_state.get_current_period() == 'long_break' else 0
+        if self.completed['long_break'] != pomodoros // POMODOROS_PER_CYCLE - pending_long_break:
+            self._violation(f"{self.completed['long_break']} long breaks for {pomodoros} pomodoros")
+
+        if self.timer_state.notification_type in ('sound', 'both'):
+            state = self.timer_state
+            expected_sounds = Counter()
+            for mode, key in (('pomodoro', state.pomodoro_sound),
+                              ('short_break', state.short_break_sound),
+                              ('long_break', state.long_break_sound)):
+                expected_sounds[key] += self.completed[mode]
+            if +expected_sounds != +self.sound_manager.played:
+                self._violation("sound dispatches do not match completed periods")
+
+        # Дедлайны отсчитываются от виртуальных часов без накопления дрейфа
+        drift = abs(self.clock.monotonic() - self._started_at - self._expected_elapsed)
+        if drift > 1e-6 * max(1.0, self._expected_elapsed):
+            self._violation(f"virtual time drifted by {drift:.6f} s")
+
+
+
+    def _violation(self, message):
+        if len(self.violations) < 100:
+            self.violations.append(message)
@@ -0,0 +1,285 @@
+import os
+import sqlite3
+from datetime import datetime, timedelta
+
+from src.core.stats_manager import StatsManager
+
+
+# PRAGMA user_version: база уже получила историю из JSON
+MIGRATED_VERSION = 1
+
+class SqliteStatsManager(StatsManager):
+    def __init__(self):
+        super().__init__()
+        self.db_file = self.resource_path('aPomodoro_stats.db')
+        self._connection = None
+
+
+
+    def _connect(self):
+        if self._connection is not None:
+            return self._connection
+
+        connection = sqlite3.connect(self.db_file, check_same_thread=False)
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.execute('PRAGMA synchronous=NORMAL')
+        with connection:
+            # PRIMARY KEY у WITHOUT ROWID таблицы - это и есть индекс по дате
+            connection.execute('''
+                CREATE TABLE IF NOT EXISTS days (
+                    date TEXT PRIMARY KEY,
+                    pomodoros INTEGER NOT NULL DEFAULT 0,
+                    work_time INTEGER NOT NULL DEFAULT 0
+                ) WITHOUT ROWID
+            ''')
+            connection.execute('''
+                CREATE TABLE IF NOT EXISTS totals (
+                    id INTEGER PRIMARY KEY CHECK (id = 1),
+                    pomodoros INTEGER NOT NULL DEFAULT 0,
+                    work_time INTEGER NOT NULL DEFAULT 0,
+                    active_days INTEGER NOT NULL DEFAULT 0,
+                    first_date TEXT,
+                    last_date TEXT
+                )
+            ''')
+            connection.execute('INSERT OR IGNORE INTO totals (id) VALUES (1)')
+
+        self._connection = connection
+        # Отметка о переносе ставится в одной транзакции с перенесёнными днями:
+        # упавший или прерванный перенос повторится при следующем запуске
+        if connection.execute('PRAGMA user_version').fetchone()[0] < MIGRATED_VERSION:
+            self.migrate_from_json()
+        return connection
+
+
+
+    def close(self):
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+
+    def migrate_from_json(self, json_file=None):
+        source = StatsManager()
+        source.stats_file = json_file or self.stats_file
+        try:
+            if not os.path.exists(source.stats_file) and not os.path.exists(source.journal_file):
+                self._merge_rows({}, migrated=True)
+                return 0
+
+            stats = source.get_all_stats()
+            self._merge_rows(stats, migrated=True)
+            return len(stats)
+        except Exception as e:
+            print(f"Error migrating stats: {e}")
+            return 0
+
+
+
+    def merge_days(self, days):
+        try:
+            self._merge_rows(days)
+            return True
+        except Exception as e:
+            print(f"Error importing stats: {e}")
+            return False
+
+
+
+    def _merge_rows(self, days, migrated=False):
+        rows = [(date_str, day['pomodoros'], day['work_time'])
+                for date_str, day in days.items()]
+        with self._lock:
+            connection = self._connect()
+            with connection:
+                connection.executemany('''
+                    INSERT INTO days (date, pomodoros, work_time) VALUES (?, ?, ?)
+                    ON CONFLICT(date) DO UPDATE SET
+                        pomodoros = pomodoros + excluded.pomodoros,
+                        work_time = work_time + excluded.work_time
+                ''', rows)
+                self._rebuild_totals(connection)
+                if migrated:
+                    connection.execute(f'PRAGMA user_version = {MIGRATED_VERSION}')
+
+
+
+    def iter_days(self):
+        # Строки читаются пачками по мере выгрузки, а не всей таблицей сразу
+        with self._lock:
+            cursor = self._connect().execute('SELECT date, pomodoros, work_time FROM days ORDER BY date')
+        while True:
+            with self._lock:
+                rows = cursor.fetchmany(1000)
+            if not rows:
+                return
+            for date_str, pomodoros, work_time in rows:
+                yield date_str, {'pomodoros': pomodoros, 'work_time': work_time}
+
+
+
+    def save_completed_pomodoro(self, pomodoro_duration):
+        if isinstance(pomodoro_duration, bool) or not isinstance(pomodoro_duration, (int, float)):
+            raise TypeError(f"Invalid pomodoro duration: {pomodoro_duration!r}")
+
+        today_str = datetime.now().strftime('%Y-%m-%d')
+        work_time = int(pomodoro_duration)
+
+        try:
+            with self._lock:
+                connection = self._connect()
+                with connection:
+                    row = connection.execute('SELECT pomodoros FROM days WHERE date = ?',
+                                             (today_str,)).fetchone()
+                    new_day = 1 if row is None or row[0] <= 0 else 0
+
+                    connection.execute('''
+                        INSERT INTO days (date, pomodoros, work_time) VALUES (?, 1, ?)
+                        ON CONFLICT(date) DO UPDATE SET
+                            pomodoros = pomodoros + 1,
+                            work_time = work_time + excluded.work_time
+                    ''', (today_str, work_time))
+                    connection.execute('''
+                        UPDATE totals SET
+                            pomodoros = pomodoros + 1,
+                            work_time = work_time + ?,
+                            active_days = active_days + ?,
+                            first_date = CASE WHEN first_date IS NULL OR first_date > ?
+                                              THEN ? ELSE first_date END,
+                            last_date = CASE WHEN last_date IS NULL OR last_date < ?
+                                             THEN ? ELSE last_date END
+                        WHERE id = 1
+                    ''', (work_time, new_day, today_str, today_str, today_str, today_str))
+        except Exception as e:
+            print(f"Error saving stats: {e}")
+
+
+
+    def _rebuild_totals(self, connection):
+        connection.execute('''
+            UPDATE totals SET
+                pomodoros = (SELECT COALESCE(SUM(pomodoros), 0) FROM days),
+                work_time = (SELECT COALESCE(SUM(work_time), 0) FROM days),
+                active_days = (SELECT COUNT(*) FROM days WHERE pomodoros > 0),
+                first_date = (SELECT MIN(date) FROM days WHERE pomodoros > 0),
+                last_date = (SELECT MAX(date) FROM days WHERE pomodoros > 0)
+            WHERE id = 1
+        ''')
+
+
+
+    def _load_stats(self):
+        try:
+            with self._lock:
+                rows = self._connect().execute(
+                    'SELECT date, pomodoros, work_time FROM days ORDER BY date').fetchall()
+        except Exception as e:
+            print(f"Error loading stats: {e}")
+            return {}
+
+        return {date_str: {'pomodoros': pomodoros, 'work_time': work_time}
+                for date_str, pomodoros, work_time in rows}
+
+
+
+    def reset_stats(self):
+        try:
+            with self._lock:
+                connection = self._connect()
+                with connection:
+                    connection.execute('DELETE FROM days')
+                    self._rebuild_totals(connection)
+            return True
+        except Exception as e:
+            print(f"Error resetting stats: {e}")
+            return False
+
+
+
+    def compact_stats(self):
+        try:
+            with self._lock:
+                self._connect().execute('PRAGMA wal_checkpoint(TRUNCATE)')
+            return True
+        except Exception as e:
+            print(f"Error compacting stats: {e}")
+            return False
+
+
+
+    def archive_stats(self, today=None):
+        # База и так читает только нужные дни по индексу - архивировать нечего
+        return True
+
+
+
+    def get_general_stats(self):
+        try:
+            with self._lock:
+                row = self._connect().execute('''
+                    SELECT pomodoros, work_time, active_days, first_date, last_date
+                    FROM totals WHERE id = 1
+                ''').fetchone()
+        except Exception as e:
+            print(f"Error calculating general stats: {e}")
+            row = (0, 0, 0, None, None)
+
+        total_pomodoros, total_time, total_days, first_date, last_date = row
+        return {
+            'total_pomodoros': total_pomodoros,
+            'total_time': total_time,
+            'total_days': total_days,
+            'avg_per_day': total_pomodoros / total_days if total_days > 0 else 0,
+            'first_date': first_date,
+            'last_date': last_date
+        }
+
+
+
+    def get_days(self, offset, count):
+        today = datetime.now()
+        newest = today - timedelta(days=offset)
+        oldest = today - timedelta(days=offset + count - 1)
+
+        try:
+            with self._lock:
+                rows = self._connect().execute('''
+                    SELECT date, pomodoros, work_time FROM days
+                    WHERE date BETWEEN ? AND ?
+                ''', (oldest.strftime('%Y-%m-%d'), newest.strftime('%Y-%m-%d'))).fetchall()
+        except Exception as e:
+            print(f"Error loading daily stats: {e}")
+            rows = []
+
+        by_date = {date_str: (pomodoros, work_time) for date_str, pomodoros, work_time in rows}
+        result = []
+
+        for i in range(offset, offset + count):
+            day = today - timedelta(days=i)
+            pomodoros, work_time = by_date.get(day.strftime('%Y-%m-%d'), (0, 0))
+            result.append({
+                'date': day,
+                'pomodoros': pomodoros,
+                'work_time': work_time,
+                'is_today': (i == 0)
+            })
+
+        return result
+
+
+
+    def repair_stats_file(self):
+        try:
+            with self._lock:
+                connection = self._connect()
+                status = connection.execute('PRAGMA integrity_check').fetchone()[0]
+                if status != 'ok':
+                    print(f"Stats database integrity check failed: {status}")
+                with connection:
+                    self._rebuild_totals(connection)
+            return True
+        except Exception as e:
+            print(f"Error repairing stats: {e}")
+            return False
@@ -0,0 +1,195 @@
+import calendar
+import operator
+from array import array
+from datetime import date, timedelta
+from itertools import accumulate, repeat
+
+
+WEEKDAY_NAMES = list(calendar.day_name)
+
+
+class StatsAnalytics:
+    def __init__(self, stats, today=None, archive=None):
+        # Плотные массивы по порядковому номеру дня: индекс 0 - первый день истории.
+        # archive - сводка архивных лет до этой истории (combine_summaries),
+        # она учитывается только в summary()
+        self.today = today or date.today()
+        self.archive = archive
+        self.pomodoros = array('q')
+        self.work_time = array('q')
+        self.first_day = self.today
+        self._pomodoro_sums = array('q', [0])
+        self._work_time_sums = array('q', [0])
+
+        days = {}
+        for date_str, day in stats.items():
+            try:
+                days[date.fromisoformat(date_str).toordinal()] = day
+            except (TypeError, ValueError):
+                continue
+
+        if not days:
+            return
+
+        today = self.today.toordinal()
+        first = min(min(days), today)
+        last = max(max(days), today)
+        self.first_day = date.fromordinal(first)
+        self.pomodoros = array('q', bytes(8 * (last - first + 1)))
+        self.work_time = array('q', self.pomodoros)
+        for ordinal, day in days.items():
+            self.pomodoros[ordinal - first] = int(day.get('pomodoros', 0))
+            self.work_time[ordinal - first] = int(day.get('work_time', 0))
+
+        # Префиксные суммы: сумма за любой отрезок дней - одно вычитание
+        self._pomodoro_sums = array('q', accumulate(self.pomodoros, initial=0))
+        self._work_time_sums = array('q', accumulate(self.work_time, initial=0))
+
+
+
+    def __len__(self):
+        return len(self.pomodoros)
+
+
+
+    def weekly(self):
+        # Недели начинаются с понедельника
+        start = self.first_day.toordinal() - self.first_day.weekday()
+        return self._rollup(list(map(date.fromordinal,
+                                     range(start, self._last_day().toordinal() + 1, 7))))
+
+
+
+    def monthly(self):
+        boundaries = []
+        year, month = self.first_day.year, self.first_day.month
+        while date(year, month, 1) <= self._last_day():
+            boundaries.append(date(year, month, 1))
+            year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+        return self._rollup(boundaries)
+
+
+
+    def yearly(self):
+        return self._rollup([date(year, 1, 1) for year in
+                             range(self.first_day.year, self._last_day().year + 1)])
+
+
+
+    def streaks(self):
+        if not self.pomodoros:
+            return {'current': 0, 'longest': 0}
+
+        active = bytes(map(bool, self.pomodoros))
+        longest = max(map(len, active.split(b'\x00')))
+
+        # Сегодняшний день ещё не закончился: серия до вчера тоже считается текущей
+        today_index = self.today.toordinal() - self.first_day.toordinal()
+        tail = active[:today_index + 1]
+        if not tail.endswith(b'\x01'):
+            tail = tail[:-1]
+        current = len(tail) - len(tail.rstrip(b'\x01'))
+        return {'current': current, 'longest': longest}
+
+
+
+    def rolling_average(self, window, values=None):
+        # Скользящее среднее через префиксные суммы: дни до начала истории считаются нулевыми
+        if window <= 0:
+            raise ValueError(f"Invalid rolling window: {window}")
+
+        sums = self._pomodoro_sums if values is None else array('q', accumulate(values, initial=0))
+        prefix = array('q', bytes(8 * (window - 1)))
+        prefix.extend(sums)
+        return array('d', map(operator.truediv,
+                              map(operator.sub, prefix[window:], prefix[:len(sums) - 1]),
+                              repeat(window)))
+
+
+
+    def weekday_distribution(self):
+        result = []
+        first_weekday = self.first_day.weekday()
+        for weekday, name in enumerate(WEEKDAY_NAMES):
+            offset = (weekday - first_weekday) % 7
+            pomodoros = self.pomodoros[offset::7]
+            result.append({
+                'weekday': name,
+                'pomodoros': sum(pomodoros),
+                'work_time': sum(self.work_time[offset::7]),
+                'active_days': len(pomodoros) - pomodoros.count(0)
+            })
+        return result
+
+
+
+    def summary(self):
+        archive = self.archive
+        weekday_pomodoros = [day['pomodoros'] for day in self.weekday_distribution()] \
+            if self.pomodoros else [0] * 7
+        if archive is not None:
+            weekday_pomodoros = list(map(operator.add, weekday_pomodoros, archive['weekday_pomodoros']))
+        best = max(range(7), key=weekday_pomodoros.__getitem__)
+        best_weekday = WEEKDAY_NAMES[best] if weekday_pomodoros[best] > 0 else None
+
+        if not self.pomodoros:
+            return {
+                'current_streak': 0,
+                'longest_streak': archive['longest_streak'] if archive is not None else 0,
+                'avg_7_days': 0.0, 'avg_30_days': 0.0,
+                'this_week': 0, 'this_month': 0, 'this_year': 0,
+                'best_weekday': best_weekday
+            }
+
+        today_index = self.today.toordinal() - self.first_day.toordinal()
+        streaks = self.streaks()
+        current, longest = streaks['current'], streaks['longest']
+        if archive is not None:
+            longest = max(longest, archive['longest_streak'])
+            if archive['last_year'] is not None and self.first_day == date(archive['last_year'] + 1, 1, 1):
+                # История начинается сразу после архива: серии переходят через границу года
+                active = bytes(map(bool, self.pomodoros))
+                leading = len(active) - len(active.lstrip(b'\x01'))
+                longest = max(longest, archive['trailing_streak'] + leading)
+                end = today_index if active[today_index] else today_index - 1
+                if current and end - current + 1 == 0:
+                    current += archive['trailing_streak']
+                    longest = max(longest, current)
+
+        return {
+            'current_streak': current,
+            'longest_streak': longest,
+            'avg_7_days': self._sum_to_today(today_index, 6) / 7,
+            'avg_30_days': self._sum_to_today(today_index, 29) / 30,
+            'this_week': self._sum_to_today(today_index, self.today.weekday()),
+            'this_month': self._sum_to_today(today_index, self.today.day - 1),
+            'this_year': self._sum_to_today(today_index, self.today.timetuple().tm_yday - 1),
+            'best_weekday': best_weekday
+        }
+
+
+
+    def _last_day(self):
+        return self.first_day + timedelta(days=max(len(self.pomodoros) - 1, 0))
+
+
+
+    def _sum_to_today(self, today_index, days_before):
+        sums = self._pomodoro_sums
+        return sums[today_index + 1] - sums[max(0, today_index - days_before)]
+
+
+
+    def _rollup(self, boundaries):
+        if not self.pomodoros:
+            return []
+
+        first = self.first_day.toordinal()
+        starts = [max(0, boundary.toordinal() - first) for boundary in boundaries]
+        ends = starts[1:] + [len(self.pomodoros)]
+        pomodoros = map(operator.sub, map(self._pomodoro_sums.__getitem__, ends),
+                        map(self._pomodoro_sums.__getitem__, starts))
+        work_time = map(operator.sub, map(self._work_time_sums.__getitem__, ends),
+                        map(self._work_time_sums.__getitem__, starts))
+        return [{'start': boundary, 'pomodoros': count, 'work_time': seconds}
+                for boundary, count, seconds in zip(boundaries, pomodoros, work_time)]
@@ -0,0 +1,225 @@
+import json
+import os
+import re
+import zlib
+from collections import OrderedDict
+from datetime import date
+
+from src.utils.file_utils import atomic_write_bytes
+
+
+# Сегмент архива - один прошедший год: строка JSON-заголовка со сводкой
+# и сжатый zlib JSON всех дней. Файлы не меняются: при дополнении года
+# пишется новый сегмент со следующим номером
+ARCHIVE_FORMAT = 'aPomodoro-archive'
+ARCHIVE_VERSION = 1
+SEGMENT_PATTERN = re.compile(r'^(\d{4})-(\d+)\.seg$')
+MAX_HEADER_SIZE = 4096
+
+
+def segment_name(year, generation):
+    return f'{year:04d}-{generation}.seg'
+
+
+
+def segment_summary(year, days):
+    # Всё, что нужно для итогов за всё время без распаковки дней
+    active = sorted(date.fromisoformat(date_str) for date_str, day in days.items()
+                    if day['pomodoros'] > 0)
+    weekday_pomodoros = [0] * 7
+    for date_str, day in days.items():
+        weekday_pomodoros[date.fromisoformat(date_str).weekday()] += day['pomodoros']
+
+    longest = run = leading = 0
+    previous = None
+    for day in active:
+        run = run + 1 if previous is not None and (day - previous).days == 1 else 1
+        longest = max(longest, run)
+        if run == (day - date(year, 1, 1)).days + 1:
+            leading = run
+        previous = day
+    trailing = run if previous == date(year, 12, 31) else 0
+
+    return {
+        'pomodoros': sum(day['pomodoros'] for day in days.values()),
+        'work_time': sum(day['work_time'] for day in days.values()),
+        'active_days': len(active),
+        'first_date': active[0].isoformat() if active else None,
+        'last_date': active[-1].isoformat() if active else None,
+        'weekday_pomodoros': weekday_pomodoros,
+        'longest_streak': longest,
+        'leading_streak': leading,
+        'trailing_streak': trailing
+    }
+
+
+
+def combine_summaries(headers):
+    # Итоги нескольких лет; серии склеиваются через границы соседних лет
+    result = {
+        'pomodoros': 0, 'work_time': 0, 'active_days': 0,
+        'first_date': None, 'last_date': None,
+        'weekday_pomodoros': [0] * 7,
+        'longest_streak': 0, 'trailing_streak': 0, 'last_year': None
+    }
+    carry = 0
+    for header in sorted(headers, key=lambda header: header['year']):
+        summary = header['summary']
+        year = header['year']
+        for key in ('pomodoros', 'work_time', 'active_days'):
+            result[key] += summary[key]
+        if summary['first_date'] is not None:
+            if result['first_date'] is None or summary['first_date'] < result['first_date']:
+                result['first_date'] = summary['first_date']
+            if result['last_date'] is None or summary['last_date'] > result['last_date']:
+                result['last_date'] = summary['last_date']
+        result['weekday_pomodoros'] = [a + b for a, b in zip(result['weekday_pomodoros'],
+                                                             summary['weekday_pomodoros'])]
+
+        if result['last_year'] != year - 1:
+            carry = 0
+        days_in_year = (date(year + 1, 1, 1) - date(year, 1, 1)).days
+        result['longest_streak'] = max(result['longest_streak'], summary['longest_streak'],
+                                       carry + summary['leading_streak'])
+        carry = carry + days_in_year if summary['leading_streak'] == days_in_year \
+            else summary['trailing_streak']
+        result['last_year'] = year
+
+    result['trailing_streak'] = carry
+    return result
+
+
+
+class StatsArchive:
+    def __init__(self, directory, cache_size=2):
+        self.directory = directory
+        self.cache_size = cache_size
+        # Сегменты неизменны, поэтому кэшируем по имени файла без проверки подписи
+        self._headers = {}
+        self._days = OrderedDict()
+
+
+
+    def list_segments(self):
+        # Запасной путь, если список сегментов в заголовке снимка потерян:
+        # берём последний номер для каждого года
+        segments = {}
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return segments
+
+        for name in names:
+            match = SEGMENT_PATTERN.match(name)
+            if match is None:
+                continue
+            year, generation = match.group(1), int(match.group(2))
+            current = segments.get(year)
+            if current is None or generation > int(SEGMENT_PATTERN.match(current).group(2)):
+                segments[year] = name
+        return segments
+
+
+
+    def read_header(self, name):
+        header = self._headers.get(name)
+        if header is not None:
+            return header
+
+        try:
+            with open(os.path.join(self.directory, name), 'rb') as f:
+                line = f.readline(MAX_HEADER_SIZE)
+            header = json.loads(line)
+            if header.get('format') != ARCHIVE_FORMAT or header.get('version') != ARCHIVE_VERSION:
+                raise ValueError('unknown segment format')
+        except Exception as e:
+            print(f"Error loading stats archive {name}: {e}")
+            return None
+
+        self._headers[name] = header
+        return header
+
+
+
+    def load_days(self, name):
+        try:
+            return self.read_days(name)
+        except Exception as e:
+            print(f"Error loading stats archive {name}: {e}")
+            return {}
+
+
+
+    def read_days(self, name):
+        # В отличие от load_days не прячет ошибку: при дополнении года
+        # нечитаемый сегмент нельзя молча заменить пустым
+        days = self._days.get(name)
+        if days is not None:
+            self._days.move_to_end(name)
+            return days
+
+        with open(os.path.join(self.directory, name), 'rb') as f:
+            header = json.loads(f.readline(MAX_HEADER_SIZE))
+            body = f.read()
+        if len(body) != header['size'] or zlib.crc32(body) != header['crc']:
+            raise ValueError('segment body is corrupted')
+        days = json.loads(zlib.decompress(body))
+
+        self._days[name] = days
+        while len(self._days) > self.cache_size:
+            self._days.popitem(last=False)
+        return days
+
+
+
+    def write_segment(self, year, days, previous=None):
+        # Дни года сливаются с прежним сегментом, если он был; возвращает имя нового файла
+        merged = {}
+        generation = 1
+        if previous is not None:
+            merged = {date_str: dict(day) for date_str, day in self.read_days(previous).items()}
+            generation = int(SEGMENT_PATTERN.match(previous).group(2)) + 1
+        for date_str, day in days.items():
+            target = merged.setdefault(date_str, {'pomodoros': 0, 'work_time': 0})
+            target['pomodoros'] += day['pomodoros']
+            target['work_time'] += day['work_time']
+
+        body = zlib.compress(json.dumps(merged, sort_keys=True, separators=(',', ':')).encode('utf-8'), 9)
+        header = {
+            'format': ARCHIVE_FORMAT,
+            'version': ARCHIVE_VERSION,
+            'year': int(year),
+            'days': len(merged),
+            'size': len(body),
+            'crc': zlib.crc32(body),
+            'summary': segment_summary(int(year), merged)
+        }
+
+        name = segment_name(int(year), generation)
+        os.makedirs(self.directory, exist_ok=True)
+        atomic_write_bytes(os.path.join(self.directory, name),
+                           json.dumps(header, separators=(',', ':')).encode('utf-8') + b'\n' + body)
+        self._headers[name] = header
+        return name
+
+
+
+    def remove(self, names):
+        for name in names:
+            self._headers.pop(name, None)
+            self._days.pop(name, None)
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                print(f"Error removing stats archive {name}: {e}")
+
+
+
+    def clear(self):
+        self._headers.clear()
+        self._days.clear()
+        names = [name for name in os.listdir(self.directory) if SEGMENT_PATTERN.match(name)] \
+            if os.path.isdir(self.directory) else []
+        self.remove(names)
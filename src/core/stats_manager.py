@@ -1,12 +1,89 @@
 import json
 import os
+import shutil
 import sys
-from datetime import datetime, timedelta
+import threading
+from datetime import date, datetime, timedelta
+
+from src.core.stats_analytics import StatsAnalytics
+from src.core.stats_archive import StatsArchive, combine_summaries
+from src.core.stats_recovery import clean_day, describe_salvage, empty_report, salvage_stats
+from src.utils.file_lock import FileLock
+from src.utils.file_utils import atomic_write_json
+
+
+def empty_totals():
+    return {
+        'pomodoros': 0,
+        'work_time': 0,
+        'active_days': 0,
+        'first_date': None,
+        'last_date': None
+    }
+
+
+
+def apply_day(stats, totals, date_str, pomodoros, work_time):
+    # Добавляет помидоры к дню и на ходу обновляет итоги, не пересчитывая всю историю
+    day = stats.setdefault(date_str, {'pomodoros': 0, 'work_time': 0})
+    was_active = day['pomodoros'] > 0
+    day['pomodoros'] += pomodoros
+    day['work_time'] += work_time
+
+    totals['pomodoros'] += pomodoros
+    totals['work_time'] += work_time
+    if day['pomodoros'] > 0 and not was_active:
+        totals['active_days'] += 1
+        if totals['first_date'] is None or date_str < totals['first_date']:
+            totals['first_date'] = date_str
+        if totals['last_date'] is None or date_str > totals['last_date']:
+            totals['last_date'] = date_str
 
 
 class StatsManager:
-    def __init__(self):
+    def __init__(self, use_journal=True):
         self.stats_file = self.resource_path('aPomodoro_stats.json')
+        self.use_journal = use_journal
+        self.compact_threshold = 64 * 1024
+        self.lock_timeout = 10.0
+        self.save_lock_timeout = 1.0
+        self._journal_seq = None
+        self._snapshot_seq = 0
+        self._journal_offset = 0
+        self._cache = None
+        self._cache_key = None
+        self._totals = empty_totals()
+        self._lock = threading.RLock()
+        self._file_lock = None
+        self._archive = None
+        self._segments = {}
+        self.recovery_report = None
+
+    @property
+    def journal_file(self):
+        root, _ = os.path.splitext(self.stats_file)
+        return root + '_journal.jsonl'
+
+    @property
+    def lock_file(self):
+        root, _ = os.path.splitext(self.stats_file)
+        return root + '.lock'
+
+    @property
+    def backup_file(self):
+        root, _ = os.path.splitext(self.stats_file)
+        return root + '_damaged.json'
+
+    @property
+    def archive_dir(self):
+        root, _ = os.path.splitext(self.stats_file)
+        return root + '_archive'
+
+    @property
+    def archive(self):
+        if self._archive is None or self._archive.directory != self.archive_dir:
+            self._archive = StatsArchive(self.archive_dir)
+        return self._archive
 
     def resource_path(self, relative_path):
         try:
@@ -19,134 +96,573 @@ class StatsManager:
 
 
     def save_completed_pomodoro(self, pomodoro_duration):
+        if isinstance(pomodoro_duration, bool) or not isinstance(pomodoro_duration, (int, float)):
+            raise TypeError(f"Invalid pomodoro duration: {pomodoro_duration!r}")
+
+        with self._lock:
+            file_lock = self._locked()
+            try:
+                # Ждём недолго: занятую другим процессом статистику повторит фоновая
+                # запись (TimeoutError уходит вызывающему), а менеджер не простаивает
+                file_lock.acquire(self.save_lock_timeout)
+            except TimeoutError:
+                raise
+            except OSError as e:
+                print(f"Error saving stats: {e}")
+                return
+
+            try:
+                if not self.use_journal:
+                    return self._rewrite_completed_pomodoro(pomodoro_duration)
+                return self._append_completed_pomodoro(pomodoro_duration)
+            except OSError as e:
+                print(f"Error saving stats: {e}")
+            finally:
+                file_lock.release()
+
+
+
+    def _locked(self):
+        # Все записи идут под блокировкой файла: перечитываем свежие данные
+        # других процессов, применяем своё изменение и только потом пишем
+        if self._file_lock is None or self._file_lock.path != self.lock_file:
+            self._file_lock = FileLock(self.lock_file, timeout=self.lock_timeout)
+        return self._file_lock
+
+
+
+    def _append_completed_pomodoro(self, pomodoro_duration):
         stats = self._load_stats()
-        today_str = datetime.now().strftime('%Y-%m-%d')
+        record = {
+            'seq': self._journal_seq + 1,
+            'date': datetime.now().strftime('%Y-%m-%d'),
+            'pomodoros': 1,
+            'work_time': int(pomodoro_duration)
+        }
+        line = (json.dumps(record) + '\n').encode('utf-8')
+
+        try:
+            with open(self.journal_file, 'a+b') as f:
+                journal_size = f.seek(0, os.SEEK_END)
+                if journal_size > 0:
+                    f.seek(journal_size - 1)
+                    if f.read(1) != b'\n':
+                        # Хвост оборванной записи не должен склеиться с новой
+                        line = b'\n' + line
+                f.write(line)
+            self._journal_seq = record['seq']
+        except Exception as e:
+            print(f"Error saving stats: {e}")
+            return
 
-        if today_str not in stats:
-            stats[today_str] = {'pomodoros': 0, 'work_time': 0}
+        if journal_size == self._journal_offset:
+            apply_day(stats, self._totals, record['date'],
+                            record['pomodoros'], record['work_time'])
+            self._journal_offset = journal_size + len(line)
+            self._cache_key = (self.stats_file,
+                               self._cache_key[1],
+                               self._file_signature(self.journal_file))
+        # Иначе в журнале есть непрочитанный хвост - его подхватит _load_stats
 
-        if not isinstance(stats[today_str], dict):
-            stats[today_str] = {'pomodoros': 0, 'work_time': 0}
+        if journal_size + len(line) >= self.compact_threshold:
+            self.compact_stats()
 
-        if 'pomodoros' not in stats[today_str]:
-            stats[today_str]['pomodoros'] = 0
-        if 'work_time' not in stats[today_str]:
-            stats[today_str]['work_time'] = 0
 
-        stats[today_str]['pomodoros'] += 1
-        stats[today_str]['work_time'] += pomodoro_duration
+
+    def _rewrite_completed_pomodoro(self, pomodoro_duration):
+        stats = {date_str: dict(day) for date_str, day in self._load_stats().items()}
+        totals = dict(self._totals)
+        today_str = datetime.now().strftime('%Y-%m-%d')
+        apply_day(stats, totals, today_str, 1, int(pomodoro_duration))
 
         try:
-            with open(self.stats_file, 'w', encoding='utf-8') as f:
-                json.dump(stats, f, ensure_ascii=False, indent=2)
+            self._write_snapshot(stats, totals)
+            self._remove_journal()
+            self._remember(stats, totals)
         except Exception as e:
             print(f"Error saving stats: {e}")
 
 
 
+    @classmethod
+    def _compute_totals(cls, stats):
+        totals = empty_totals()
+        active_dates = [date_str for date_str, day in stats.items() if day['pomodoros'] > 0]
+
+        totals['pomodoros'] = sum(day['pomodoros'] for day in stats.values())
+        totals['work_time'] = sum(day['work_time'] for day in stats.values())
+        totals['active_days'] = len(active_dates)
+        if active_dates:
+            totals['first_date'] = min(active_dates)
+            totals['last_date'] = max(active_dates)
+        return totals
+
+
+
+    @classmethod
+    def _parse_totals(cls, meta):
+        header = meta.get('totals')
+        if not isinstance(header, dict):
+            return None
+
+        try:
+            totals = empty_totals()
+            for key in ('pomodoros', 'work_time', 'active_days'):
+                totals[key] = int(header[key])
+            for key in ('first_date', 'last_date'):
+                value = header.get(key)
+                totals[key] = str(value) if value is not None else None
+            return totals
+        except (ValueError, TypeError, KeyError):
+            return None
+
+
+
+    def compact_stats(self, today=None):
+        with self._lock:
+            try:
+                with self._locked():
+                    stats = self._load_stats()
+                    stats, totals, segments, replaced = self._archive_past_years(
+                        stats, self._totals, self._segments, today or date.today())
+                    self._write_snapshot(stats, totals, segments)
+                    self._remove_journal()
+                    self._remember(stats, totals, segments)
+                    # Старые сегменты удаляем только после того, как снимок сослался на новые
+                    self.archive.remove(replaced)
+                return True
+            except Exception as e:
+                print(f"Error compacting stats: {e}")
+                return False
+
+
+
+    def archive_stats(self, today=None):
+        # В горячем файле остаётся только текущий год, прошедшие уходят в архив
+        year = str((today or date.today()).year)
+        with self._lock:
+            if not any(date_str < year for date_str in self._load_stats()):
+                return True
+        return self.compact_stats(today)
+
+
+
+    def _archive_past_years(self, stats, totals, segments, today):
+        past_years = {}
+        hot = {}
+        for date_str, day in stats.items():
+            try:
+                year = date.fromisoformat(date_str).year
+            except ValueError:
+                year = today.year
+            if year < today.year:
+                past_years.setdefault(str(year), {})[date_str] = day
+            else:
+                hot[date_str] = day
+
+        if not past_years:
+            return stats, totals, segments, []
+
+        segments = dict(segments)
+        replaced = []
+        written = []
+        try:
+            for year, days in sorted(past_years.items()):
+                previous = segments.get(year)
+                segments[year] = self.archive.write_segment(int(year), days, previous)
+                written.append(segments[year])
+                if previous is not None:
+                    replaced.append(previous)
+        except Exception:
+            # Снимок не меняется, поэтому уже записанные в этом проходе сегменты не нужны,
+            # а прежние остаются на месте
+            self.archive.remove(written)
+            raise
+
+        return hot, self._compute_totals(hot), segments, replaced
+
+
+
+    def _write_snapshot(self, stats, totals, segments=None):
+        # Журнал сворачивается в снимок: записи с seq <= journal_seq уже учтены.
+        # Список сегментов архива хранится здесь же: новый снимок атомарно фиксирует архивацию
+        data = {'_meta': {'journal_seq': self._journal_seq or 0, 'totals': totals,
+                          'archive': self._segments if segments is None else segments}}
+        data.update(stats)
+        atomic_write_json(self.stats_file, data)
+
+
+
+    def _remove_journal(self):
+        if os.path.exists(self.journal_file):
+            os.remove(self.journal_file)
+
+
+
+    def _remember(self, stats, totals, segments=None):
+        self._cache = stats
+        self._totals = totals
+        if segments is not None:
+            self._segments = segments
+        self._snapshot_seq = self._journal_seq or 0
+        self._journal_offset = 0
+        self._cache_key = (self.stats_file,
+                           self._file_signature(self.stats_file),
+                           self._file_signature(self.journal_file))
+
+
+
+    @staticmethod
+    def _file_signature(path):
+        try:
+            st = os.stat(path)
+        except OSError:
+            return None
+        # Номер inode меняется при подмене файла другим процессом через os.replace
+        return (st.st_ino, st.st_mtime_ns, st.st_size)
+
+
+
     def _load_stats(self):
-        if os.path.exists(self.stats_file):
+        # Возвращает общий кэш: вызывающий код не должен его изменять
+        snapshot_sig = self._file_signature(self.stats_file)
+        journal_sig = self._file_signature(self.journal_file)
+        cache_key = (self.stats_file, snapshot_sig, journal_sig)
+
+        if self._cache is not None and self._cache_key is not None:
+            if self._cache_key == cache_key:
+                return self._cache
+
+            previous_journal = self._cache_key[2]
+            if (self._cache_key[:2] == cache_key[:2] and journal_sig is not None
+                    and journal_sig[2] >= self._journal_offset
+                    and (previous_journal is None or previous_journal[0] == journal_sig[0])):
+                # Снимок не менялся, журнал дописан - читаем только новый хвост
+                self._journal_seq, self._journal_offset = self._replay_journal(
+                    self._cache, self._totals, self._snapshot_seq,
+                    self._journal_offset, self._journal_seq)
+                self._cache_key = cache_key
+                return self._cache
+
+        cleaned_data = {}
+        totals = None
+        segments = None
+        snapshot_seq = 0
+        self.recovery_report = None
+
+        # Пустой файл - просто нет данных, спасать в нём нечего
+        if snapshot_sig is not None and snapshot_sig[2] > 0:
             try:
                 with open(self.stats_file, 'r', encoding='utf-8') as f:
                     data = json.load(f)
 
-                cleaned_data = {}
+                meta = data.get('_meta')
+                if isinstance(meta, dict):
+                    try:
+                        snapshot_seq = int(meta.get('journal_seq', 0))
+                    except (ValueError, TypeError):
+                        snapshot_seq = 0
+                    totals = self._parse_totals(meta)
+                    if isinstance(meta.get('archive'), dict):
+                        segments = {str(year): str(name) for year, name in meta['archive'].items()}
+
                 for date_str, day_data in data.items():
-                    if isinstance(day_data, dict):
-                        cleaned_day = {
-                            'pomodoros': day_data.get('pomodoros', 0),
-                            'work_time': day_data.get('work_time', 0)
-                        }
-                        try:
-                            cleaned_day['pomodoros'] = int(cleaned_day['pomodoros'])
-                            cleaned_day['work_time'] = int(cleaned_day['work_time'])
-                            cleaned_data[date_str] = cleaned_day
-                        except (ValueError, TypeError):
-                            continue
-
-                return cleaned_data
+                    if date_str.startswith('_'):
+                        continue
+                    cleaned_day = clean_day(day_data)
+                    if cleaned_day is not None:
+                        cleaned_data[date_str] = cleaned_day
+                if segments is None:
+                    # Снимок без списка сегментов ещё не ссылался на архив:
+                    # файлы в папке - остатки незавершённой архивации
+                    segments = {}
+                self.recovery_report = None
 
             except Exception as e:
                 print(f"Error loading stats: {e}")
-                return {}
+                # Вместо пустой статистики спасаем все уцелевшие дни
+                cleaned_data, snapshot_seq, self.recovery_report = self._salvage_snapshot()
+                totals = None
 
-        return {}
+        if totals is None:
+            # Старый формат без заголовка - считаем итоги один раз
+            totals = self._compute_totals(cleaned_data)
+        if segments is None:
+            # Снимка нет или он повреждён: берём последние сегменты из папки архива
+            segments = self.archive.list_segments()
 
+        self._journal_seq, self._journal_offset = self._replay_journal(
+            cleaned_data, totals, snapshot_seq, 0, snapshot_seq)
+        self._snapshot_seq = snapshot_seq
+        self._cache = cleaned_data
+        self._totals = totals
+        self._segments = segments
+        self._cache_key = cache_key
+        return cleaned_data
 
 
-    def reset_stats(self):
+
+    def _salvage_snapshot(self):
         try:
-            with open(self.stats_file, 'w', encoding='utf-8') as f:
-                json.dump({}, f)
-            return True
+            stats, snapshot_seq, report = salvage_stats(self.stats_file)
+            print(describe_salvage(report))
+            return stats, snapshot_seq, report
         except Exception as e:
-            print(f"Error resetting stats: {e}")
-            return False
+            print(f"Error salvaging stats: {e}")
+            report = empty_report()
+            report['errors'].append(f"salvage failed: {e}")
+            return {}, 0, report
 
 
 
-    def get_general_stats(self):
-        stats = self._load_stats()
+    def _replay_journal(self, stats, totals, snapshot_seq, offset, last_seq):
+        if not os.path.exists(self.journal_file):
+            return last_seq, offset
 
         try:
-            total_pomodoros = sum(day.get('pomodoros', 0) for day in stats.values())
-            total_time = sum(day.get('work_time', 0) for day in stats.values())
-            total_days = len([day for day in stats.values() if day.get('pomodoros', 0) > 0])
-            avg_per_day = total_pomodoros / total_days if total_days > 0 else 0
+            with open(self.journal_file, 'rb') as f:
+                f.seek(offset)
+                for line in f:
+                    if not line.endswith(b'\n'):
+                        # Запись ещё дописывается - дочитаем в следующий раз
+                        break
+                    offset += len(line)
+
+                    try:
+                        record = json.loads(line)
+                        seq = int(record['seq'])
+                        date_str = str(record['date'])
+                        pomodoros = int(record.get('pomodoros', 0))
+                        work_time = int(record.get('work_time', 0))
+                    except (ValueError, TypeError, KeyError, AttributeError):
+                        # Оборванная запись после сбоя - пропускаем
+                        continue
+
+                    last_seq = max(last_seq, seq)
+                    if seq <= snapshot_seq:
+                        continue
+
+                    apply_day(stats, totals, date_str, pomodoros, work_time)
 
-            return {
-                'total_pomodoros': total_pomodoros,
-                'total_time': total_time,
-                'total_days': total_days,
-                'avg_per_day': avg_per_day
-            }
         except Exception as e:
-            print(f"Error calculating general stats: {e}")
+            print(f"Error loading stats journal: {e}")
+
+        return last_seq, offset
+
+
+
+    def reset_stats(self):
+        with self._lock:
+            try:
+                with self._locked():
+                    self._load_stats()
+                    totals = empty_totals()
+                    self._write_snapshot({}, totals, {})
+                    self._remove_journal()
+                    self._remember({}, totals, {})
+                    self.archive.clear()
+                return True
+            except Exception as e:
+                print(f"Error resetting stats: {e}")
+                return False
+
+
+
+    def get_general_stats(self):
+        with self._lock:
+            self._load_stats()
+            totals = self._all_time_totals()
+            total_days = totals['active_days']
+
             return {
-                'total_pomodoros': 0,
-                'total_time': 0,
-                'total_days': 0,
-                'avg_per_day': 0
+                'total_pomodoros': totals['pomodoros'],
+                'total_time': totals['work_time'],
+                'total_days': total_days,
+                'avg_per_day': totals['pomodoros'] / total_days if total_days > 0 else 0,
+                'first_date': totals['first_date'],
+                'last_date': totals['last_date']
             }
 
 
 
-    def get_daily_stats(self, days=7):
-        stats = self._load_stats()
-        today = datetime.now()
-        result = []
+    def _all_time_totals(self):
+        # Итоги горячего файла плюс заголовки сегментов: архив не распаковывается
+        headers = self._archive_headers()
+        if not headers:
+            return self._totals
+
+        archived = combine_summaries(headers)
+        totals = dict(self._totals)
+        for key in ('pomodoros', 'work_time', 'active_days'):
+            totals[key] += archived[key]
+        for key, pick in (('first_date', min), ('last_date', max)):
+            values = [value for value in (totals[key], archived[key]) if value is not None]
+            totals[key] = pick(values) if values else None
+        return totals
+
+
+
+    def _archive_headers(self, years=None):
+        headers = []
+        for year, name in self._segments.items():
+            if years is None or year in years:
+                header = self.archive.read_header(name)
+                if header is not None:
+                    headers.append(header)
+        return headers
+
+
+
+    def _archived_day(self, date_str):
+        name = self._segments.get(date_str[:4])
+        if name is None:
+            return None
+        return self.archive.load_days(name).get(date_str)
 
-        for i in range(days):
-            day = today - timedelta(days=i)
-            day_str = day.strftime('%Y-%m-%d')
-            data = stats.get(day_str, {'pomodoros': 0, 'work_time': 0})
-            pomodoros = data.get('pomodoros', 0) if isinstance(data, dict) else 0
-            work_time = data.get('work_time', 0) if isinstance(data, dict) else 0
 
+
+    def get_all_stats(self):
+        # Полная история с распаковкой всего архива - для миграции и экспорта
+        with self._lock:
+            stats = self._load_stats()
+            result = {}
+            for year, name in sorted(self._segments.items()):
+                result.update((date_str, dict(day)) for date_str, day in self.archive.load_days(name).items())
+            for date_str, day in stats.items():
+                target = result.setdefault(date_str, {'pomodoros': 0, 'work_time': 0})
+                target['pomodoros'] += day['pomodoros']
+                target['work_time'] += day['work_time']
+            return result
+
+
+
+    def iter_days(self):
+        # Дни по возрастанию даты; в памяти одновременно не больше одного архивного года
+        with self._lock:
+            stats = self._load_stats()
+            segments = dict(self._segments)
+            hot_years = {}
+            for date_str, day in stats.items():
+                hot_years.setdefault(date_str[:4], {})[date_str] = dict(day)
+
+        for year in sorted(set(segments) | set(hot_years)):
+            days = hot_years.pop(year, {})
+            if year in segments:
+                for date_str, day in self.archive.load_days(segments[year]).items():
+                    current = days.setdefault(date_str, {'pomodoros': 0, 'work_time': 0})
+                    current['pomodoros'] += day['pomodoros']
+                    current['work_time'] += day['work_time']
+            for date_str in sorted(days):
+                yield date_str, days[date_str]
+
+
+
+    def merge_days(self, days):
+        # Пакетное добавление дней (импорт): одна запись снимка на весь пакет,
+        # прошедшие годы сразу уходят в архив
+        with self._lock:
             try:
-                pomodoros = int(pomodoros)
-                work_time = int(work_time)
-            except (ValueError, TypeError):
-                pomodoros = 0
-                work_time = 0
+                with self._locked():
+                    stats = {date_str: dict(day) for date_str, day in self._load_stats().items()}
+                    totals = dict(self._totals)
+                    for date_str, day in days.items():
+                        apply_day(stats, totals, date_str, day['pomodoros'], day['work_time'])
+                    stats, totals, segments, replaced = self._archive_past_years(
+                        stats, totals, self._segments, date.today())
+                    self._write_snapshot(stats, totals, segments)
+                    self._remove_journal()
+                    self._remember(stats, totals, segments)
+                    self.archive.remove(replaced)
+                return True
+            except Exception as e:
+                print(f"Error importing stats: {e}")
+                return False
+
 
-            result.append({
-                'date': day,
-                'pomodoros': pomodoros,
-                'work_time': work_time,
-                'is_today': (i == 0)
-            })
 
-        return result[::-1]
+    def get_daily_stats(self, days=7):
+        return self.get_days(0, days)[::-1]
 
 
 
-    def repair_stats_file(self):
+    def get_days(self, offset, count):
+        # Дни от сегодняшнего назад: offset=0 - сегодня, offset=1 - вчера и т.д.
+        with self._lock:
+            stats = self._load_stats()
+            today = datetime.now()
+            result = []
+
+            for i in range(offset, offset + count):
+                day = today - timedelta(days=i)
+                date_str = day.strftime('%Y-%m-%d')
+                pomodoros = work_time = 0
+                # Архивный год распаковывается, только когда до него доходит прокрутка
+                for data in (stats.get(date_str), self._archived_day(date_str)):
+                    if data:
+                        pomodoros += data['pomodoros']
+                        work_time += data['work_time']
+                result.append({
+                    'date': day,
+                    'pomodoros': pomodoros,
+                    'work_time': work_time,
+                    'is_today': (i == 0)
+                })
+
+            return result
+
+
+
+    def get_history_length(self, minimum=7):
+        first_date = self.get_general_stats()['first_date']
+        if first_date is None:
+            return minimum
+
         try:
-            stats = self._load_stats()  # Уже очищает данные
-            with open(self.stats_file, 'w', encoding='utf-8') as f:
-                json.dump(stats, f, ensure_ascii=False, indent=2)
-            return True
-        except Exception as e:
-            print(f"Error repairing stats: {e}")
-            return False
\ No newline at end of file
+            first_day = datetime.strptime(first_date, '%Y-%m-%d').date()
+        except ValueError:
+            return minimum
+        return max(minimum, (datetime.now().date() - first_day).days + 1)
+
+
+
+    def get_analytics(self, today=None):
+        # Текущий год и распакованный прошлый (для серий и средних через Новый год),
+        # более ранние годы учитываются по заголовкам сегментов
+        today = today or date.today()
+        with self._lock:
+            stats = self._load_stats()
+            previous_year = str(today.year - 1)
+            if previous_year in self._segments:
+                stats = dict(stats)
+                for date_str, day in self.archive.load_days(self._segments[previous_year]).items():
+                    current = stats.get(date_str)
+                    stats[date_str] = day if current is None else {
+                        'pomodoros': current['pomodoros'] + day['pomodoros'],
+                        'work_time': current['work_time'] + day['work_time']
+                    }
+
+            older = [year for year in self._segments if year < previous_year]
+            headers = self._archive_headers(older)
+            return StatsAnalytics(stats, today, combine_summaries(headers) if headers else None)
+
+
+
+    def repair_stats_file(self):
+        with self._lock:
+            try:
+                with self._locked():
+                    stats = self._load_stats()  # Уже очищает данные и применяет журнал
+                    if self.recovery_report is not None and os.path.exists(self.stats_file):
+                        # Повреждённый оригинал сохраняем рядом, прежде чем заменить его
+                        shutil.copyfile(self.stats_file, self.backup_file)
+                    totals = self._compute_totals(stats)
+                    if totals != self._totals:
+                        print("Stats totals header was out of date and has been rebuilt")
+                    self._write_snapshot(stats, totals)
+                    self._remove_journal()
+                    self._remember(stats, totals)
+                    self.recovery_report = None
+                return True
+            except Exception as e:
+                print(f"Error repairing stats: {e}")
+                return False
\ No newline at end of file
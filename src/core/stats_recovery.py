@@ -0,0 +1,125 @@
+import codecs
+import json
+import re
+
+
+# Ключ дня или заголовка, за которым начинается объект: "2025-01-01": {
+RECORD_PATTERN = re.compile(r'"(_meta|\d{4}-\d{2}-\d{2})"\s*:\s*(?=\{)')
+CHUNK_SIZE = 64 * 1024
+# Запись дня занимает десятки байт; объект длиннее считаем испорченным
+MAX_RECORD_SIZE = 4096
+# Хвост буфера, в котором может начинаться ещё не дочитанный ключ
+KEY_OVERLAP = 64
+MAX_REPORTED_ERRORS = 20
+
+
+def clean_day(day_data):
+    # Те же правила, что и при обычной загрузке: оба поля должны приводиться к int
+    if not isinstance(day_data, dict):
+        return None
+    try:
+        return {
+            'pomodoros': int(day_data.get('pomodoros', 0)),
+            'work_time': int(day_data.get('work_time', 0))
+        }
+    except (ValueError, TypeError):
+        return None
+
+
+
+def empty_report():
+    return {'days': 0, 'dropped': 0, 'duplicates': 0, 'meta': False, 'errors': []}
+
+
+
+def scan_records(f, chunk_size=CHUNK_SIZE, max_record_size=MAX_RECORD_SIZE):
+    # Читает бинарный файл кусками и отдаёт (смещение, ключ, значение, ошибка).
+    # В памяти держится не больше одного куска и одной недочитанной записи
+    decoder = codecs.getincrementaldecoder('utf-8')(errors='replace')
+    json_decoder = json.JSONDecoder()
+    buffer = ''
+    base = 0
+    pos = 0
+    eof = False
+
+    while True:
+        pending = None
+        match = RECORD_PATTERN.search(buffer, pos)
+        if match is not None:
+            try:
+                value, end = json_decoder.raw_decode(buffer, match.end())
+            except json.JSONDecodeError as e:
+                if not eof and len(buffer) - match.start() < max_record_size:
+                    # Возможно, объект просто не поместился в буфер - дочитываем
+                    pending = match.start()
+                else:
+                    yield base + match.start(), match.group(1), None, e.msg
+                    pos = match.end()
+                    continue
+            else:
+                yield base + match.start(), match.group(1), value, None
+                pos = end
+                continue
+
+        if eof:
+            return
+
+        keep = pending if pending is not None else max(pos, len(buffer) - KEY_OVERLAP)
+        buffer = buffer[keep:]
+        base += keep
+        pos = max(0, pos - keep)
+
+        chunk = f.read(chunk_size)
+        if chunk:
+            buffer += decoder.decode(chunk)
+        else:
+            buffer += decoder.decode(b'', final=True)
+            eof = True
+
+
+
+def salvage_stats(path, chunk_size=CHUNK_SIZE, max_record_size=MAX_RECORD_SIZE):
+    # Возвращает (дни, journal_seq из заголовка, отчёт о восстановлении)
+    stats = {}
+    journal_seq = 0
+    report = empty_report()
+
+    with open(path, 'rb') as f:
+        for offset, key, value, error in scan_records(f, chunk_size, max_record_size):
+            if error is None:
+                if key == '_meta':
+                    try:
+                        journal_seq = int(value.get('journal_seq', 0))
+                        report['meta'] = True
+                    except (ValueError, TypeError):
+                        error = 'invalid journal_seq'
+                else:
+                    day = clean_day(value)
+                    if day is None:
+                        error = 'invalid day record'
+                    else:
+                        if key in stats:
+                            report['duplicates'] += 1
+                        stats[key] = day
+
+            if error is not None:
+                report['dropped'] += 1
+                if len(report['errors']) < MAX_REPORTED_ERRORS:
+                    report['errors'].append(f"offset {offset}: {key}: {error}")
+
+    report['days'] = len(stats)
+    return stats, journal_seq, report
+
+
+
+def describe_salvage(report):
+    lines = [f"Recovered {report['days']} days from the damaged stats file, "
+             f"dropped {report['dropped']} records"]
+    if report['duplicates']:
+        lines.append(f"{report['duplicates']} duplicate days kept their last value")
+    if not report['meta']:
+        lines.append("Stats header was lost, journal entries are replayed in full")
+    lines.extend(report['errors'])
+    if report['dropped'] > len(report['errors']):
+        lines.append(f"... and {report['dropped'] - len(report['errors'])} more")
+    return '\n'.join(lines)
@@ -0,0 +1,199 @@
+import csv
+import io
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from datetime import date
+
+
+FORMATS = {'.csv': 'csv', '.jsonl': 'jsonl', '.ndjson': 'jsonl'}
+EXPORT_FIELDS = ('date', 'pomodoros', 'work_time')
+# Кусок файла, который разбирает один процесс; граница сдвигается до конца строки
+IMPORT_CHUNK_SIZE = 4 * 1024 * 1024
+MAX_REPORTED_ERRORS = 20
+
+
+def detect_format(path, fmt=None):
+    fmt = fmt or FORMATS.get(os.path.splitext(path)[1].lower())
+    if fmt not in ('csv', 'jsonl'):
+        raise ValueError(f"Unknown stats file format: {path}")
+    return fmt
+
+
+
+def export_lines(days, fmt):
+    # days - итератор пар (дата, день) по возрастанию дат; строки отдаются по одной
+    if fmt == 'csv':
+        buffer = io.StringIO()
+        writer = csv.writer(buffer, lineterminator='\n')
+
+        def csv_line(values):
+            writer.writerow(values)
+            line = buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+            return line
+
+        yield csv_line(EXPORT_FIELDS)
+        for date_str, day in days:
+            yield csv_line((date_str, day['pomodoros'], day['work_time']))
+    else:
+        for date_str, day in days:
+            yield json.dumps({'date': date_str, 'pomodoros': day['pomodoros'],
+                              'work_time': day['work_time']}) + '\n'
+
+
+
+def export_stats(stats_manager, path, fmt=None):
+    # Память не зависит от длины истории: архив читается по одному году
+    fmt = detect_format(path, fmt)
+    count = 0
+    with open(path, 'w', encoding='utf-8', newline='') as f:
+        for line in export_lines(stats_manager.iter_days(), fmt):
+            f.write(line)
+            count += 1
+    # Число выгруженных дней, без строки заголовка CSV
+    return count - 1 if fmt == 'csv' else count
+
+
+
+def parse_record(fields, dates=None):
+    # Дата обязательна; строка без pomodoros считается одним помидором.
+    # dates - кэш уже проверенных дат: в больших файлах они повторяются
+    value = fields.get('date')
+    if not value:
+        raise ValueError('missing date')
+    value = str(value).strip()[:10]
+    date_str = dates.get(value) if dates is not None else None
+    if date_str is None:
+        date_str = date.fromisoformat(value).isoformat()
+        if dates is not None:
+            dates[value] = date_str
+
+    pomodoros = fields.get('pomodoros')
+    pomodoros = 1 if pomodoros in (None, '') else int(pomodoros)
+    work_time = fields.get('work_time')
+    work_time = 0 if work_time in (None, '') else int(float(work_time))
+    if pomodoros < 0 or work_time < 0:
+        raise ValueError('negative value')
+    return date_str, pomodoros, work_time
+
+
+
+def parse_range(path, fmt, start, end, columns=None):
+    # Выполняется в процессе пула: читает свой кусок файла и сразу сводит его по дням,
+    # так что обратно передаётся не больше записи на день
+    days = {}
+    dates = {}
+    records = 0
+    errors = []
+    error_count = 0
+
+    with open(path, 'rb') as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    offset = start
+    for raw_line in data.split(b'\n'):
+        line_offset = offset
+        offset += len(raw_line) + 1
+        line = raw_line.decode('utf-8', errors='replace').strip()
+        if not line:
+            continue
+
+        try:
+            if fmt == 'csv':
+                # Без кавычек строку CSV можно просто разрезать по запятым
+                values = line.split(',') if '"' not in line else next(csv.reader([line]))
+                if len(values) != len(columns):
+                    raise ValueError(f"expected {len(columns)} columns, got {len(values)}")
+                fields = dict(zip(columns, values))
+            else:
+                fields = json.loads(line)
+                if not isinstance(fields, dict):
+                    raise ValueError('record is not an object')
+            date_str, pomodoros, work_time = parse_record(fields, dates)
+        except (ValueError, TypeError, OverflowError) as e:
+            error_count += 1
+            if len(errors) < MAX_REPORTED_ERRORS:
+                errors.append(f"offset {line_offset}: {e}")
+            continue
+
+        day = days.get(date_str)
+        if day is None:
+            days[date_str] = day = [0, 0]
+        day[0] += pomodoros
+        day[1] += work_time
+        records += 1
+
+    return days, records, errors, error_count
+
+
+
+def split_ranges(path, chunk_size=IMPORT_CHUNK_SIZE, start=0):
+    size = os.path.getsize(path)
+    ranges = []
+    with open(path, 'rb') as f:
+        while start < size:
+            end = min(start + chunk_size, size)
+            if end < size:
+                f.seek(end)
+                f.readline()
+                end = f.tell()
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+
+def read_csv_header(path):
+    with open(path, 'rb') as f:
+        first_line = f.readline()
+    columns = [column.strip().lower() for column in
+               next(csv.reader([first_line.decode('utf-8-sig', errors='replace')]), [])]
+    if 'date' not in columns:
+        raise ValueError("CSV file must have a 'date' column")
+    return columns, len(first_line)
+
+
+
+def import_stats(stats_manager, path, fmt=None, workers=None, chunk_size=IMPORT_CHUNK_SIZE):
+    # Разбор идёт кусками в пуле процессов, а в хранилище - одна пакетная запись
+    fmt = detect_format(path, fmt)
+    columns, start = read_csv_header(path) if fmt == 'csv' else (None, 0)
+    ranges = split_ranges(path, chunk_size, start)
+
+    if workers == 1 or len(ranges) <= 1:
+        results = [parse_range(path, fmt, range_start, range_end, columns)
+                   for range_start, range_end in ranges]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(parse_range, path, fmt, range_start, range_end, columns)
+                       for range_start, range_end in ranges]
+            results = [future.result() for future in futures]
+
+    days = {}
+    report = {'records': 0, 'days': 0, 'error_count': 0, 'errors': [], 'saved': False}
+    for chunk_days, records, errors, error_count in results:
+        for date_str, (pomodoros, work_time) in chunk_days.items():
+            day = days.setdefault(date_str, {'pomodoros': 0, 'work_time': 0})
+            day['pomodoros'] += pomodoros
+            day['work_time'] += work_time
+        report['records'] += records
+        report['error_count'] += error_count
+        report['errors'].extend(errors[:MAX_REPORTED_ERRORS - len(report['errors'])])
+
+    report['days'] = len(days)
+    report['saved'] = stats_manager.merge_days(days) if days else True
+    return report
+
+
+
+def describe_import(report):
+    lines = [f"Imported {report['records']} records into {report['days']} days"]
+    if not report['saved']:
+        lines.append("Stats could not be saved, nothing was imported")
+    if report['error_count']:
+        lines.append(f"Skipped {report['error_count']} invalid records")
+        lines.extend(report['errors'])
+    return '\n'.join(lines)
@@ -0,0 +1,148 @@
+from src.core.timer_state import TICK_ALIGN_SLACK
+
+
+# Без тиков движок всё равно просыпается раз в минуту, чтобы заметить сон системы
+IDLE_WAKEUP_INTERVAL = 60.0
+
+EVENTS = (
+    'period_started',
+    'period_resumed',
+    'period_paused',
+    'tick',
+    'period_finished',
+    'cycle_completed',
+    'timer_reset',
+)
+
+
+class TimerEngine:
+    def __init__(self, timer_state, scheduler, auto_start_delay=2.0):
+        self.timer_state = timer_state
+        self.scheduler = scheduler
+        self.auto_start_delay = auto_start_delay
+        self.ticks_enabled = True
+        self._subscribers = {event: [] for event in EVENTS}
+        self._tick_job = None
+        self._auto_start_job = None
+        self._period_active = False
+
+
+
+    def subscribe(self, event, callback):
+        if event not in self._subscribers:
+            raise ValueError(f"Unknown timer event: {event}")
+        self._subscribers[event].append(callback)
+        return callback
+
+
+
+    def unsubscribe(self, event, callback):
+        if callback in self._subscribers.get(event, []):
+            self._subscribers[event].remove(callback)
+
+
+
+    def emit(self, event, *args):
+        # Ошибка одного подписчика не должна лишать событий остальных и ломать цикл тиков
+        for callback in list(self._subscribers[event]):
+            try:
+                callback(*args)
+            except Exception as e:
+                print(f"Error in {event} handler: {e}")
+
+
+
+    def start(self):
+        if self.timer_state.is_running:
+            return
+
+        self._cancel_jobs()
+        self.timer_state.start_countdown()
+        if self._period_active:
+            self.emit('period_resumed', self.timer_state.get_current_period())
+        else:
+            self._period_active = True
+            self.emit('period_started', self.timer_state.get_current_period())
+        self._tick()
+
+
+
+    def pause(self):
+        was_running = self.timer_state.is_running
+        self._cancel_jobs()
+        self.timer_state.stop_countdown()
+        if was_running:
+            self.emit('period_paused', self.timer_state.get_current_period())
+
+
+
+    def reset(self):
+        self._cancel_jobs()
+        self.timer_state.reset_to_pomodoro()
+        self._period_active = False
+        self.emit('timer_reset')
+
+
+
+    def set_ticks_enabled(self, enabled):
+        # Когда тики не нужны (окно скрыто), просыпаемся только к концу периода
+        if enabled == self.ticks_enabled:
+            return
+        self.ticks_enabled = enabled
+        if self._tick_job is not None:
+            self.scheduler.cancel(self._tick_job)
+            self._tick()
+
+
+
+    def shutdown(self):
+        self._cancel_jobs()
+
+
+
+    def _cancel_jobs(self):
+        for job in (self._tick_job, self._auto_start_job):
+            if job is not None:
+                self.scheduler.cancel(job)
+        self._tick_job = None
+        self._auto_start_job = None
+
+
+
+    def _tick(self):
+        self._tick_job = None
+        if not self.timer_state.is_running:
+            return
+
+        remaining = self.timer_state.sync_remaining()
+        if self.ticks_enabled:
+            self.emit('tick', remaining)
+        if remaining > 0:
+            if self.ticks_enabled:
+                delay = self.timer_state.next_tick_delay()
+            else:
+                delay = min(remaining, IDLE_WAKEUP_INTERVAL) + TICK_ALIGN_SLACK
+            self._tick_job = self.scheduler.call_later(delay, self._tick)
+        else:
+            self._finish()
+
+
+
+    def _finish(self):
+        completed_mode = self.timer_state.get_current_period()
+        self.timer_state.stop_countdown()
+        self._period_active = False
+
+        next_period = self.timer_state.next_period()
+        self.emit('period_finished', completed_mode, next_period)
+        if completed_mode == 'pomodoro' and next_period == 'long_break':
+            self.emit('cycle_completed')
+
+        if self.auto_start_delay is not None:
+            self._auto_start_job = self.scheduler.call_later(self.auto_start_delay, self._auto_start)
+
+
+
+    def _auto_start(self):
+        self._auto_start_job = None
+        self.start()
@@ -1,5 +1,36 @@
+import math
+
+from src.core.clock import MonotonicClock
+
+
+# Запасной признак сна для часов, которые его не считают: настенные часы
+# ушли вперёд сильнее монотонных
+SUSPEND_THRESHOLD = 2.0
+TICK_ALIGN_SLACK = 0.005
+POMODOROS_PER_CYCLE = 4
+
+
+def advance_cycle(is_pomodoro_mode, cycle_count):
+    if is_pomodoro_mode:
+        cycle_count += 1
+        if cycle_count >= POMODOROS_PER_CYCLE:
+            return 'long_break', False, 0
+        return 'short_break', False, cycle_count
+
+    return 'pomodoro', True, cycle_count
+
+
+
+def period_name(is_pomodoro_mode, cycle_count):
+    # После длинного перерыва цикл сброшен в 0, поэтому перерыв с нулём - длинный
+    if is_pomodoro_mode:
+        return 'pomodoro'
+    return 'long_break' if cycle_count == 0 else 'short_break'
+
+
 class TimerState:
-    def __init__(self):
+    def __init__(self, clock=None):
+        clock = clock or MonotonicClock()
         self.pomodoro_time = 25 * 60
         self.short_break_time = 5 * 60
         self.long_break_time = 15 * 60
@@ -11,59 +42,124 @@ class TimerState:
         self.pomodoro_sound = 'soft_bell'
         self.short_break_sound = 'notification'
         self.long_break_sound = 'soft_bell'
+        self.clock = clock.monotonic
+        self.wall_clock = clock.wall
+        self.clock_counts_suspend = getattr(clock, 'counts_suspend', False)
+        self.deadline = None
+        self._remaining = None
+        self._anchor = None
+
+
+
+    def start_countdown(self):
+        remaining = self.current_time
+        if self._remaining is not None and math.ceil(self._remaining) == self.current_time:
+            # Продолжаем после паузы с точностью до долей секунды
+            remaining = self._remaining
+
+        now = self.clock()
+        self.deadline = now + remaining
+        self._anchor = (now, self.wall_clock())
+        self._remaining = None
+        self.is_running = True
+
+
+
+    def sync_remaining(self):
+        if self.deadline is None:
+            return self.current_time
+
+        now = self.clock()
+        if not self.clock_counts_suspend:
+            # Перевод настенных часов вперёд здесь неотличим от сна - это только запасной путь
+            wall_now = self.wall_clock()
+            slept = (wall_now - self._anchor[1]) - (now - self._anchor[0])
+            if slept > SUSPEND_THRESHOLD:
+                self.deadline -= slept
+            self._anchor = (now, wall_now)
+
+        remaining = max(0.0, self.deadline - now)
+        self.current_time = math.ceil(remaining)
+        return remaining
+
+
+
+    def stop_countdown(self):
+        if self.deadline is not None:
+            self._remaining = self.sync_remaining()
+        self.deadline = None
+        self._anchor = None
+        self.is_running = False
+
+
+
+    def next_tick_delay(self):
+        # Просыпаемся сразу после смены целой секунды, а не через 1000 мс
+        # от предыдущего тика - задержки колбэков не накапливаются
+        remaining = self.sync_remaining()
+        if remaining <= 0:
+            return 0.0
+        return (remaining % 1.0 or 1.0) + TICK_ALIGN_SLACK
+
+
+
+    def get_remaining(self):
+        # Остаток с точностью до долей секунды, без побочных эффектов
+        if self.deadline is not None:
+            return max(0.0, self.deadline - self.clock())
+        if self._remaining is not None and math.ceil(self._remaining) == self.current_time:
+            return self._remaining
+        return float(self.current_time)
+
+
+
+    def set_remaining(self, remaining):
+        # Остановленный таймер, который продолжит отсчёт с этого остатка
+        self.deadline = None
+        self._anchor = None
+        self.is_running = False
+        self._remaining = max(0.0, remaining)
+        self.current_time = math.ceil(self._remaining)
+
+
+
+    def get_progress(self):
+        initial_time = self.get_initial_time()
+        if initial_time <= 0:
+            return 0.0
+        return min(1.0, self.get_remaining() / initial_time)
 
 
 
     def reset_to_pomodoro(self):
+        self.stop_countdown()
         self.current_time = self.pomodoro_time
         self.is_pomodoro_mode = True
         self.cycle_count = 0
-        self.is_running = False
 
 
 
     def next_period(self):
-        if self.is_pomodoro_mode:
-            self.cycle_count += 1
+        self.deadline = None
+        self._remaining = None
+        self._anchor = None
 
-            if self.cycle_count >= 4:
-                self.cycle_count = 0
-                self.current_time = self.long_break_time
-                self.is_pomodoro_mode = False
-                return 'long_break'
+        period, self.is_pomodoro_mode, self.cycle_count = advance_cycle(
+            self.is_pomodoro_mode, self.cycle_count)
+        self.current_time = self.get_initial_time()
+        return period
 
-            else:
-                self.current_time = self.short_break_time
-                self.is_pomodoro_mode = False
-                return 'short_break'
 
-        else:
-            self.current_time = self.pomodoro_time
-            self.is_pomodoro_mode = True
-            return 'pomodoro'
 
+    def get_current_period(self):
+        return period_name(self.is_pomodoro_mode, self.cycle_count)
 
 
-    def get_current_period_name(self):
-        if self.is_pomodoro_mode:
-            return 'Pomodoro'
-
-        else:
-            if self.cycle_count == 0:
-                return 'Long break'
 
-            else:
-                return 'Short break'
+    def get_current_period_name(self):
+        return self.get_current_period().replace('_', ' ').capitalize()
 
 
 
     def get_initial_time(self):
-        if self.is_pomodoro_mode:
-            return self.pomodoro_time
-
-        else:
-            if self.cycle_count == 0:
-                return self.long_break_time
-
-            else:
-                return self.short_break_time
\ No newline at end of file
+        return getattr(self, f'{self.get_current_period()}_time')
\ No newline at end of file
@@ -0,0 +1,53 @@
+_MISSING = object()
+
+
+class DisplayRenderer:
+    def __init__(self):
+        self._rendered = {}
+        self.requested_calls = 0
+        self.applied_calls = 0
+
+
+
+    def configure(self, widget, **options):
+        last = self._rendered.setdefault(widget, {})
+        changed = {name: value for name, value in options.items()
+                   if last.get(name, _MISSING) != value}
+
+        self.requested_calls += 1
+        if not changed:
+            return False
+
+        widget.configure(**changed)
+        last.update(changed)
+        self.applied_calls += 1
+        return True
+
+
+
+    def update(self, widget, name, value, setter):
+        # Для свойств без configure: progress.set(), root.title() и т.п.
+        last = self._rendered.setdefault(widget, {})
+
+        self.requested_calls += 1
+        if last.get(name, _MISSING) == value:
+            return False
+
+        setter(value)
+        last[name] = value
+        self.applied_calls += 1
+        return True
+
+
+
+    def invalidate(self, widget=None):
+        if widget is None:
+            self._rendered.clear()
+        else:
+            self._rendered.pop(widget, None)
+
+
+
+    def reset_counters(self):
+        self.requested_calls = 0
+        self.applied_calls = 0
@@ -0,0 +1,131 @@
+import math
+from functools import lru_cache
+
+import customtkinter as ctk
+
+
+# 1440 шагов - четверть градуса, меньше пикселя на кольце диаметром 300
+EXTENT_STEPS = 1440
+GRADIENT_STEPS = 32
+# Ближе к концу периода цвет кольца светлеет на эту долю
+GRADIENT_FADE = 0.35
+
+
+@lru_cache(maxsize=16)
+def ring_gradient(color, steps=GRADIENT_STEPS, fade=GRADIENT_FADE):
+    # Индекс 0 - период закончился, steps - 1 - только начался
+    red, green, blue = (int(color[i:i + 2], 16) for i in (1, 3, 5))
+    gradient = []
+    for step in range(steps):
+        mix = fade * (1 - step / (steps - 1))
+        gradient.append('#{:02x}{:02x}{:02x}'.format(
+            round(red + (255 - red) * mix),
+            round(green + (255 - green) * mix),
+            round(blue + (255 - blue) * mix)))
+    return tuple(gradient)
+
+
+
+def arc_step(progress, steps=EXTENT_STEPS):
+    return round(min(1.0, max(0.0, progress)) * steps)
+
+
+def next_frame_delay(progress, duration, fps, steps=EXTENT_STEPS):
+    # Миллисекунды до следующего сдвига дуги на шаг, но не чаще fps.
+    # Прогресс убывает равномерно: шаг длится duration / steps секунд
+    frame = max(1, round(1000 / fps))
+    if not duration or duration <= 0 or progress <= 0:
+        return frame
+    position = min(1.0, progress) * steps - 0.5
+    distance = position - math.floor(position) or 1.0
+    return max(frame, math.ceil(distance * duration * 1000 / steps))
+
+
+class ProgressRing(ctk.CTkCanvas):
+    def __init__(self, master, size=300, thickness=18, fps=30, font=None,
+                 track_color='#3a3a3a', text_color='#dce4ee', bg=None, **kwargs):
+        if bg is None:
+            bg = master._apply_appearance_mode(master.cget('fg_color'))
+        # Размеры и шрифт масштабируются так же, как у остальных виджетов customtkinter
+        size = master._apply_widget_scaling(size)
+        thickness = master._apply_widget_scaling(thickness)
+        if font is not None:
+            font = master._apply_font_scaling(font)
+        super().__init__(master, width=size, height=size, bg=bg,
+                         highlightthickness=0, bd=0, **kwargs)
+        self.fps = fps
+        self.frames_requested = 0
+        self.frames_drawn = 0
+        self._step = None
+        self._color_step = None
+        self._gradient = ring_gradient('#ffffff')
+        self._progress_source = None
+        self._duration_source = None
+        self._after_id = None
+
+        # Геометрия считается один раз: каждый кадр меняет только extent дуги
+        pad = thickness / 2 + 2
+        bbox = (pad, pad, size - pad, size - pad)
+        self.create_oval(*bbox, outline=track_color, width=thickness)
+        self._arc = self.create_arc(*bbox, start=90, extent=0, style='arc',
+                                    outline=self._gradient[-1], width=thickness)
+        self._text = self.create_text(size / 2, size / 2, text='', fill=text_color, font=font)
+
+
+
+    def set_text(self, text):
+        self.itemconfigure(self._text, text=text)
+
+
+
+    def set_color(self, color):
+        self._gradient = ring_gradient(color)
+        self._color_step = None
+        self._step = None
+
+
+
+    def set_progress(self, progress):
+        self.frames_requested += 1
+        step = arc_step(progress)
+        if step == self._step:
+            return False
+        self._step = step
+
+        # Полная дуга в Tk с extent=-360 не рисуется, поэтому чуть меньше
+        options = {'extent': max(-359.9, -360.0 * step / EXTENT_STEPS)}
+        color_step = step * (GRADIENT_STEPS - 1) // EXTENT_STEPS
+        if color_step != self._color_step:
+            self._color_step = color_step
+            options['outline'] = self._gradient[color_step]
+
+        self.itemconfigure(self._arc, **options)
+        self.frames_drawn += 1
+        return True
+
+
+
+    def start_animation(self, progress_source, duration_source=None):
+        # duration_source - длительность периода в секундах: кадры ставятся
+        # на границы шагов дуги, а не каждые 1000 / fps мс
+        self.stop_animation()
+        self._progress_source = progress_source
+        self._duration_source = duration_source
+        self._animate()
+
+
+
+    def stop_animation(self):
+        if self._after_id is not None:
+            self.after_cancel(self._after_id)
+            self._after_id = None
+        self._progress_source = None
+        self._duration_source = None
+
+
+
+    def _animate(self):
+        progress = self._progress_source()
+        self.set_progress(progress)
+        duration = self._duration_source() if self._duration_source is not None else None
+        self._after_id = self.after(next_frame_delay(progress, duration, self.fps), self._animate)
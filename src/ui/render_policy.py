@@ -0,0 +1,86 @@
+RENDER_MODES = ('full', 'background', 'title', 'none')
+
+
+class RenderPolicy:
+    def __init__(self, root, on_change=None, hidden_mode='title'):
+        if hidden_mode not in ('title', 'none'):
+            raise ValueError(f"Unknown hidden render mode: {hidden_mode}")
+
+        self.root = root
+        self.on_change = on_change
+        self.hidden_mode = hidden_mode
+        self.mapped = True
+        self.obscured = False
+        self.focused = True
+        self.mode = 'full'
+
+        root.bind('<Map>', self._on_map, add='+')
+        root.bind('<Unmap>', self._on_unmap, add='+')
+        root.bind('<Visibility>', self._on_visibility, add='+')
+        root.bind('<FocusIn>', self._on_focus_in, add='+')
+        root.bind('<FocusOut>', self._on_focus_out, add='+')
+
+
+
+    @property
+    def is_visible(self):
+        return self.mode in ('full', 'background')
+
+
+
+    def _update_mode(self):
+        # Свёрнутое или полностью перекрытое окно не рисуем, видимое без фокуса - экономно
+        if not self.mapped or self.obscured:
+            mode = self.hidden_mode
+        elif not self.focused:
+            mode = 'background'
+        else:
+            mode = 'full'
+
+        if mode != self.mode:
+            previous, self.mode = self.mode, mode
+            if self.on_change is not None:
+                self.on_change(mode, previous)
+
+
+
+    def _on_map(self, event):
+        if event.widget is self.root:
+            self.mapped = True
+            self.obscured = False
+            self._update_mode()
+
+
+
+    def _on_unmap(self, event):
+        if event.widget is self.root:
+            self.mapped = False
+            self._update_mode()
+
+
+
+    def _on_visibility(self, event):
+        if event.widget is self.root:
+            self.obscured = event.state == 'VisibilityFullyObscured'
+            self._update_mode()
+
+
+
+    def _on_focus_in(self, event):
+        self.focused = True
+        self._update_mode()
+
+
+
+    def _on_focus_out(self, event):
+        # FocusOut приходит и при переходе фокуса между виджетами окна
+        self.root.after_idle(self._check_focus)
+
+
+
+    def _check_focus(self):
+        try:
+            self.focused = self.root.focus_get() is not None
+        except Exception:
+            self.focused = True
+        self._update_mode()
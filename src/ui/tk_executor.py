@@ -0,0 +1,82 @@
+import queue
+import threading
+
+
+class TkExecutor:
+    def __init__(self, root, poll_interval=50):
+        self.root = root
+        self.poll_interval = poll_interval
+        self._jobs = queue.Queue()
+        self._results = queue.Queue()
+        self._pending = 0
+        self._poll_id = None
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='aPomodoro-loader', daemon=True)
+        self._thread.start()
+
+
+
+    def submit(self, func, *args, callback=None, errback=None):
+        # func выполняется в фоне, callback/errback - в потоке Tk через after()
+        if self._closed:
+            return
+        self._pending += 1
+        self._jobs.put((func, args, callback, errback))
+        if self._poll_id is None:
+            self._poll_id = self.root.after(self.poll_interval, self._poll)
+
+
+
+    def shutdown(self):
+        self._closed = True
+        self._jobs.put(None)
+        if self._poll_id is not None:
+            self.root.after_cancel(self._poll_id)
+            self._poll_id = None
+
+
+
+    @property
+    def pending_count(self):
+        return self._pending
+
+
+
+    def _run(self):
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+
+            func, args, callback, errback = job
+            try:
+                self._results.put((callback, errback, func(*args), None))
+            except Exception as e:
+                self._results.put((callback, errback, None, e))
+
+
+
+    def _poll(self):
+        self._poll_id = None
+        while True:
+            try:
+                callback, errback, result, error = self._results.get_nowait()
+            except queue.Empty:
+                break
+
+            self._pending -= 1
+            if self._closed:
+                continue
+            try:
+                if error is None:
+                    if callback is not None:
+                        callback(result)
+                elif errback is not None:
+                    errback(error)
+                else:
+                    print(f"Error in background load: {error}")
+            except Exception as e:
+                print(f"Error handling background result: {e}")
+
+        if self._pending > 0 and not self._closed:
+            self._poll_id = self.root.after(self.poll_interval, self._poll)
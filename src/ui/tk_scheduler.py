@@ -0,0 +1,9 @@
+class TkScheduler:
+    def __init__(self, root):
+        self.root = root
+
+    def call_later(self, delay, callback, *args):
+        return self.root.after(max(0, int(delay * 1000)), callback, *args)
+
+    def cancel(self, handle):
+        self.root.after_cancel(handle)
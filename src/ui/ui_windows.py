@@ -2,20 +2,121 @@ import tkinter as tk
 import customtkinter as ctk
 from tkinter import messagebox
 
+from src.ui.tk_executor import TkExecutor
+from src.ui.virtual_day_list import VirtualDayList
+
+
+SOUND_NAMES = {
+    'bell': 'Bell',
+    'notification': 'Notification',
+    'bonus_1': 'Bonus 1',
+    'bonus_2': 'Bonus 2',
+    'soft_bell': 'Soft bell',
+    'none': 'No sound'
+}
+
+SOUND_KEYS = {name: key for key, name in SOUND_NAMES.items()}
+
 
 class UIWindows:
+    def __init__(self, parent, timer_state, settings_manager, get_stats_manager, update_callback):
+        self.parent = parent
+        self.timer_state = timer_state
+        self.settings_manager = settings_manager
+        self.get_stats_manager = get_stats_manager
+        self.update_callback = update_callback
+        self._windows = {}
+        self._fonts = {}
+        self._settings_vars = {}
+        self._general_label = None
+        self._trends_label = None
+        self._day_list = None
+        self._stats_request = 0
+        # Статистика читается в фоне, чтобы большой или битый файл не морозил таймер
+        self._loader = TkExecutor(parent)
+
+
+
+    def prebuild(self):
+        # Собираем окна заранее, пока приложение простаивает
+        for name in ('about', 'settings', 'stats'):
+            self._get_window(name)
+
+
+
+    def show_about(self):
+        self._present(self._get_window('about'))
+
+
+
+    def show_settings(self):
+        window = self._get_window('settings')
+        self._refresh_settings()
+        self._present(window)
+
+
+
+    def show_stats(self):
+        window = self._get_window('stats')
+        self._present(window)
+        self._refresh_stats()
+
+
+
+    def close(self):
+        self._loader.shutdown()
+
+
 
-    @staticmethod
-    def show_about(parent):
-        window = ctk.CTkToplevel(parent)
-        window.title('About')
-        window.geometry('400x300')
-        window.transient(parent)
+    def _font(self, size, weight='normal'):
+        key = (size, weight)
+        if key not in self._fonts:
+            self._fonts[key] = ctk.CTkFont(size=size, weight=weight)
+        return self._fonts[key]
+
+
+
+    def _get_window(self, name):
+        window = self._windows.get(name)
+        if window is None or not window.winfo_exists():
+            builder = getattr(self, f'_build_{name}')
+            window = builder()
+            window.withdraw()
+            window.protocol('WM_DELETE_WINDOW', lambda: self._hide(window))
+            self._windows[name] = window
+        return window
+
+
+
+    def _new_window(self, title, width, height):
+        window = ctk.CTkToplevel(self.parent)
+        window.title(title)
+        window.geometry(f'{width}x{height}')
+        window.transient(self.parent)
+        window.minsize(width, height)
+        return window
+
+
+
+    def _present(self, window):
+        window.deiconify()
+        window.lift()
+        window.focus_force()
         window.grab_set()
-        window.minsize(400, 300)
+
+
+
+    def _hide(self, window):
+        window.grab_release()
+        window.withdraw()
+
+
+
+    def _build_about(self):
+        window = self._new_window('About', 400, 300)
 
         ctk.CTkLabel(window, text='Pomodoro Timer',
-                     font=ctk.CTkFont(size=24, weight='bold')).pack(pady=20)
+                     font=self._font(24, 'bold')).pack(pady=20)
 
         info = """The Pomodoro Technique is a time management method
         developed by Francesco Cirillo in the late 1980s.
@@ -29,142 +130,192 @@ class UIWindows:
 
         © 2025 aPomodoro"""
 
-        ctk.CTkLabel(window, text=info, font=ctk.CTkFont(size=12)).pack(pady=20, padx=20)
-        ctk.CTkButton(window, text='Close', command=window.destroy).pack(pady=20)
+        ctk.CTkLabel(window, text=info, font=self._font(12)).pack(pady=20, padx=20)
+        ctk.CTkButton(window, text='Close', command=lambda: self._hide(window)).pack(pady=20)
+        return window
 
 
 
-    @staticmethod
-    def show_settings(parent, timer_state, settings_manager, update_callback):
-        window = ctk.CTkToplevel(parent)
-        window.title('Settings')
-        window.geometry('360x500')
-        window.transient(parent)
-        window.grab_set()
-        window.minsize(360, 500)
+    def _build_settings(self):
+        window = self._new_window('Settings', 360, 500)
 
         frame = ctk.CTkFrame(window, corner_radius=15)
         frame.pack(fill='both', expand=True, padx=20, pady=20)
 
         ctk.CTkLabel(frame, text='Settings',
-                     font=ctk.CTkFont(size=18, weight='bold')).pack(pady=15)
-
-        pomodoro_var = tk.StringVar(value=str(timer_state.pomodoro_time // 60))
-        short_var = tk.StringVar(value=str(timer_state.short_break_time // 60))
-        long_var = tk.StringVar(value=str(timer_state.long_break_time // 60))
-        notif_var = tk.StringVar(value=timer_state.notification_type)
-        pom_sound_var = tk.StringVar(value=timer_state.pomodoro_sound)
-        short_sound_var = tk.StringVar(value=timer_state.short_break_sound)
-        long_sound_var = tk.StringVar(value=timer_state.long_break_sound)
-
-        sound_dict = {
-            'bell': 'Bell',
-            'notification': 'Notification',
-            'bonus_1': 'Bonus 1',
-            'bonus_2': 'Bonus 2',
-            'soft_bell': 'Soft bell',
-            'none': 'No sound'
-        }
-
-        reverse_sound_dict = {
-            'Bell': 'bell',
-            'Soft bell': 'soft_bell',
-            'Notification': 'notification',
-            'Bonus 1': 'bonus_1',
-            'Bonus 2': 'bonus_2',
-            'No sound': 'none'
+                     font=self._font(18, 'bold')).pack(pady=15)
+
+        self._settings_vars = {
+            'pomodoro_time': tk.StringVar(),
+            'short_break_time': tk.StringVar(),
+            'long_break_time': tk.StringVar(),
+            'notification_type': tk.StringVar(),
+            'pomodoro_sound': tk.StringVar(),
+            'short_break_sound': tk.StringVar(),
+            'long_break_sound': tk.StringVar()
         }
 
         sound_names = ['Bell', 'Soft bell', 'Notification', 'Bonus 1', 'Bonus 2', 'No sound']
 
-        pom_sound_var.set(sound_dict.get(timer_state.pomodoro_sound, 'Bonus 1'))
-        short_sound_var.set(sound_dict.get(timer_state.short_break_sound, 'Soft bell'))
-        long_sound_var.set(sound_dict.get(timer_state.long_break_sound, 'Bell'))
-
         settings_data = [
-            ('Pomodoro (min):', pomodoro_var, None),
-            ('Short break (min):', short_var, None),
-            ('Long break (min):', long_var, None),
-            ('Notification:', notif_var, ['sound', 'popup', 'both']),
-            ('Pomodoro sound:', pom_sound_var, sound_names),
-            ('Short break sound:', short_sound_var, sound_names),
-            ('Long break sound:', long_sound_var, sound_names)
+            ('Pomodoro (min):', 'pomodoro_time', None),
+            ('Short break (min):', 'short_break_time', None),
+            ('Long break (min):', 'long_break_time', None),
+            ('Notification:', 'notification_type', ['sound', 'popup', 'both']),
+            ('Pomodoro sound:', 'pomodoro_sound', sound_names),
+            ('Short break sound:', 'short_break_sound', sound_names),
+            ('Long break sound:', 'long_break_sound', sound_names)
         ]
 
-        for label_text, var, values in settings_data:
+        for label_text, key, values in settings_data:
             row = ctk.CTkFrame(frame)
             row.pack(fill='x', pady=5, padx=10)
             ctk.CTkLabel(row, text=label_text).pack(side='left', padx=10)
 
             if values:
-                ctk.CTkOptionMenu(row, variable=var, values=values).pack(side='right', padx=10)
+                ctk.CTkOptionMenu(row, variable=self._settings_vars[key], values=values).pack(side='right', padx=10)
             else:
-                ctk.CTkEntry(row, textvariable=var, width=100).pack(side='right', padx=10)
-
-
-
-        def apply_settings():
-            try:
-                pom_time = int(pomodoro_var.get()) * 60
-                short_time = int(short_var.get()) * 60
-                long_time = int(long_var.get()) * 60
-
-                if pom_time <= 0 or short_time <= 0 or long_time <= 0:
-                    raise ValueError("Time must be greater than 0")
-
-                old_pom = timer_state.pomodoro_time
-                timer_state.pomodoro_time = pom_time
-                timer_state.short_break_time = short_time
-                timer_state.long_break_time = long_time
-                timer_state.notification_type = notif_var.get()
-                timer_state.pomodoro_sound = reverse_sound_dict.get(pom_sound_var.get(), 'bonus_1')
-                timer_state.short_break_sound = reverse_sound_dict.get(short_sound_var.get(), 'soft_bell')
-                timer_state.long_break_sound = reverse_sound_dict.get(long_sound_var.get(), 'bell')
-
-                if not timer_state.is_running:
-                    if timer_state.is_pomodoro_mode and old_pom != pom_time:
-                        timer_state.current_time = pom_time
-                    elif not timer_state.is_pomodoro_mode:
-                        if timer_state.cycle_count == 0:
-                            timer_state.current_time = long_time
-                        else:
-                            timer_state.current_time = short_time
-
-                if settings_manager.save_settings(timer_state):
-                    messagebox.showinfo('Success', 'Settings saved!')
-                    update_callback()  # Обновляем интерфейс
-                    window.destroy()
-                else:
-                    messagebox.showerror('Error', 'Failed to save settings')
-
-            except ValueError as e:
-                messagebox.showerror('Error', f'Invalid values: {e}')
+                ctk.CTkEntry(row, textvariable=self._settings_vars[key], width=100).pack(side='right', padx=10)
 
         ctk.CTkButton(frame, text='Apply', height=40, corner_radius=20,
-                      command=apply_settings).pack(pady=15)
-
-    @staticmethod
-    def show_stats(parent, stats_manager):
-        window = ctk.CTkToplevel(parent)
-        window.title('Statistics')
-        window.geometry('500x600')
-        window.transient(parent)
-        window.grab_set()
-        window.minsize(500, 600)
+                      command=lambda: self._apply_settings(window)).pack(pady=15)
+        return window
+
+
+
+    def _refresh_settings(self):
+        timer_state = self.timer_state
+        variables = self._settings_vars
+        variables['pomodoro_time'].set(str(timer_state.pomodoro_time // 60))
+        variables['short_break_time'].set(str(timer_state.short_break_time // 60))
+        variables['long_break_time'].set(str(timer_state.long_break_time // 60))
+        variables['notification_type'].set(timer_state.notification_type)
+        variables['pomodoro_sound'].set(SOUND_NAMES.get(timer_state.pomodoro_sound, 'Bonus 1'))
+        variables['short_break_sound'].set(SOUND_NAMES.get(timer_state.short_break_sound, 'Soft bell'))
+        variables['long_break_sound'].set(SOUND_NAMES.get(timer_state.long_break_sound, 'Bell'))
+
+
+
+    def _apply_settings(self, window):
+        timer_state = self.timer_state
+        variables = self._settings_vars
+        try:
+            pom_time = int(variables['pomodoro_time'].get()) * 60
+            short_time = int(variables['short_break_time'].get()) * 60
+            long_time = int(variables['long_break_time'].get()) * 60
+
+            if pom_time <= 0 or short_time <= 0 or long_time <= 0:
+                raise ValueError("Time must be greater than 0")
+
+            old_pom = timer_state.pomodoro_time
+            timer_state.pomodoro_time = pom_time
+            timer_state.short_break_time = short_time
+            timer_state.long_break_time = long_time
+            timer_state.notification_type = variables['notification_type'].get()
+            timer_state.pomodoro_sound = SOUND_KEYS.get(variables['pomodoro_sound'].get(), 'bonus_1')
+            timer_state.short_break_sound = SOUND_KEYS.get(variables['short_break_sound'].get(), 'soft_bell')
+            timer_state.long_break_sound = SOUND_KEYS.get(variables['long_break_sound'].get(), 'bell')
+
+            if not timer_state.is_running:
+                if timer_state.is_pomodoro_mode and old_pom != pom_time:
+                    timer_state.current_time = pom_time
+                elif not timer_state.is_pomodoro_mode:
+                    timer_state.current_time = timer_state.get_initial_time()
+
+            if self.settings_manager.save_settings(timer_state):
+                messagebox.showinfo('Success', 'Settings saved!')
+                self.update_callback()  # Обновляем интерфейс
+                self._hide(window)
+            else:
+                messagebox.showerror('Error', 'Failed to save settings')
+
+        except ValueError as e:
+            messagebox.showerror('Error', f'Invalid values: {e}')
+
+
+
+    def _build_stats(self):
+        window = self._new_window('Statistics', 500, 720)
 
-        frame = ctk.CTkScrollableFrame(window)
+        frame = ctk.CTkFrame(window, fg_color='transparent')
         frame.pack(fill='both', expand=True, padx=20, pady=20)
 
         ctk.CTkLabel(frame, text='Statistics',
-                     font=ctk.CTkFont(size=24, weight='bold')).pack(pady=15)
-
-        general_stats = stats_manager.get_general_stats()
+                     font=self._font(24, 'bold')).pack(pady=15)
 
         general_frame = ctk.CTkFrame(frame)
         general_frame.pack(fill='x', pady=10)
 
         ctk.CTkLabel(general_frame, text='General Statistics',
-                     font=ctk.CTkFont(size=18, weight='bold')).pack(pady=10)
+                     font=self._font(18, 'bold')).pack(pady=10)
+
+        self._general_label = ctk.CTkLabel(general_frame, text='')
+        self._general_label.pack(pady=10)
+
+        trends_frame = ctk.CTkFrame(frame)
+        trends_frame.pack(fill='x', pady=10)
+
+        ctk.CTkLabel(trends_frame, text='Trends',
+                     font=self._font(18, 'bold')).pack(pady=10)
+
+        self._trends_label = ctk.CTkLabel(trends_frame, text='', justify='left')
+        self._trends_label.pack(pady=10)
+
+        button_frame = ctk.CTkFrame(frame)
+        button_frame.pack(side='bottom', fill='x', pady=(10, 0))
+
+        daily_frame = ctk.CTkFrame(frame)
+        daily_frame.pack(fill='both', expand=True, pady=10)
+
+        ctk.CTkLabel(daily_frame, text='History',
+                     font=self._font(18, 'bold')).pack(pady=10)
+
+        # Виджеты строк создаются только под видимую часть истории и переиспользуются
+        self._day_list = VirtualDayList(
+            daily_frame, lambda offset, count: self.get_stats_manager().get_days(offset, count),
+            loader=self._loader.submit)
+        self._day_list.pack(fill='both', expand=True, padx=10, pady=(0, 10))
+
+        ctk.CTkButton(button_frame, text='Reset Statistics', command=lambda: self._reset_stats(window),
+                      fg_color='#dc3545', hover_color='#c82333').pack(side='left', padx=10, pady=10)
+        ctk.CTkButton(button_frame, text='Close',
+                      command=lambda: self._hide(window)).pack(side='right', padx=10, pady=10)
+        return window
+
+
+
+    def _refresh_stats(self):
+        self._stats_request += 1
+        request = self._stats_request
+
+        self._general_label.configure(text='Loading...')
+        self._trends_label.configure(text='Loading...')
+        self._day_list.set_total(0)
+        self._loader.submit(self._load_stats_summary,
+                            callback=lambda summary: self._show_stats_summary(request, summary),
+                            errback=lambda error: self._show_stats_error(request, error))
+        self._loader.submit(lambda: self.get_stats_manager().get_analytics().summary(),
+                            callback=lambda trends: self._show_trends(request, trends),
+                            errback=lambda error: self._show_trends_error(request, error))
+
+
+
+    def _load_stats_summary(self):
+        # Выполняется в фоновом потоке
+        stats_manager = self.get_stats_manager()
+        try:
+            return stats_manager.get_general_stats(), stats_manager.get_history_length()
+        except Exception as e:
+            print(f"Error loading stats, trying to repair: {e}")
+            stats_manager.repair_stats_file()
+            return stats_manager.get_general_stats(), stats_manager.get_history_length()
+
+
+
+    def _show_stats_summary(self, request, summary):
+        if request != self._stats_request:
+            return
+        general_stats, history_length = summary
 
         if general_stats['total_days'] > 0:
             general_text = f"""Total Pomodoros: {general_stats['total_pomodoros']}
@@ -174,41 +325,58 @@ Average per Day: {general_stats['avg_per_day']:.1f} pomodoros"""
         else:
             general_text = "No data yet"
 
-        ctk.CTkLabel(general_frame, text=general_text).pack(pady=10)
+        self._general_label.configure(text=general_text)
+        self._day_list.set_total(history_length)
 
-        daily_frame = ctk.CTkFrame(frame)
-        daily_frame.pack(fill='x', pady=10)
 
-        ctk.CTkLabel(daily_frame, text='Last 7 Days',
-                     font=ctk.CTkFont(size=18, weight='bold')).pack(pady=10)
 
-        daily_stats = stats_manager.get_daily_stats(7)
-        for day_data in daily_stats:
-            day_row = ctk.CTkFrame(daily_frame)
-            day_row.pack(fill='x', pady=2, padx=10)
+    def _show_trends(self, request, trends):
+        if request != self._stats_request:
+            return
 
-            day_name = day_data['date'].strftime('%A, %b %d')
-            if day_data['is_today']:
-                day_name += ' (Today)'
+        best_weekday = trends['best_weekday'] or '-'
+        self._trends_label.configure(text=f"""Current streak: {trends['current_streak']} days (longest {trends['longest_streak']})
+This week: {trends['this_week']}, this month: {trends['this_month']}, this year: {trends['this_year']}
+Average per day: {trends['avg_7_days']:.1f} (7 days), {trends['avg_30_days']:.1f} (30 days)
+Most productive weekday: {best_weekday}""")
 
-            ctk.CTkLabel(day_row, text=day_name).pack(side='left', padx=10, pady=5)
 
-            stats_text = f"{day_data['pomodoros']} pomodoros, {day_data['work_time'] // 60}m"
-            ctk.CTkLabel(day_row, text=stats_text).pack(side='right', padx=10, pady=5)
 
+    def _show_trends_error(self, request, error):
+        if request != self._stats_request:
+            return
+        # Итоги и история показываются и без трендов, поэтому без окна с ошибкой
+        print(f"Error loading trends: {error}")
+        self._trends_label.configure(text="Couldn't load trends")
 
 
-        def reset_stats():
-            if messagebox.askyesno('Reset Statistics', 'Are you sure? This cannot be undone.'):
-                if stats_manager.reset_stats():
-                    messagebox.showinfo('Success', 'Statistics reset!')
-                    window.destroy()
-                else:
-                    messagebox.showerror('Error', 'Failed to reset statistics')
 
-        button_frame = ctk.CTkFrame(frame)
-        button_frame.pack(fill='x', pady=20)
+    def _show_stats_error(self, request, error):
+        if request != self._stats_request:
+            return
+        print(f"Error loading stats: {error}")
+        self._general_label.configure(text="Couldn't load statistics")
+        self._trends_label.configure(text='')
+        # Файл не сбрасываем: повторная попытка или восстановление не должны терять историю
+        messagebox.showerror("Error", "Couldn't load statistics.\nThe statistics file was left untouched.")
 
-        ctk.CTkButton(button_frame, text='Reset Statistics', command=reset_stats,
-                      fg_color='#dc3545', hover_color='#c82333').pack(side='left', padx=10, pady=10)
-        ctk.CTkButton(button_frame, text='Close', command=window.destroy).pack(side='right', padx=10, pady=10)
\ No newline at end of file
+
+
+    def _reset_stats(self, window):
+        if messagebox.askyesno('Reset Statistics', 'Are you sure? This cannot be undone.'):
+            self._loader.submit(self._reset_stats_file,
+                                callback=lambda ok: self._on_stats_reset(window, ok))
+
+
+
+    def _reset_stats_file(self):
+        return self.get_stats_manager().reset_stats()
+
+
+
+    def _on_stats_reset(self, window, ok):
+        if ok:
+            messagebox.showinfo('Success', 'Statistics reset!')
+            self._hide(window)
+        else:
+            messagebox.showerror('Error', 'Failed to reset statistics')
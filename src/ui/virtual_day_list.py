@@ -0,0 +1,176 @@
+import tkinter as tk
+import customtkinter as ctk
+from collections import OrderedDict
+
+from src.ui.display_renderer import DisplayRenderer
+
+
+class VirtualDayList(ctk.CTkFrame):
+    def __init__(self, master, fetch_days, row_height=36, page_size=60, max_pages=20,
+                 loader=None, **kwargs):
+        super().__init__(master, **kwargs)
+        self.fetch_days = fetch_days
+        self.loader = loader
+        self.row_height = row_height
+        self.page_size = page_size
+        self.max_pages = max_pages
+        self.total_rows = 0
+        self._pages = OrderedDict()
+        self._loading = set()
+        self._failed = set()
+        self._generation = 0
+        self._rows = []
+        self._renderer = DisplayRenderer()
+
+        background = self._apply_appearance_mode(self.cget('fg_color'))
+        self.canvas = tk.Canvas(self, highlightthickness=0, bd=0, bg=background,
+                                yscrollincrement=row_height)
+        self.scrollbar = ctk.CTkScrollbar(self, command=self.canvas.yview)
+        self.canvas.configure(yscrollcommand=self._on_scroll)
+
+        self.scrollbar.pack(side='right', fill='y')
+        self.canvas.pack(side='left', fill='both', expand=True)
+
+        self.canvas.bind('<Configure>', self._on_resize)
+        for widget in (self.canvas, self):
+            widget.bind('<MouseWheel>', self._on_mousewheel)
+            widget.bind('<Button-4>', lambda event: self._scroll_units(-1))
+            widget.bind('<Button-5>', lambda event: self._scroll_units(1))
+
+
+
+    def set_total(self, total_rows):
+        # Новые данные: сбрасываем кэш страниц и перерисовываем видимые строки
+        self.total_rows = total_rows
+        self._generation += 1
+        self._pages.clear()
+        self._loading.clear()
+        self._failed.clear()
+        self.canvas.configure(scrollregion=(0, 0, 0, total_rows * self.row_height))
+        self.render()
+
+
+
+    def render(self):
+        if not self._rows:
+            return
+
+        first = max(0, int(self.canvas.canvasy(0) // self.row_height))
+        for i, row in enumerate(self._rows):
+            index = first + i
+            if index >= self.total_rows:
+                self.canvas.itemconfigure(row['item'], state='hidden')
+                continue
+
+            self.canvas.itemconfigure(row['item'], state='normal')
+            self.canvas.coords(row['item'], 0, index * self.row_height)
+
+            day_data = self._get_day(index)
+            if day_data is None:
+                # Страница ещё грузится в фоне - показываем заглушку
+                failed = index // self.page_size in self._failed
+                self._renderer.configure(row['name'],
+                                         text='Could not load stats' if failed else 'Loading...')
+                self._renderer.configure(row['stats'], text='')
+                continue
+
+            day_name = day_data['date'].strftime('%A, %b %d, %Y')
+            if day_data['is_today']:
+                day_name += ' (Today)'
+            self._renderer.configure(row['name'], text=day_name)
+            self._renderer.configure(
+                row['stats'], text=f"{day_data['pomodoros']} pomodoros, {day_data['work_time'] // 60}m")
+
+
+
+    def _get_day(self, index):
+        page_index = index // self.page_size
+        page = self._pages.get(page_index)
+        if page is not None:
+            self._pages.move_to_end(page_index)
+            return page[index % self.page_size]
+
+        if self.loader is None:
+            self._store_page(page_index, self.fetch_days(page_index * self.page_size, self.page_size))
+            return self._pages[page_index][index % self.page_size]
+
+        # Неудачную страницу не запрашиваем снова до следующего set_total
+        if page_index not in self._loading and page_index not in self._failed:
+            self._loading.add(page_index)
+            generation = self._generation
+            self.loader(self.fetch_days, page_index * self.page_size, self.page_size,
+                        callback=lambda page: self._on_page_loaded(generation, page_index, page),
+                        errback=lambda error: self._on_page_failed(generation, page_index, error))
+        return None
+
+
+
+    def _on_page_loaded(self, generation, page_index, page):
+        if generation != self._generation:
+            return  # Ответ на запрос до set_total - данные уже устарели
+        self._loading.discard(page_index)
+        self._store_page(page_index, page)
+        self.render()
+
+
+
+    def _on_page_failed(self, generation, page_index, error):
+        if generation != self._generation:
+            return
+        print(f"Error loading stats page: {error}")
+        self._loading.discard(page_index)
+        self._failed.add(page_index)
+        self.render()
+
+
+
+    def _store_page(self, page_index, page):
+        self._pages[page_index] = page
+        while len(self._pages) > self.max_pages:
+            self._pages.popitem(last=False)
+
+
+
+    def _ensure_rows(self, height, width):
+        # Виджетов ровно столько, сколько строк помещается на экране, плюс запас
+        needed = height // self.row_height + 2
+        while len(self._rows) < needed:
+            frame = ctk.CTkFrame(self.canvas, height=self.row_height - 4)
+            name_label = ctk.CTkLabel(frame, text='')
+            name_label.pack(side='left', padx=10)
+            stats_label = ctk.CTkLabel(frame, text='')
+            stats_label.pack(side='right', padx=10)
+            for widget in (frame, name_label, stats_label):
+                widget.bind('<MouseWheel>', self._on_mousewheel)
+                widget.bind('<Button-4>', lambda event: self._scroll_units(-1))
+                widget.bind('<Button-5>', lambda event: self._scroll_units(1))
+
+            item = self.canvas.create_window(0, 0, window=frame, anchor='nw',
+                                             width=width, height=self.row_height - 4)
+            self._rows.append({'item': item, 'frame': frame,
+                               'name': name_label, 'stats': stats_label})
+
+        for row in self._rows:
+            self.canvas.itemconfigure(row['item'], width=width)
+
+
+
+    def _on_resize(self, event):
+        self._ensure_rows(event.height, event.width)
+        self.render()
+
+
+
+    def _on_scroll(self, first, last):
+        self.scrollbar.set(first, last)
+        self.render()
+
+
+
+    def _on_mousewheel(self, event):
+        self._scroll_units(-1 if event.delta > 0 else 1)
+
+
+
+    def _scroll_units(self, units):
+        self.canvas.yview_scroll(units, 'units')
@@ -0,0 +1,114 @@
+import threading
+from collections import OrderedDict
+
+
+class BackgroundWriter:
+    def __init__(self, max_pending=64, retry_delay=2.0):
+        self.max_pending = max_pending
+        self.retry_delay = retry_delay
+        self._retrying = 0
+        self._pending = OrderedDict()
+        self._condition = threading.Condition()
+        self._busy = False
+        self._closed = False
+        self._thread = threading.Thread(target=self._run, name='aPomodoro-writer', daemon=True)
+        self._thread.start()
+
+
+
+    def submit(self, func, *args, key=None, retries=0):
+        # Задачи с одинаковым key схлопываются: выполнится только последняя.
+        # Задача, упавшая с TimeoutError (занятая блокировка), ставится в очередь
+        # ещё до retries раз через retry_delay, не задерживая остальные
+        with self._condition:
+            if self._closed:
+                run_inline = True
+            else:
+                run_inline = False
+                if key is None:
+                    key = object()
+
+                if key in self._pending:
+                    del self._pending[key]
+                else:
+                    while len(self._pending) >= self.max_pending and not self._closed:
+                        self._condition.wait()
+
+                self._pending[key] = (func, args, retries)
+                self._condition.notify_all()
+
+        if run_inline:
+            self._execute(func, args, key, retries)
+
+
+
+    def flush(self, timeout=None):
+        with self._condition:
+            return self._condition.wait_for(
+                lambda: not self._pending and not self._busy and not self._retrying, timeout)
+
+
+
+    def close(self, timeout=5.0):
+        flushed = self.flush(timeout)
+        with self._condition:
+            self._closed = True
+            self._condition.notify_all()
+        self._thread.join(timeout)
+        return flushed
+
+
+
+    @property
+    def pending_count(self):
+        with self._condition:
+            return len(self._pending)
+
+
+
+    def _run(self):
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+
+                key, (func, args, retries) = self._pending.popitem(last=False)
+                self._busy = True
+                self._condition.notify_all()
+
+            try:
+                self._execute(func, args, key, retries)
+            finally:
+                with self._condition:
+                    self._busy = False
+                    self._condition.notify_all()
+
+
+
+    def _execute(self, func, args, key=None, retries=0):
+        try:
+            func(*args)
+        except TimeoutError as e:
+            if retries <= 0:
+                print(f"Error in background write: {e}")
+                return
+            print(f"Background write is busy, retrying: {e}")
+            with self._condition:
+                self._retrying += 1
+            timer = threading.Timer(self.retry_delay, self._retry, (func, args, key, retries - 1))
+            timer.daemon = True
+            timer.start()
+        except Exception as e:
+            print(f"Error in background write: {e}")
+
+
+
+    def _retry(self, func, args, key, retries):
+        try:
+            self.submit(func, *args, key=key, retries=retries)
+        finally:
+            with self._condition:
+                self._retrying -= 1
+                self._condition.notify_all()
@@ -0,0 +1,89 @@
+import os
+import time
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+    import msvcrt
+
+
+class FileLock:
+    # Межпроцессная рекомендательная блокировка на отдельном файле-замке.
+    # Сам файл данных подменяется через os.replace, поэтому блокировать его нельзя
+    def __init__(self, path, timeout=10.0, poll_interval=0.01):
+        self.path = path
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self._fd = None
+        self._depth = 0
+
+    @property
+    def is_locked(self):
+        return self._fd is not None
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.release()
+
+
+
+    def acquire(self, timeout=None):
+        # Повторный захват тем же объектом только увеличивает счётчик:
+        # сохранение может вызвать сжатие, которому нужна та же блокировка.
+        # timeout задаёт ожидание только для этого захвата, иначе берётся self.timeout
+        if self._fd is not None:
+            self._depth += 1
+            return
+
+        timeout = self.timeout if timeout is None else timeout
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        deadline = None if timeout is None else time.monotonic() + timeout
+        try:
+            while not self._try_lock(fd):
+                if deadline is not None and time.monotonic() >= deadline:
+                    raise TimeoutError(f"Could not lock {self.path} within {timeout} s")
+                time.sleep(self.poll_interval)
+        except BaseException:
+            os.close(fd)
+            raise
+
+        self._fd = fd
+        self._depth = 1
+
+
+
+    def release(self):
+        if self._fd is None:
+            return
+        self._depth -= 1
+        if self._depth > 0:
+            return
+
+        fd, self._fd = self._fd, None
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(fd)
+
+
+
+    @staticmethod
+    def _try_lock(fd):
+        try:
+            if fcntl is not None:
+                fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            else:
+                # Блокируем первый байт; за концом файла Windows это тоже позволяет
+                os.lseek(fd, 0, os.SEEK_SET)
+                msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+            return True
+        except OSError:
+            return False
@@ -0,0 +1,48 @@
+import json
+import os
+import tempfile
+import time
+
+
+# На Windows os.replace падает с PermissionError, пока другой процесс держит
+# целевой файл открытым для чтения; читатель закрывает его за миллисекунды
+RETRY_REPLACE = os.name == 'nt'
+REPLACE_ATTEMPTS = 20
+REPLACE_RETRY_DELAY = 0.05
+
+
+def replace_file(source, target):
+    for attempt in range(REPLACE_ATTEMPTS):
+        try:
+            os.replace(source, target)
+            return
+        except PermissionError:
+            if not RETRY_REPLACE or attempt == REPLACE_ATTEMPTS - 1:
+                raise
+            time.sleep(REPLACE_RETRY_DELAY)
+
+
+
+def atomic_write_bytes(path, data):
+    # Пишем во временный файл рядом и подменяем одним os.replace,
+    # чтобы при сбое на диске оставалась либо старая, либо новая версия
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(prefix='.' + os.path.basename(path) + '.',
+                                     suffix='.tmp', dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        replace_file(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+
+
+def atomic_write_json(path, data, indent=2):
+    atomic_write_bytes(path, json.dumps(data, ensure_ascii=False, indent=indent).encode('utf-8'))
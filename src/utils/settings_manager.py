@@ -2,6 +2,8 @@ import json
 import os
 import sys
 
+from src.utils.file_utils import atomic_write_json
+
 
 class SettingsManager:
     def __init__(self):
@@ -28,8 +30,7 @@ class SettingsManager:
                 'long_break_sound': timer_state.long_break_sound
             }
 
-            with open(self.settings_file, 'w', encoding='utf-8') as f:
-                json.dump(settings, f, ensure_ascii=False, indent=2)
+            atomic_write_json(self.settings_file, settings)
             return True
 
         except Exception as e:
@@ -0,0 +1,72 @@
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
+
+
+class SoundCache(Mapping):
+    def __init__(self, catalog, loader, size_of, max_bytes=8 * 1024 * 1024):
+        self.catalog = dict(catalog)
+        self.loader = loader
+        self.size_of = size_of
+        self.max_bytes = max_bytes
+        self.used_bytes = 0
+        self._loaded = OrderedDict()
+        self._lock = threading.RLock()
+
+
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key in self._loaded:
+                self._loaded.move_to_end(key)
+                return self._loaded[key][0]
+
+            path = self.catalog.get(key) if isinstance(key, str) else None
+            if path is None:
+                return default
+
+            sound = self.loader(path)
+            self._store(key, sound, self.size_of(sound) if sound is not None else 0)
+            return sound
+
+
+
+    def is_loaded(self, key):
+        with self._lock:
+            return key in self._loaded
+
+
+
+    def __getitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        return self.get(key)
+
+
+
+    def __contains__(self, key):
+        return key in self.catalog
+
+
+
+    def __iter__(self):
+        return iter(list(self.catalog))
+
+
+
+    def __len__(self):
+        return len(self.catalog)
+
+
+
+    def _store(self, key, sound, size):
+        if key in self._loaded:
+            self.used_bytes -= self._loaded.pop(key)[1]
+        self._loaded[key] = (sound, size)
+        self.used_bytes += size
+
+        while self.used_bytes > self.max_bytes and len(self._loaded) > 1:
+            oldest = next(iter(self._loaded))
+            if oldest == key:
+                break
+            self.used_bytes -= self._loaded.pop(oldest)[1]
@@ -1,30 +1,113 @@
-import pygame
 import os
 import sys
+import threading
+from collections import deque
+
+from src.utils.sound_cache import SoundCache
+
+
+SOUND_FILES = {
+    'bell': 'sounds/bell.wav',
+    'soft_bell': 'sounds/soft_bell.wav',
+    'notification': 'sounds/notification.wav',
+    'bonus_1': 'sounds/bonus_1.wav',
+    'bonus_2': 'sounds/bonus_2.wav',
+    'none': None
+}
+
+# pygame импортируется вместе с инициализацией микшера, а не при импорте модуля
+pygame = None
+
+
+def import_pygame():
+    global pygame
+    if pygame is None:
+        import pygame as pygame_module
+        pygame = pygame_module
+    return pygame
 
 
 class SoundManager:
-    def __init__(self):
-        pygame.mixer.init()
-
-        self.sounds = {
-            'bell': self.load_sound('sounds/bell.wav'),
-            'soft_bell': self.load_sound('sounds/soft_bell.wav'),
-            'notification': self.load_sound('sounds/notification.wav'),
-            'bonus_1': self.load_sound('sounds/bonus_1.wav'),
-            'bonus_2': self.load_sound('sounds/bonus_2.wav'),
-            'none': None
-        }
+    def __init__(self, cache_bytes=8 * 1024 * 1024, async_init=False,
+                 pending_policy='queue', max_pending=3):
+        if pending_policy not in ('queue', 'drop'):
+            raise ValueError(f"Unknown pending sound policy: {pending_policy}")
+
+        # Звуки декодируются при первом воспроизведении, а не при запуске
+        self.sounds = SoundCache(SOUND_FILES, self.load_sound, self.sound_size, cache_bytes)
+        self.pending_policy = pending_policy
+        self.available = False
+        self._ready = threading.Event()
+        self._pending = deque(maxlen=max_pending)
+        self._lock = threading.Lock()
+        self._init_thread = None
+
+        if async_init:
+            self._init_thread = threading.Thread(target=self._init_mixer,
+                                                 name='aPomodoro-audio-init', daemon=True)
+            self._init_thread.start()
+        else:
+            self._init_mixer()
+
+
+
+    def _init_mixer(self):
+        try:
+            import_pygame().mixer.init()
+            self.available = True
+        except Exception as e:
+            print(f"Audio is unavailable, sounds are disabled: {e}")
+
+        with self._lock:
+            self._ready.set()
+            pending = list(self._pending)
+            self._pending.clear()
+
+        for key in pending:
+            self.play_sound(key)
+
+
+
+    def wait_ready(self, timeout=None):
+        return self._ready.wait(timeout)
 
     def load_sound(self, filename):
         path = self.resource_path(filename)
         try:
             return pygame.mixer.Sound(path)
-        except pygame.error:
+        except (pygame.error, OSError):
+            # Отсутствующий или нечитаемый файл - просто нет звука
             return None
 
 
 
+    def sound_size(self, sound):
+        try:
+            frequency, sample_format, channels = pygame.mixer.get_init()
+            return int(sound.get_length() * frequency * channels * abs(sample_format) // 8)
+        except (pygame.error, TypeError, ValueError):
+            return 0
+
+
+
+    def prefetch(self, keys):
+        keys = [key for key in keys if key in self.sounds and not self.sounds.is_loaded(key)]
+        if not keys:
+            return None
+
+        def load_all():
+            self._ready.wait()
+            if not self.available:
+                return
+            for key in keys:
+                self.sounds.get(key)
+
+        thread = threading.Thread(target=load_all, name='aPomodoro-sound-prefetch', daemon=True)
+        thread.start()
+        return thread
+
+
+
     def resource_path(self, relative_path):
         try:
             base_path = sys._MEIPASS
@@ -35,6 +118,16 @@ class SoundManager:
 
 
     def play_sound(self, key):
+        with self._lock:
+            if not self._ready.is_set():
+                # Микшер ещё открывается: звук либо ждёт в очереди, либо теряется
+                if self.pending_policy == 'queue':
+                    self._pending.append(key)
+                return
+
+        if not self.available:
+            return
+
         sound = self.sounds.get(key)
         if sound:
             try:
@@ -60,6 +153,8 @@ class SoundManager:
 
 
     def cleanup(self):
+        if not self._ready.wait(1.0) or not self.available:
+            return
         try:
             pygame.mixer.quit()
         except Exception:
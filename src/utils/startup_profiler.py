@@ -0,0 +1,70 @@
+import os
+import sys
+import time
+from contextlib import contextmanager
+
+
+def process_age():
+    # Настенное время с момента создания процесса, None если платформа его не отдаёт
+    try:
+        if sys.platform.startswith('linux'):
+            with open('/proc/self/stat') as f:
+                # Имя процесса в скобках может содержать пробелы, поля считаем после ')'
+                fields = f.read().rsplit(')', 1)[1].split()
+            with open('/proc/uptime') as f:
+                uptime = float(f.read().split()[0])
+            # starttime - 22-е поле, в тиках часов с загрузки системы
+            return uptime - int(fields[19]) / os.sysconf('SC_CLK_TCK')
+        if sys.platform == 'win32':
+            import ctypes
+            from ctypes import wintypes
+            created, exited, kernel, user, now = (wintypes.FILETIME() for _ in range(5))
+            ctypes.windll.kernel32.GetProcessTimes(ctypes.windll.kernel32.GetCurrentProcess(),
+                                                   ctypes.byref(created), ctypes.byref(exited),
+                                                   ctypes.byref(kernel), ctypes.byref(user))
+            ctypes.windll.kernel32.GetSystemTimeAsFileTime(ctypes.byref(now))
+            ticks = lambda ft: (ft.dwHighDateTime << 32) | ft.dwLowDateTime
+            # FILETIME считается в интервалах по 100 нс
+            return (ticks(now) - ticks(created)) / 10_000_000
+    except Exception as e:
+        print(f"Error reading process start time: {e}")
+    return None
+
+
+class StartupProfiler:
+    def __init__(self, clock=time.perf_counter, age=process_age):
+        self.clock = clock
+        # Время до первой строки main.py - это запуск интерпретатора
+        self.interpreter_start = age()
+        self.interpreter_label = 'interpreter start'
+        if self.interpreter_start is None:
+            # Без времени создания процесса есть только CPU-время, оно занижает оценку
+            self.interpreter_start = time.process_time()
+            self.interpreter_label = 'interpreter (CPU lower bound)'
+        self.started = clock()
+        self.phases = []
+
+
+
+    @contextmanager
+    def phase(self, name):
+        started = self.clock()
+        try:
+            yield
+        finally:
+            self.phases.append((name, self.clock() - started))
+
+
+
+    def total(self):
+        return self.clock() - self.started
+
+
+
+    def report(self):
+        lines = ['aPomodoro startup profile:',
+                 f'  {self.interpreter_label:<32}{self.interpreter_start * 1000:9.1f} ms']
+        for name, seconds in self.phases:
+            lines.append(f'  {name:<32}{seconds * 1000:9.1f} ms')
+        lines.append(f"  {'total since main.py started':<32}{self.total() * 1000:9.1f} ms")
+        return '\n'.join(lines)
@@ -0,0 +1,140 @@
+import pytest
+import threading
+import time
+from src.utils.background_writer import BackgroundWriter
+
+
+@pytest.fixture(scope='function')
+def writer():
+    background_writer = BackgroundWriter(max_pending=4)
+    yield background_writer
+    background_writer.close()
+
+
+
+def block_writer(writer):
+    gate = threading.Event()
+    writer.submit(gate.wait)
+    while writer.pending_count:
+        time.sleep(0.001)
+    return gate
+
+
+
+# Positive tests
+@pytest.mark.writer
+@pytest.mark.parametrize('count', [1, 10, 100])
+def test_writer_runs_all_jobs_in_order_positive(writer, count):
+    done = []
+    for i in range(count):
+        writer.submit(done.append, i)
+
+    assert writer.flush(timeout=5) is True
+    assert done == list(range(count))
+
+
+
+@pytest.mark.writer
+def test_writer_coalesces_same_key_positive(writer):
+    gate = block_writer(writer)
+    done = []
+
+    for value in ('first', 'second', 'third'):
+        writer.submit(done.append, value, key='settings')
+    assert writer.pending_count == 1
+
+    gate.set()
+    writer.flush(timeout=5)
+    assert done == ['third']
+
+
+
+@pytest.mark.writer
+def test_writer_runs_off_caller_thread_positive(writer):
+    threads = []
+    writer.submit(lambda: threads.append(threading.current_thread()))
+    writer.flush(timeout=5)
+
+    assert threads and threads[0] is not threading.current_thread()
+
+
+
+# Border tests
+@pytest.mark.writer
+def test_writer_bounded_queue_blocks_border(writer):
+    gate = block_writer(writer)
+    for i in range(writer.max_pending):
+        writer.submit(lambda: None)
+
+    submitted = threading.Event()
+    thread = threading.Thread(target=lambda: (writer.submit(lambda: None), submitted.set()))
+    thread.start()
+
+    assert not submitted.wait(0.1)
+    gate.set()
+    assert submitted.wait(5)
+    thread.join()
+
+
+
+@pytest.mark.writer
+def test_writer_submit_after_close_runs_inline_border(writer):
+    writer.close()
+    done = []
+    writer.submit(done.append, 1)
+    assert done == [1]
+
+
+
+@pytest.mark.writer
+def test_writer_retries_busy_job_without_blocking_queue_border():
+    writer = BackgroundWriter(retry_delay=0.05)
+    done = []
+    attempts = []
+
+    def busy_twice():
+        attempts.append(len(done))
+        if len(attempts) < 3:
+            raise TimeoutError('stats are locked')
+        done.append('saved')
+
+    writer.submit(busy_twice, retries=5)
+    writer.submit(done.append, 'other')
+
+    assert writer.flush(timeout=5) is True
+    writer.close()
+    # Пока задача ждала повтора, следующая выполнилась
+    assert done == ['other', 'saved']
+    assert len(attempts) == 3
+
+
+
+# Negative tests
+@pytest.mark.writer
+def test_writer_survives_failing_job_negative(writer):
+    done = []
+
+    def fail():
+        raise OSError('disk is gone')
+
+    writer.submit(fail)
+    writer.submit(done.append, 'after')
+
+    assert writer.flush(timeout=5) is True
+    assert done == ['after']
+
+
+
+@pytest.mark.writer
+def test_writer_gives_up_after_retries_negative(writer):
+    writer.retry_delay = 0.01
+    attempts = []
+
+    def always_busy():
+        attempts.append(1)
+        raise TimeoutError('stats are locked')
+
+    writer.submit(always_busy, retries=2)
+
+    assert writer.flush(timeout=5) is True
+    assert len(attempts) == 3
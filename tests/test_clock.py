@@ -0,0 +1,75 @@
+import pytest
+import time
+from src.core.clock import MonotonicClock, VirtualClock
+from src.core.scheduler import Scheduler
+from src.core.timer_state import TimerState
+
+
+# Positive tests
+@pytest.mark.clock
+def test_monotonic_clock_follows_system_positive():
+    clock = MonotonicClock()
+
+    assert clock.monotonic() == pytest.approx(time.monotonic(), abs=0.1)
+    assert clock.wall() == pytest.approx(time.time(), abs=0.1)
+
+
+
+@pytest.mark.clock
+def test_virtual_clock_drives_timer_state_positive():
+    clock = VirtualClock()
+    timer = TimerState(clock=clock)
+    timer.start_countdown()
+
+    clock.advance(600.25)
+
+    assert timer.sync_remaining() == pytest.approx(1500 - 600.25)
+    assert timer.current_time == 900
+
+
+
+@pytest.mark.clock
+def test_virtual_clock_drives_scheduler_positive():
+    clock = VirtualClock(start=50.0)
+    scheduler = Scheduler(clock=clock)
+    fired = []
+    scheduler.call_later(10, fired.append, 'done')
+
+    clock.advance_to(scheduler.next_due())
+    scheduler.run_pending()
+
+    assert fired == ['done']
+    assert clock() == 60.0
+
+
+
+# Border tests
+@pytest.mark.clock
+def test_virtual_clock_suspend_border():
+    clock = VirtualClock()
+    timer = TimerState(clock=clock)
+    timer.start_countdown()
+
+    # Система спала 10 минут: монотонные часы стояли, настенные ушли вперёд
+    clock.advance(1, wall_seconds=601)
+
+    assert timer.sync_remaining() == pytest.approx(1500 - 601)
+
+
+
+@pytest.mark.clock
+def test_virtual_clock_advance_to_exact_border():
+    clock = VirtualClock(start=0.1)
+    clock.advance_to(0.3)
+
+    assert clock.monotonic() == 0.3
+    clock.advance_to(0.2)
+    assert clock.monotonic() == 0.3
+
+
+
+# Negative tests
+@pytest.mark.clock
+def test_virtual_clock_cannot_go_back_negative():
+    with pytest.raises(ValueError):
+        VirtualClock().advance(-1)
@@ -0,0 +1,87 @@
+import pytest
+from unittest.mock import Mock
+from src.ui.display_renderer import DisplayRenderer
+
+
+@pytest.fixture(scope='function')
+def renderer():
+    yield DisplayRenderer()
+
+
+
+# Positive tests
+@pytest.mark.render
+def test_render_configure_once_for_same_value_positive(renderer):
+    widget = Mock()
+
+    renderer.configure(widget, text='25:00', text_color='#ff0505')
+    renderer.configure(widget, text='25:00', text_color='#ff0505')
+
+    widget.configure.assert_called_once_with(text='25:00', text_color='#ff0505')
+
+
+
+@pytest.mark.render
+def test_render_configure_only_changed_options_positive(renderer):
+    widget = Mock()
+
+    renderer.configure(widget, text='Pomodoro', text_color='#ff0505')
+    renderer.configure(widget, text='Short break', text_color='#ff0505')
+
+    widget.configure.assert_called_with(text='Short break')
+    assert renderer.applied_calls == 2
+    assert renderer.requested_calls == 2
+
+
+
+@pytest.mark.render
+@pytest.mark.parametrize('values, expected_calls', [
+    (['aPomodoro', 'aPomodoro'], 1),
+    (['24:59 - aPomodoro', '24:58 - aPomodoro'], 2),
+    (['aPomodoro', 'x', 'aPomodoro'], 3),
+])
+def test_render_update_setter_positive(renderer, values, expected_calls):
+    root = Mock()
+    for value in values:
+        renderer.update(root, 'title', value, root.title)
+
+    assert root.title.call_count == expected_calls
+
+
+
+# Border tests
+@pytest.mark.render
+def test_render_invalidate_forces_redraw_border(renderer):
+    widget = Mock()
+    renderer.configure(widget, fg_color='#51c1e6')
+
+    renderer.invalidate()
+    renderer.configure(widget, fg_color='#51c1e6')
+
+    assert widget.configure.call_count == 2
+
+
+
+@pytest.mark.render
+def test_render_widgets_tracked_separately_border(renderer):
+    first, second = Mock(), Mock()
+
+    renderer.configure(first, text='● ○ ○ ○')
+    renderer.configure(second, text='● ○ ○ ○')
+
+    first.configure.assert_called_once()
+    second.configure.assert_called_once()
+
+
+
+# Negative tests
+@pytest.mark.render
+def test_render_failed_configure_is_retried_negative(renderer):
+    widget = Mock()
+    widget.configure.side_effect = [RuntimeError('widget destroyed'), None]
+
+    with pytest.raises(RuntimeError):
+        renderer.configure(widget, text='25:00')
+    renderer.configure(widget, text='25:00')
+
+    assert widget.configure.call_count == 2
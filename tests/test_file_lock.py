@@ -0,0 +1,87 @@
+import pytest
+import os
+import tempfile
+import threading
+import time
+from src.utils.file_lock import FileLock
+
+
+@pytest.fixture(scope='function')
+def lock_path():
+    temp_dir = tempfile.mkdtemp()
+    yield os.path.join(temp_dir, 'data.lock')
+
+    for name in os.listdir(temp_dir):
+        os.remove(os.path.join(temp_dir, name))
+    os.rmdir(temp_dir)
+
+
+
+# Positive tests
+def test_file_lock_acquire_release_positive(lock_path):
+    lock = FileLock(lock_path)
+
+    with lock:
+        assert lock.is_locked
+        assert os.path.exists(lock_path)
+    assert not lock.is_locked
+
+
+
+def test_file_lock_excludes_other_holders_positive(lock_path):
+    first = FileLock(lock_path)
+    acquired = []
+
+    def take_second():
+        with FileLock(lock_path, timeout=5.0):
+            acquired.append(time.monotonic())
+
+    with first:
+        thread = threading.Thread(target=take_second)
+        thread.start()
+        time.sleep(0.1)
+        assert acquired == []
+        released = time.monotonic()
+    thread.join(5)
+
+    assert len(acquired) == 1
+    assert acquired[0] >= released
+
+
+
+# Border tests
+def test_file_lock_reentrant_border(lock_path):
+    lock = FileLock(lock_path)
+
+    with lock:
+        with lock:
+            assert lock.is_locked
+        assert lock.is_locked
+        with pytest.raises(TimeoutError):
+            FileLock(lock_path, timeout=0.05).acquire()
+    assert not lock.is_locked
+
+
+
+def test_file_lock_release_without_acquire_border(lock_path):
+    lock = FileLock(lock_path)
+    lock.release()
+    assert not lock.is_locked
+
+
+
+# Negative tests
+def test_file_lock_timeout_negative(lock_path):
+    with FileLock(lock_path):
+        started = time.monotonic()
+        with pytest.raises(TimeoutError):
+            FileLock(lock_path, timeout=0.1).acquire()
+        assert time.monotonic() - started >= 0.1
+
+
+
+def test_file_lock_missing_directory_negative(lock_path):
+    lock = FileLock(os.path.join(lock_path + '_missing', 'data.lock'))
+    with pytest.raises(OSError):
+        lock.acquire()
+    assert not lock.is_locked
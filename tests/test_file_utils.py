@@ -0,0 +1,104 @@
+import pytest
+import json
+import os
+import tempfile
+from unittest.mock import patch
+from src.utils import file_utils
+from src.utils.file_utils import atomic_write_bytes, atomic_write_json
+
+
+@pytest.fixture(scope='function')
+def target():
+    temp_dir = tempfile.mkdtemp()
+    yield os.path.join(temp_dir, 'data.json')
+
+    for name in os.listdir(temp_dir):
+        os.remove(os.path.join(temp_dir, name))
+    os.rmdir(temp_dir)
+
+
+
+# Positive tests
+@pytest.mark.parametrize('data', [
+    {},
+    {'pomodoro_time': 1500},
+    {'2025-01-01': {'pomodoros': 4, 'work_time': 6000}},
+])
+def test_atomic_write_roundtrip_positive(target, data):
+    atomic_write_json(target, data)
+
+    with open(target, encoding='utf-8') as f:
+        assert json.load(f) == data
+    assert os.listdir(os.path.dirname(target)) == ['data.json']
+
+
+
+def test_atomic_write_bytes_replaces_file_positive(target):
+    atomic_write_bytes(target, b'old record')
+    atomic_write_bytes(target, b'\x00\x01new')
+
+    with open(target, 'rb') as f:
+        assert f.read() == b'\x00\x01new'
+    assert os.listdir(os.path.dirname(target)) == ['data.json']
+
+
+
+def test_atomic_write_retries_replace_while_file_is_read_positive(target, monkeypatch):
+    # Эмулируем Windows: первые подмены отклоняются, пока файл открыт читателем
+    atomic_write_bytes(target, b'old')
+    monkeypatch.setattr(file_utils, 'RETRY_REPLACE', True)
+    monkeypatch.setattr(file_utils, 'REPLACE_RETRY_DELAY', 0)
+    real_replace = os.replace
+    attempts = []
+
+    def busy_replace(source, destination):
+        attempts.append(source)
+        if len(attempts) < 3:
+            raise PermissionError('The process cannot access the file')
+        real_replace(source, destination)
+
+    with patch('os.replace', side_effect=busy_replace):
+        atomic_write_bytes(target, b'new')
+
+    assert len(attempts) == 3
+    with open(target, 'rb') as f:
+        assert f.read() == b'new'
+    assert os.listdir(os.path.dirname(target)) == ['data.json']
+
+
+
+# Negative tests
+def test_atomic_write_failure_keeps_old_file_negative(target):
+    atomic_write_json(target, {'old': 1})
+
+    with patch('os.replace', side_effect=OSError('disk full')):
+        with pytest.raises(OSError):
+            atomic_write_json(target, {'new': 2})
+
+    with open(target, encoding='utf-8') as f:
+        assert json.load(f) == {'old': 1}
+    assert os.listdir(os.path.dirname(target)) == ['data.json']
+
+
+
+def test_atomic_write_unserializable_negative(target):
+    with pytest.raises(TypeError):
+        atomic_write_json(target, {'bad': object()})
+
+    assert not os.path.exists(target)
+
+
+
+def test_atomic_write_replace_gives_up_negative(target, monkeypatch):
+    atomic_write_bytes(target, b'old')
+    monkeypatch.setattr(file_utils, 'RETRY_REPLACE', True)
+    monkeypatch.setattr(file_utils, 'REPLACE_RETRY_DELAY', 0)
+
+    with patch('os.replace', side_effect=PermissionError('locked')) as replace:
+        with pytest.raises(PermissionError):
+            atomic_write_bytes(target, b'new')
+
+    assert replace.call_count == file_utils.REPLACE_ATTEMPTS
+    with open(target, 'rb') as f:
+        assert f.read() == b'old'
+    assert os.listdir(os.path.dirname(target)) == ['data.json']
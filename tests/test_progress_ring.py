@@ -0,0 +1,81 @@
+import pytest
+from src.ui.progress_ring import EXTENT_STEPS, GRADIENT_STEPS, arc_step, next_frame_delay, ring_gradient
+
+
+# Positive tests
+@pytest.mark.render
+def test_ring_gradient_fades_towards_end_positive():
+    gradient = ring_gradient('#ff0505')
+
+    assert len(gradient) == GRADIENT_STEPS
+    assert gradient[-1] == '#ff0505'
+    assert gradient[0] == '#ff5c5c'
+
+
+
+@pytest.mark.render
+def test_ring_gradient_is_cached_positive():
+    assert ring_gradient('#51c1e6') is ring_gradient('#51c1e6')
+
+
+
+@pytest.mark.render
+def test_ring_skips_sub_step_changes_positive():
+    # 25 минут: за 1/30 секунды дуга не сдвигается на четверть градуса
+    period = 25 * 60
+    assert arc_step(1 - 10.0 / period) == arc_step(1 - (10.0 + 1 / 30) / period)
+    assert arc_step(1 - 10.0 / period) != arc_step(1 - 12.0 / period)
+
+
+
+@pytest.mark.render
+def test_ring_frame_waits_for_next_step_positive():
+    # 25 минут: шаг дуги длится 1500 / 1440 с, кадры чаще не нужны даже при 30 fps
+    period = 25 * 60
+    progress = (EXTENT_STEPS - 0.5) / EXTENT_STEPS
+    delay = next_frame_delay(progress, period, fps=30)
+
+    assert delay == pytest.approx(1000 * period / EXTENT_STEPS, abs=1)
+    assert arc_step(progress - delay / 1000 / period) != arc_step(progress + 1e-9)
+
+
+
+@pytest.mark.render
+def test_ring_frame_capped_by_fps_positive():
+    # Короткий период: шаги чаще кадров, ограничивает fps
+    assert next_frame_delay(0.5, 10, fps=30) == 33
+    assert next_frame_delay(0.5, 10, fps=5) == 200
+
+
+
+# Border tests
+@pytest.mark.render
+@pytest.mark.parametrize('progress, expected_step', [
+    (0.0, 0),
+    (1.0, EXTENT_STEPS),
+    (0.5, EXTENT_STEPS // 2),
+])
+def test_ring_arc_step_border(progress, expected_step):
+    assert arc_step(progress) == expected_step
+
+
+
+# Negative tests
+@pytest.mark.render
+@pytest.mark.parametrize('progress, expected_step', [
+    (-0.5, 0),
+    (1.7, EXTENT_STEPS),
+])
+def test_ring_arc_step_clamped_negative(progress, expected_step):
+    assert arc_step(progress) == expected_step
+
+
+
+@pytest.mark.render
+@pytest.mark.parametrize('progress, duration', [
+    (0.0, 1500),
+    (0.5, None),
+    (0.5, 0),
+])
+def test_ring_frame_delay_without_rate_negative(progress, duration):
+    assert next_frame_delay(progress, duration, fps=30) == 33
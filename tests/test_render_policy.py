@@ -0,0 +1,106 @@
+import pytest
+from types import SimpleNamespace
+from src.ui.render_policy import RenderPolicy
+
+
+class FakeRoot:
+    def __init__(self):
+        self.bindings = {}
+        self.focus = 'entry'
+
+    def bind(self, sequence, callback, add=None):
+        self.bindings[sequence] = callback
+
+    def after_idle(self, callback):
+        callback()
+
+    def focus_get(self):
+        return self.focus
+
+    def fire(self, sequence, widget=None, **fields):
+        self.bindings[sequence](SimpleNamespace(widget=widget or self, **fields))
+
+
+@pytest.fixture(scope='function')
+def policy():
+    root = FakeRoot()
+    changes = []
+    yield RenderPolicy(root, lambda mode, previous: changes.append((previous, mode))), root, changes
+
+
+
+# Positive tests
+@pytest.mark.render
+def test_policy_minimize_and_restore_positive(policy):
+    render_policy, root, changes = policy
+
+    root.fire('<Unmap>')
+    assert render_policy.mode == 'title'
+    assert render_policy.is_visible is False
+
+    root.fire('<Map>')
+    assert render_policy.mode == 'full'
+    assert changes == [('full', 'title'), ('title', 'full')]
+
+
+
+@pytest.mark.render
+def test_policy_unfocused_window_is_background_positive(policy):
+    render_policy, root, changes = policy
+
+    root.focus = None
+    root.fire('<FocusOut>')
+    assert render_policy.mode == 'background'
+    assert render_policy.is_visible is True
+
+    root.fire('<FocusIn>')
+    assert render_policy.mode == 'full'
+
+
+
+# Border tests
+@pytest.mark.render
+def test_policy_fully_obscured_border(policy):
+    render_policy, root, changes = policy
+
+    root.fire('<Visibility>', state='VisibilityFullyObscured')
+    assert render_policy.mode == 'title'
+    root.fire('<Visibility>', state='VisibilityPartiallyObscured')
+    assert render_policy.mode == 'full'
+
+
+
+@pytest.mark.render
+def test_policy_focus_moves_inside_window_border(policy):
+    render_policy, root, changes = policy
+
+    root.fire('<FocusOut>')
+    assert render_policy.mode == 'full'
+    assert changes == []
+
+
+
+@pytest.mark.render
+def test_policy_hidden_mode_none_border():
+    root = FakeRoot()
+    render_policy = RenderPolicy(root, hidden_mode='none')
+
+    root.fire('<Unmap>')
+    assert render_policy.mode == 'none'
+
+
+
+# Negative tests
+@pytest.mark.render
+def test_policy_ignores_child_widget_events_negative(policy):
+    render_policy, root, changes = policy
+
+    root.fire('<Unmap>', widget=object())
+    assert render_policy.mode == 'full'
+
+
+
+@pytest.mark.render
+def test_policy_unknown_hidden_mode_negative():
+    with pytest.raises(ValueError):
+        RenderPolicy(FakeRoot(), hidden_mode='skip')
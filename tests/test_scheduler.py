@@ -0,0 +1,69 @@
+import pytest
+import threading
+from src.core.scheduler import Scheduler
+
+
+@pytest.fixture(scope='function')
+def clocked_scheduler():
+    now = [0.0]
+    scheduler = Scheduler(clock=lambda: now[0])
+    yield scheduler, now
+
+
+
+# Positive tests
+@pytest.mark.scheduler
+def test_scheduler_runs_due_in_order_positive(clocked_scheduler):
+    scheduler, now = clocked_scheduler
+    calls = []
+    scheduler.call_later(2.0, calls.append, 'second')
+    scheduler.call_later(1.0, calls.append, 'first')
+    scheduler.call_later(5.0, calls.append, 'later')
+
+    now[0] = 2.0
+    assert scheduler.run_pending() == 2
+    assert calls == ['first', 'second']
+    assert scheduler.next_due() == 5.0
+
+
+
+@pytest.mark.scheduler
+def test_scheduler_run_forever_in_thread_positive():
+    scheduler = Scheduler()
+    done = threading.Event()
+    scheduler.call_later(0.01, done.set)
+
+    thread = threading.Thread(target=scheduler.run_forever)
+    thread.start()
+    assert done.wait(2)
+    scheduler.stop()
+    thread.join(2)
+    assert not thread.is_alive()
+
+
+
+# Border tests
+@pytest.mark.scheduler
+@pytest.mark.parametrize('delay', [0, -5])
+def test_scheduler_non_positive_delay_border(clocked_scheduler, delay):
+    scheduler, now = clocked_scheduler
+    calls = []
+    scheduler.call_later(delay, calls.append, 'now')
+
+    assert scheduler.run_pending() == 1
+    assert calls == ['now']
+
+
+
+# Negative tests
+@pytest.mark.scheduler
+def test_scheduler_cancelled_job_skipped_negative(clocked_scheduler):
+    scheduler, now = clocked_scheduler
+    calls = []
+    job = scheduler.call_later(1.0, calls.append, 'cancelled')
+    scheduler.cancel(job)
+
+    now[0] = 10.0
+    assert scheduler.run_pending() == 0
+    assert scheduler.next_due() is None
+    assert calls == []
@@ -0,0 +1,209 @@
+import pytest
+import os
+import tempfile
+from src.core.session_checkpoint import (CHECKPOINT_SIZE, MAX_CATCH_UP_PERIODS, SessionCheckpoint, catch_up,
+                                         missed_pomodoro_days)
+from src.core.timer_state import TimerState
+
+
+@pytest.fixture(scope='function')
+def checkpoint():
+    temp_dir = tempfile.mkdtemp()
+    clock = {'mono': 1000.0, 'wall': 1700000000.0}
+
+    def make_timer():
+        timer = TimerState()
+        timer.clock = lambda: clock['mono']
+        timer.wall_clock = lambda: clock['wall']
+        return timer
+
+    session_checkpoint = SessionCheckpoint()
+    session_checkpoint.checkpoint_file = os.path.join(temp_dir, 'aPomodoro_session.bin')
+
+    yield session_checkpoint, make_timer, clock
+
+    for name in os.listdir(temp_dir):
+        os.remove(os.path.join(temp_dir, name))
+    os.rmdir(temp_dir)
+
+
+class FakeStatsManager:
+    def __init__(self):
+        self.merged = []
+
+    def merge_days(self, days):
+        self.merged.append(days)
+        return True
+
+
+def make_record(**fields):
+    record = {
+        'is_running': True, 'is_pomodoro_mode': True, 'cycle_count': 0,
+        'deadline': 1500.0, 'remaining': 1500.0,
+        'pomodoro_time': 1500, 'short_break_time': 300, 'long_break_time': 900
+    }
+    record.update(fields)
+    return record
+
+
+
+# Positive tests
+@pytest.mark.checkpoint
+def test_checkpoint_restores_running_period_after_crash_positive(checkpoint):
+    session_checkpoint, make_timer, clock = checkpoint
+    timer = make_timer()
+    timer.cycle_count = 2
+    timer.start_countdown()
+    clock['mono'] += 100.5
+    clock['wall'] += 100.5
+    assert session_checkpoint.save(timer) is True
+
+    # Процесс убит; новый запуск через 10 минут по настенным часам
+    clock['wall'] += 600
+    restored = make_timer()
+    completed, resume = session_checkpoint.restore(restored, auto_start_delay=2.0)
+
+    assert completed == []
+    assert resume is True
+    assert restored.cycle_count == 2
+    assert restored.is_pomodoro_mode is True
+    assert restored.get_remaining() == pytest.approx(1500 - 700.5)
+    assert restored.is_running is False
+
+
+
+@pytest.mark.checkpoint
+def test_checkpoint_restores_paused_state_positive(checkpoint):
+    session_checkpoint, make_timer, clock = checkpoint
+    timer = make_timer()
+    timer.is_pomodoro_mode = False
+    timer.cycle_count = 3
+    timer.current_time = timer.short_break_time
+    timer.start_countdown()
+    clock['mono'] += 42.25
+    timer.stop_countdown()
+    session_checkpoint.save(timer)
+
+    clock['wall'] += 86400
+    restored = make_timer()
+    completed, resume = session_checkpoint.restore(restored, auto_start_delay=2.0)
+
+    assert (completed, resume) == ([], False)
+    assert restored.get_current_period() == 'short_break'
+    assert restored.get_remaining() == pytest.approx(300 - 42.25)
+
+
+
+@pytest.mark.checkpoint
+def test_checkpoint_catch_up_with_auto_start_positive():
+    # Помидор кончился в 1500, перерыв 300 после паузы 2 с, затем новый помидор
+    record, completed = catch_up(make_record(), now=1500 + 2 + 300 + 2 + 100, auto_start_delay=2.0)
+
+    assert completed == [('pomodoro', 1500, 1500), ('short_break', 1802, 300)]
+    assert record['is_pomodoro_mode'] is True
+    assert record['cycle_count'] == 1
+    assert record['remaining'] == pytest.approx(1400)
+
+
+
+@pytest.mark.checkpoint
+def test_checkpoint_pack_is_fixed_size_positive(checkpoint):
+    session_checkpoint, make_timer, clock = checkpoint
+    timer = make_timer()
+
+    assert len(session_checkpoint.pack(timer)) == CHECKPOINT_SIZE
+    timer.start_countdown()
+    assert len(session_checkpoint.pack(timer)) == CHECKPOINT_SIZE
+
+
+
+@pytest.mark.checkpoint
+def test_checkpoint_missed_pomodoros_credited_once_positive(checkpoint):
+    session_checkpoint, make_timer, clock = checkpoint
+    stats_manager = FakeStatsManager()
+    timer = make_timer()
+    timer.start_countdown()
+    session_checkpoint.save(timer)
+
+    # Падение, затем два запуска подряд через 10 часов, без изменений состояния между ними
+    clock['wall'] += 10 * 3600
+    for _ in range(2):
+        restored = make_timer()
+        completed, resume = session_checkpoint.restore(restored, auto_start_delay=2.0)
+        days = missed_pomodoro_days(completed)
+        if days:
+            assert session_checkpoint.commit_catch_up(stats_manager, days,
+                                                      session_checkpoint.pack(restored)) is True
+
+    assert len(stats_manager.merged) == 1
+    assert sum(day['pomodoros'] for day in stats_manager.merged[0].values()) == 4
+    assert sum(day['work_time'] for day in stats_manager.merged[0].values()) == 4 * 1500
+    assert resume is False
+
+
+
+# Border tests
+@pytest.mark.checkpoint
+def test_checkpoint_catch_up_without_auto_start_border():
+    record, completed = catch_up(make_record(cycle_count=3), now=100000.0, auto_start_delay=None)
+
+    assert completed == [('pomodoro', 1500, 1500)]
+    assert record['is_running'] is False
+    assert record['cycle_count'] == 0
+    assert record['remaining'] == 900.0
+
+
+
+@pytest.mark.checkpoint
+def test_checkpoint_catch_up_stops_after_one_cycle_border():
+    # Неделя простоя с автостартом засчитывает не больше одного цикла
+    record, completed = catch_up(make_record(), now=1500 + 7 * 86400.0, auto_start_delay=2.0)
+
+    assert len(completed) == MAX_CATCH_UP_PERIODS
+    assert [period for period, ended_at, duration in completed].count('pomodoro') == 4
+    assert completed[-1][0] == 'long_break'
+    assert record['is_running'] is False
+    assert record['deadline'] == 0.0
+    assert record['is_pomodoro_mode'] is True
+    assert record['remaining'] == 1500.0
+
+
+
+@pytest.mark.checkpoint
+def test_checkpoint_inside_auto_start_gap_border():
+    record, completed = catch_up(make_record(), now=1501.0, auto_start_delay=2.0)
+
+    assert completed == [('pomodoro', 1500, 1500)]
+    assert record['is_running'] is True
+    assert record['remaining'] == 300.0
+
+
+
+@pytest.mark.checkpoint
+def test_checkpoint_missing_file_border(checkpoint):
+    session_checkpoint, make_timer, clock = checkpoint
+    timer = make_timer()
+
+    assert session_checkpoint.restore(timer) == ([], False)
+    assert timer.current_time == 25 * 60
+
+
+
+# Negative tests
+@pytest.mark.checkpoint
+@pytest.mark.parametrize('damage', [
+    lambda data: data[:-1],
+    lambda data: data[:10] + bytes([data[10] ^ 0xff]) + data[11:],
+    lambda data: b'XXXX' + data[4:],
+    lambda data: data + b'\x00',
+])
+def test_checkpoint_damaged_file_ignored_negative(checkpoint, damage):
+    session_checkpoint, make_timer, clock = checkpoint
+    timer = make_timer()
+    timer.start_countdown()
+    with open(session_checkpoint.checkpoint_file, 'wb') as f:
+        f.write(damage(session_checkpoint.pack(timer)))
+
+    restored = make_timer()
+    assert session_checkpoint.restore(restored) == ([], False)
+    assert restored.current_time == 25 * 60
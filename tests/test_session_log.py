@@ -0,0 +1,192 @@
+import pytest
+import os
+import tempfile
+from datetime import datetime
+from src.core.clock import VirtualClock
+from src.core.session_log import INDEX_FORMAT, RECORD_FORMAT, SessionLog, SessionTracker
+
+
+# Понедельник, 2024-03-04 09:00 по местному времени
+MONDAY_9AM = datetime(2024, 3, 4, 9, 0).timestamp()
+
+
+@pytest.fixture(scope='function')
+def session_log():
+    temp_dir = tempfile.mkdtemp()
+
+    log = SessionLog()
+    log.data_file = os.path.join(temp_dir, 'aPomodoro_sessions.bin')
+
+    yield log
+
+    for name in os.listdir(temp_dir):
+        os.remove(os.path.join(temp_dir, name))
+    os.rmdir(temp_dir)
+
+
+def make_record(start, period='pomodoro', status='completed', focus_time=1500, pauses=0):
+    return {'start': start, 'end': start + focus_time, 'period': period,
+            'status': status, 'focus_time': focus_time, 'pauses': pauses}
+
+
+
+# Positive tests
+@pytest.mark.sessions
+def test_tracker_counts_pauses_and_focus_time_positive():
+    clock = VirtualClock(wall_start=MONDAY_9AM)
+    tracker = SessionTracker(clock.wall)
+
+    tracker.begin('pomodoro')
+    clock.advance(600)
+    tracker.pause()
+    clock.advance(300)
+    tracker.resume()
+    clock.advance(900)
+    record = tracker.finish('completed')
+
+    assert record['focus_time'] == 1500
+    assert record['pauses'] == 1
+    assert record['end'] - record['start'] == 1800
+    assert tracker.active is False
+
+
+
+@pytest.mark.sessions
+def test_session_log_roundtrip_positive(session_log):
+    session_log.append(make_record(MONDAY_9AM, pauses=2))
+    session_log.append(make_record(MONDAY_9AM + 1800, period='short_break', focus_time=300))
+
+    records = session_log.query(MONDAY_9AM, MONDAY_9AM + 3600)
+
+    assert [record['period'] for record in records] == ['pomodoro', 'short_break']
+    assert records[0]['pauses'] == 2
+    assert records[0]['start'] == MONDAY_9AM
+
+
+
+@pytest.mark.sessions
+def test_session_log_heatmap_by_weekday_and_hour_positive(session_log):
+    for day in range(3):
+        for hour in (9, 9.5, 14):
+            session_log.append(make_record(MONDAY_9AM + day * 86400 + (hour - 9) * 3600))
+    session_log.append(make_record(MONDAY_9AM + 2 * 86400 + 6 * 3600, status='reset', focus_time=200))
+
+    heatmap = session_log.hour_heatmap()
+    resets = session_log.hour_heatmap(value='reset')
+
+    assert heatmap[0][9] == 2
+    assert heatmap[1][14] == 1
+    assert heatmap[2][9] == 2
+    assert heatmap[2][15] == 1
+    assert resets[2][15] == 1
+    assert resets[0][9] == 0
+    assert sum(map(sum, heatmap)) == 10
+
+
+
+@pytest.mark.sessions
+def test_session_log_query_reads_only_range_positive(session_log, monkeypatch):
+    for day in range(365):
+        session_log.append(make_record(MONDAY_9AM + day * 86400))
+
+    reads = []
+    original = session_log._read_records
+    monkeypatch.setattr(session_log, '_read_records',
+                        lambda first, last: reads.append(last - first) or original(first, last))
+
+    records = session_log.query(MONDAY_9AM + 100 * 86400, MONDAY_9AM + 107 * 86400)
+
+    assert len(records) == 7
+    assert reads == [7]
+
+
+
+@pytest.mark.sessions
+def test_session_log_summary_positive(session_log):
+    session_log.append(make_record(MONDAY_9AM, pauses=1))
+    session_log.append(make_record(MONDAY_9AM + 1800, status='reset', focus_time=400, pauses=2))
+    session_log.append(make_record(MONDAY_9AM + 2100, period='long_break', focus_time=900))
+
+    summary = session_log.summary()
+
+    assert summary == {'pomodoros': 2, 'completed': 1, 'reset': 1, 'pauses': 3, 'focus_time': 1900}
+
+
+
+@pytest.mark.sessions
+def test_session_log_interrupted_part_is_not_a_pomodoro_positive(session_log):
+    # Закрыли приложение посреди помидора и досидели его после запуска
+    session_log.append(make_record(MONDAY_9AM, status='interrupted', focus_time=600))
+    session_log.append(make_record(MONDAY_9AM + 900, focus_time=900, pauses=1))
+
+    summary = session_log.summary()
+
+    assert summary == {'pomodoros': 1, 'completed': 1, 'reset': 0, 'pauses': 1, 'focus_time': 1500}
+    assert len(session_log.query(MONDAY_9AM, MONDAY_9AM + 3600)) == 2
+
+
+
+# Border tests
+@pytest.mark.sessions
+def test_session_log_reopen_uses_saved_index_border(session_log):
+    for i in range(5):
+        session_log.append(make_record(MONDAY_9AM + i * 3600))
+
+    reopened = SessionLog()
+    reopened.data_file = session_log.data_file
+
+    assert len(reopened) == 5
+    assert os.path.getsize(reopened.index_file) == 5 * INDEX_FORMAT.size
+    assert len(reopened.query(MONDAY_9AM, MONDAY_9AM + 5 * 3600)) == 5
+
+
+
+@pytest.mark.sessions
+def test_session_log_empty_border(session_log):
+    assert len(session_log) == 0
+    assert session_log.query(0, MONDAY_9AM * 2) == []
+    assert session_log.summary()['pomodoros'] == 0
+
+
+
+@pytest.mark.sessions
+def test_tracker_finish_without_session_border():
+    assert SessionTracker(VirtualClock().wall).finish('reset') is None
+
+
+
+# Negative tests
+@pytest.mark.sessions
+def test_session_log_rebuilds_stale_index_negative(session_log):
+    for i in range(3):
+        session_log.append(make_record(MONDAY_9AM + i * 3600))
+    os.remove(session_log.index_file)
+
+    reopened = SessionLog()
+    reopened.data_file = session_log.data_file
+
+    assert reopened.summary()['pomodoros'] == 3
+    assert os.path.exists(reopened.index_file)
+
+
+
+@pytest.mark.sessions
+def test_session_log_torn_record_overwritten_negative(session_log):
+    session_log.append(make_record(MONDAY_9AM))
+    with open(session_log.data_file, 'ab') as f:
+        f.write(b'\x01\x02\x03')
+
+    reopened = SessionLog()
+    reopened.data_file = session_log.data_file
+    reopened.append(make_record(MONDAY_9AM + 3600))
+
+    assert len(reopened) == 2
+    assert os.path.getsize(reopened.data_file) == 2 * RECORD_FORMAT.size
+    assert len(reopened.query(MONDAY_9AM, MONDAY_9AM + 7200)) == 2
+
+
+
+@pytest.mark.sessions
+def test_session_log_unknown_heatmap_value_negative(session_log):
+    with pytest.raises(ValueError):
+        session_log.hour_heatmap(value='mood')
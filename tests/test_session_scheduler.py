@@ -0,0 +1,131 @@
+import pytest
+import threading
+from src.core.session_scheduler import SessionScheduler, TimerSession
+
+
+@pytest.fixture(scope='function')
+def sessions():
+    now = [0.0]
+    finished = []
+    scheduler = SessionScheduler(
+        clock=lambda: now[0],
+        on_period_finished=lambda session, completed, next_period: finished.append(
+            (session.session_id, completed, next_period)))
+    yield scheduler, now, finished
+
+
+
+# Positive tests
+@pytest.mark.sessions
+def test_sessions_finish_in_deadline_order_positive(sessions):
+    scheduler, now, finished = sessions
+    scheduler.add_session('late', pomodoro_time=30)
+    scheduler.add_session('early', pomodoro_time=10)
+    scheduler.add_session('middle', pomodoro_time=20)
+
+    now[0] = 25
+    assert scheduler.run_due() == 2
+    assert [item[0] for item in finished] == ['early', 'middle']
+    assert scheduler.next_deadline() == 30
+
+
+
+@pytest.mark.sessions
+def test_sessions_full_cycle_positive(sessions):
+    scheduler, now, finished = sessions
+    scheduler.add_session('room', pomodoro_time=10, short_break_time=2, long_break_time=5)
+
+    now[0] = 4 * 10 + 3 * 2
+    scheduler.run_due()
+
+    periods = [item[2] for item in finished]
+    assert periods == ['short_break', 'pomodoro'] * 3 + ['long_break']
+    assert scheduler.remaining('room') == 5
+
+
+
+@pytest.mark.sessions
+def test_sessions_pause_and_resume_positive(sessions):
+    scheduler, now, finished = sessions
+    scheduler.add_session('user', pomodoro_time=10)
+
+    now[0] = 4
+    scheduler.pause('user')
+    now[0] = 100
+    assert scheduler.run_due() == 0
+    assert scheduler.remaining('user') == 6
+
+    scheduler.start('user')
+    assert scheduler.next_deadline() == 106
+
+
+
+@pytest.mark.sessions
+def test_sessions_run_forever_thread_positive():
+    done = threading.Event()
+    scheduler = SessionScheduler(on_period_finished=lambda *args: done.set())
+    thread = threading.Thread(target=scheduler.run_forever)
+    thread.start()
+
+    scheduler.add_session('quick', pomodoro_time=0.02)
+    assert done.wait(2)
+    scheduler.stop()
+    thread.join(2)
+    assert not thread.is_alive()
+
+
+
+# Border tests
+@pytest.mark.sessions
+def test_sessions_slots_border():
+    session = TimerSession('compact')
+    assert not hasattr(session, '__dict__')
+    with pytest.raises(AttributeError):
+        session.extra = 1
+
+
+
+@pytest.mark.sessions
+@pytest.mark.parametrize('count', [1, 100, 5000])
+def test_sessions_many_due_at_once_border(sessions, count):
+    scheduler, now, finished = sessions
+    for i in range(count):
+        scheduler.add_session(i, pomodoro_time=10)
+
+    now[0] = 10
+    assert scheduler.run_due() == count
+    assert len(scheduler.sessions) == count
+
+
+
+@pytest.mark.sessions
+def test_sessions_heap_compacted_border(sessions):
+    scheduler, now, finished = sessions
+    for i in range(100):
+        scheduler.add_session(i, pomodoro_time=10)
+    for i in range(80):
+        scheduler.pause(i)
+
+    assert len(scheduler._heap) < 100
+
+
+
+# Negative tests
+@pytest.mark.sessions
+def test_sessions_removed_never_fire_negative(sessions):
+    scheduler, now, finished = sessions
+    scheduler.add_session('gone', pomodoro_time=10)
+    scheduler.remove_session('gone')
+
+    now[0] = 100
+    assert scheduler.run_due() == 0
+    assert scheduler.next_deadline() is None
+
+
+
+@pytest.mark.sessions
+def test_sessions_duplicate_id_negative(sessions):
+    scheduler, now, finished = sessions
+    scheduler.add_session('room')
+    with pytest.raises(ValueError):
+        scheduler.add_session('room')
@@ -0,0 +1,75 @@
+import pytest
+from src.core.clock import VirtualClock
+from unittest.mock import patch
+from src.core.simulation import CountingSoundManager, CycleSimulation
+
+
+# Positive tests
+@pytest.mark.simulation
+@pytest.mark.parametrize('transitions', [8, 1000, 20000])
+def test_simulation_keeps_invariants_positive(transitions):
+    report = CycleSimulation().run(transitions)
+
+    assert report['violations'] == []
+    assert report['transitions'] == transitions
+    assert sum(report['completed'].values()) == transitions
+
+
+
+@pytest.mark.simulation
+def test_simulation_full_cycle_positive():
+    simulation = CycleSimulation(pomodoro_time=1500, short_break_time=300,
+                                 long_break_time=900, auto_start_delay=2.0)
+    report = simulation.run(8)
+
+    assert report['completed'] == {'pomodoro': 4, 'short_break': 3, 'long_break': 1}
+    assert report['totals']['pomodoros'] == 4
+    assert report['totals']['work_time'] == 4 * 1500
+    assert report['virtual_seconds'] == pytest.approx(4 * 1500 + 3 * 300 + 900 + 8 * 2.0)
+    assert report['sounds'] == {'soft_bell': 5, 'notification': 3}
+
+
+
+# Border tests
+@pytest.mark.simulation
+def test_simulation_popup_only_plays_nothing_border():
+    report = CycleSimulation(notification_type='popup').run(100)
+
+    assert report['sounds'] == {}
+    assert report['violations'] == []
+
+
+
+@pytest.mark.simulation
+def test_simulation_crosses_midnight_border():
+    # 2000 минутных периодов - больше суток виртуального времени
+    clock = VirtualClock(wall_start=1700006340.0)
+    report = CycleSimulation(clock=clock, pomodoro_time=60, short_break_time=60,
+                             auto_start_delay=None).run(2000)
+
+    assert report['totals']['active_days'] >= 2
+    assert report['violations'] == []
+
+
+
+@pytest.mark.simulation
+def test_counting_sound_manager_never_opens_mixer_border():
+    with patch('pygame.mixer.init') as mixer_init:
+        sound_manager = CountingSoundManager()
+
+    assert sound_manager.wait_ready(0)
+    assert sound_manager.available is False
+    assert 'bell' in sound_manager.sounds
+    mixer_init.assert_not_called()
+
+
+
+# Negative tests
+@pytest.mark.simulation
+def test_simulation_detects_broken_cycle_negative(monkeypatch):
+    import src.core.simulation as simulation_module
+    monkeypatch.setattr(simulation_module, 'POMODOROS_PER_CYCLE', 3)
+
+    report = CycleSimulation().run(16)
+
+    assert any('followed by' in violation for violation in report['violations'])
@@ -0,0 +1,81 @@
+import pytest
+from unittest.mock import Mock
+from src.utils.sound_cache import SoundCache
+
+
+CATALOG = {'bell': 'bell.wav', 'gong': 'gong.wav', 'chime': 'chime.wav', 'none': None}
+
+
+@pytest.fixture(scope='function')
+def cache():
+    loader = Mock(side_effect=lambda path: 'decoded:' + path)
+    yield SoundCache(CATALOG, loader, size_of=lambda sound: 100, max_bytes=250), loader
+
+
+
+# Positive tests
+@pytest.mark.sound
+def test_cache_loads_once_positive(cache):
+    sound_cache, loader = cache
+
+    assert sound_cache.get('bell') == 'decoded:bell.wav'
+    assert sound_cache.get('bell') == 'decoded:bell.wav'
+    loader.assert_called_once_with('bell.wav')
+
+
+
+@pytest.mark.sound
+def test_cache_evicts_least_recently_used_positive(cache):
+    sound_cache, loader = cache
+    sound_cache.get('bell')
+    sound_cache.get('gong')
+    sound_cache.get('bell')
+    sound_cache.get('chime')
+
+    assert sound_cache.is_loaded('bell')
+    assert not sound_cache.is_loaded('gong')
+    assert sound_cache.used_bytes == 200
+
+
+
+# Border tests
+@pytest.mark.sound
+@pytest.mark.parametrize('key', ['bell', 'gong', 'chime', 'none'])
+def test_cache_contains_catalog_without_loading_border(cache, key):
+    sound_cache, loader = cache
+
+    assert key in sound_cache
+    loader.assert_not_called()
+
+
+
+@pytest.mark.sound
+def test_cache_single_sound_over_budget_kept_border(cache):
+    sound_cache, loader = cache
+    sound_cache.max_bytes = 10
+
+    assert sound_cache.get('bell') == 'decoded:bell.wav'
+    assert sound_cache.is_loaded('bell')
+
+
+
+# Negative tests
+@pytest.mark.sound
+@pytest.mark.parametrize('key', ['missing', '', None, 123])
+def test_cache_unknown_keys_negative(cache, key):
+    sound_cache, loader = cache
+
+    assert sound_cache.get(key) is None
+    assert key not in sound_cache
+    loader.assert_not_called()
+
+
+
+@pytest.mark.sound
+def test_cache_failed_load_not_retried_negative(cache):
+    sound_cache, loader = cache
+    loader.side_effect = lambda path: None
+
+    assert sound_cache.get('bell') is None
+    assert sound_cache.get('bell') is None
+    assert loader.call_count == 1
@@ -1,4 +1,6 @@
 import pytest
+import threading
+import pygame
 from unittest.mock import Mock, patch
 from src.utils.sound_manager import SoundManager
 from src.core.timer_state import TimerState
@@ -23,14 +25,13 @@ def sound_manager():
 ])
 def test_sound_play_valid_sounds_positive(sound_manager, sound_key, should_play):
     mock_sound = Mock()
-    sound_manager.sounds[sound_key] = mock_sound if should_play else None
-
-    sound_manager.play_sound(sound_key)
+    with patch('pygame.mixer.Sound', return_value=mock_sound):
+        sound_manager.play_sound(sound_key)
 
     if should_play:
         mock_sound.play.assert_called_once()
     else:
-        assert True
+        mock_sound.play.assert_not_called()
 
 
 
@@ -46,9 +47,8 @@ def test_sound_notification_types_positive(sound_manager, notification_type, sho
     timer_state.pomodoro_sound = 'bell'
 
     mock_sound = Mock()
-    sound_manager.sounds['bell'] = mock_sound
-
-    sound_manager.handle_timer_finished(timer_state, 'pomodoro')
+    with patch('pygame.mixer.Sound', return_value=mock_sound):
+        sound_manager.handle_timer_finished(timer_state, 'pomodoro')
 
     if should_play_sound:
         mock_sound.play.assert_called_once()
@@ -57,6 +57,52 @@ def test_sound_notification_types_positive(sound_manager, notification_type, sho
 
 
 
+@pytest.mark.sound
+def test_sound_loaded_lazily_positive():
+    with patch('pygame.mixer.init'), patch('pygame.mixer.Sound') as mock_sound:
+        sound_mgr = SoundManager()
+        assert mock_sound.call_count == 0
+
+        sound_mgr.play_sound('bell')
+        sound_mgr.play_sound('bell')
+
+        assert mock_sound.call_count == 1
+        mock_sound.return_value.play.assert_called()
+
+
+
+@pytest.mark.sound
+def test_sound_prefetch_selected_positive():
+    with patch('pygame.mixer.init'), patch('pygame.mixer.Sound') as mock_sound:
+        sound_mgr = SoundManager()
+        thread = sound_mgr.prefetch(['bell', 'none', 'soft_bell'])
+        thread.join(5)
+
+        assert mock_sound.call_count == 2
+        assert sound_mgr.sounds.is_loaded('bell')
+        assert not sound_mgr.sounds.is_loaded('bonus_2')
+        assert sound_mgr.prefetch(['bell']) is None
+
+
+
+@pytest.mark.sound
+def test_sound_async_init_queues_early_sounds_positive():
+    opened = threading.Event()
+    mock_sound = Mock()
+    with patch('pygame.mixer.init', side_effect=lambda: opened.wait(5)), \
+            patch('pygame.mixer.Sound', return_value=mock_sound):
+        sound_mgr = SoundManager(async_init=True)
+
+        sound_mgr.play_sound('bell')
+        mock_sound.play.assert_not_called()
+
+        opened.set()
+        assert sound_mgr.wait_ready(5)
+        sound_mgr._init_thread.join(5)
+        mock_sound.play.assert_called_once()
+
+
+
 # Border tests
 @pytest.mark.sound
 @pytest.mark.parametrize('completion_mode, sound_setting', [
@@ -70,9 +116,8 @@ def test_sound_completion_modes_border(sound_manager, completion_mode, sound_set
     setattr(timer_state, sound_setting, 'bell')
 
     mock_sound = Mock()
-    sound_manager.sounds['bell'] = mock_sound
-
-    sound_manager.handle_timer_finished(timer_state, completion_mode)
+    with patch('pygame.mixer.Sound', return_value=mock_sound):
+        sound_manager.handle_timer_finished(timer_state, completion_mode)
 
     mock_sound.play.assert_called_once()
 
@@ -87,6 +132,24 @@ def test_sound_all_available_sounds_border(sound_manager, sound_key):
 
 
 
+@pytest.mark.sound
+def test_sound_async_init_drop_policy_border():
+    opened = threading.Event()
+    mock_sound = Mock()
+    with patch('pygame.mixer.init', side_effect=lambda: opened.wait(5)), \
+            patch('pygame.mixer.Sound', return_value=mock_sound):
+        sound_mgr = SoundManager(async_init=True, pending_policy='drop')
+
+        sound_mgr.play_sound('bell')
+        opened.set()
+        sound_mgr._init_thread.join(5)
+
+        mock_sound.play.assert_not_called()
+        sound_mgr.play_sound('bell')
+        mock_sound.play.assert_called_once()
+
+
+
 # Negative tests
 @pytest.mark.sound
 @pytest.mark.parametrize('invalid_sound_key', [
@@ -119,4 +182,44 @@ def test_sound_invalid_completion_mode_negative(sound_manager, invalid_mode):
         sound_manager.handle_timer_finished(timer_state, invalid_mode)
         assert True
     except (AttributeError, KeyError):
-        assert True
\ No newline at end of file
+        assert True
+
+
+
+@pytest.mark.sound
+@pytest.mark.parametrize('async_init', [False, True])
+def test_sound_missing_audio_device_negative(async_init):
+    mock_sound = Mock()
+    with patch('pygame.mixer.init', side_effect=pygame.error('No available audio device')), \
+            patch('pygame.mixer.Sound', return_value=mock_sound):
+        sound_mgr = SoundManager(async_init=async_init)
+        assert sound_mgr.wait_ready(5)
+
+        sound_mgr.play_sound('bell')
+
+        assert sound_mgr.available is False
+        mock_sound.play.assert_not_called()
+        sound_mgr.cleanup()
+
+
+
+@pytest.mark.sound
+@pytest.mark.parametrize('error', [
+    FileNotFoundError('No file'),
+    PermissionError('Access denied'),
+    pygame.error('Unable to open file'),
+])
+def test_sound_unreadable_file_negative(error):
+    with patch('pygame.mixer.init'), patch('pygame.mixer.Sound', side_effect=error):
+        sound_mgr = SoundManager()
+
+        assert sound_mgr.load_sound('sounds/bell.wav') is None
+        sound_mgr.play_sound('bell')
+        assert sound_mgr.sounds.get('bell') is None
+
+
+
+@pytest.mark.sound
+def test_sound_unknown_pending_policy_negative():
+    with pytest.raises(ValueError):
+        SoundManager(pending_policy='retry')
@@ -0,0 +1,175 @@
+import pytest
+import json
+import os
+import shutil
+import sqlite3
+import tempfile
+from datetime import datetime, timedelta
+from src.core.sqlite_stats_manager import SqliteStatsManager
+from src.core.stats_manager import StatsManager
+
+
+@pytest.fixture(scope='function')
+def sqlite_stats():
+    temp_dir = tempfile.mkdtemp()
+
+    stats_manager = SqliteStatsManager()
+    stats_manager.stats_file = os.path.join(temp_dir, 'aPomodoro_stats.json')
+    stats_manager.db_file = os.path.join(temp_dir, 'aPomodoro_stats.db')
+
+    yield stats_manager
+
+    stats_manager.close()
+    shutil.rmtree(temp_dir)
+
+
+
+# Positive tests
+@pytest.mark.stats
+@pytest.mark.parametrize('count, duration', [
+    (1, 1500),
+    (5, 1500),
+    (3, 900),
+])
+def test_sqlite_save_pomodoros_positive(sqlite_stats, count, duration):
+    for _ in range(count):
+        sqlite_stats.save_completed_pomodoro(duration)
+
+    result = sqlite_stats.get_general_stats()
+    assert result['total_pomodoros'] == count
+    assert result['total_time'] == count * duration
+    assert result['total_days'] == 1
+
+
+
+@pytest.mark.stats
+def test_sqlite_migrates_json_once_positive(sqlite_stats):
+    yesterday = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
+    with open(sqlite_stats.stats_file, 'w', encoding='utf-8') as f:
+        json.dump({yesterday: {'pomodoros': 4, 'work_time': 6000},
+                   '2020-01-01': {'pomodoros': 'broken'}}, f)
+
+    result = sqlite_stats.get_general_stats()
+    assert result['total_pomodoros'] == 4
+    assert result['first_date'] == yesterday
+
+    sqlite_stats.close()
+    assert sqlite_stats.get_general_stats()['total_pomodoros'] == 4
+
+
+
+@pytest.mark.stats
+def test_sqlite_migrates_archived_years_positive(sqlite_stats):
+    last_year = datetime.now().year - 1
+    with open(sqlite_stats.stats_file, 'w', encoding='utf-8') as f:
+        json.dump({f'{last_year}-03-01': {'pomodoros': 3, 'work_time': 4500},
+                   f'{last_year - 1}-03-01': {'pomodoros': 2, 'work_time': 3000}}, f)
+    source = StatsManager()
+    source.stats_file = sqlite_stats.stats_file
+    assert source.archive_stats() is True
+
+    result = sqlite_stats.get_general_stats()
+    assert result['total_pomodoros'] == 5
+    assert result['first_date'] == f'{last_year - 1}-03-01'
+
+
+
+@pytest.mark.stats
+def test_sqlite_uses_wal_mode_positive(sqlite_stats):
+    sqlite_stats.save_completed_pomodoro(1500)
+
+    connection = sqlite3.connect(sqlite_stats.db_file)
+    mode = connection.execute('PRAGMA journal_mode').fetchone()[0]
+    connection.close()
+
+    assert mode == 'wal'
+
+
+
+@pytest.mark.stats
+def test_sqlite_merge_and_iter_days_positive(sqlite_stats):
+    sqlite_stats.save_completed_pomodoro(1500)
+    today = datetime.now().strftime('%Y-%m-%d')
+
+    assert sqlite_stats.merge_days({'2020-05-01': {'pomodoros': 3, 'work_time': 4500},
+                                    today: {'pomodoros': 1, 'work_time': 600}}) is True
+
+    assert list(sqlite_stats.iter_days()) == [
+        ('2020-05-01', {'pomodoros': 3, 'work_time': 4500}),
+        (today, {'pomodoros': 2, 'work_time': 2100})
+    ]
+    assert sqlite_stats.get_general_stats()['total_pomodoros'] == 5
+
+
+
+# Border tests
+@pytest.mark.stats
+@pytest.mark.parametrize('days_count', [1, 7, 365])
+def test_sqlite_daily_range_border(sqlite_stats, days_count):
+    sqlite_stats.save_completed_pomodoro(1500)
+
+    result = sqlite_stats.get_daily_stats(days_count)
+
+    assert len(result) == days_count
+    assert result[-1]['is_today'] is True
+    assert result[-1]['pomodoros'] == 1
+    assert sum(day['pomodoros'] for day in result) == 1
+
+
+
+@pytest.mark.stats
+def test_sqlite_reset_and_repair_border(sqlite_stats):
+    sqlite_stats.save_completed_pomodoro(1500)
+
+    assert sqlite_stats.reset_stats() is True
+    assert sqlite_stats.get_general_stats()['total_pomodoros'] == 0
+    assert sqlite_stats.repair_stats_file() is True
+    assert sqlite_stats.get_general_stats()['first_date'] is None
+
+
+
+@pytest.mark.stats
+def test_sqlite_get_days_matches_json_border(sqlite_stats):
+    today = datetime.now()
+    with open(sqlite_stats.stats_file, 'w', encoding='utf-8') as f:
+        json.dump({
+            (today - timedelta(days=2)).strftime('%Y-%m-%d'): {'pomodoros': 3, 'work_time': 4500},
+            (today - timedelta(days=400)).strftime('%Y-%m-%d'): {'pomodoros': 1, 'work_time': 1500},
+        }, f)
+
+    assert [day['pomodoros'] for day in sqlite_stats.get_days(0, 4)] == [0, 0, 3, 0]
+    assert sqlite_stats.get_days(400, 1)[0]['pomodoros'] == 1
+    assert sqlite_stats.get_history_length() == 401
+
+
+
+# Negative tests
+@pytest.mark.stats
+@pytest.mark.parametrize('invalid_duration', ['string', None, [], True])
+def test_sqlite_save_invalid_duration_negative(sqlite_stats, invalid_duration):
+    with pytest.raises(TypeError):
+        sqlite_stats.save_completed_pomodoro(invalid_duration)
+
+    assert sqlite_stats.get_general_stats()['total_pomodoros'] == 0
+
+
+
+@pytest.mark.stats
+def test_sqlite_failed_migration_retried_negative(sqlite_stats, monkeypatch):
+    yesterday = (datetime.now() - timedelta(days=1)).strftime('%Y-%m-%d')
+    with open(sqlite_stats.stats_file, 'w', encoding='utf-8') as f:
+        json.dump({yesterday: {'pomodoros': 5, 'work_time': 7500}}, f)
+
+    merge_rows = sqlite_stats._merge_rows
+
+    def fail_once(days, migrated=False):
+        monkeypatch.setattr(sqlite_stats, '_merge_rows', merge_rows)
+        raise sqlite3.OperationalError('disk I/O error')
+    monkeypatch.setattr(sqlite_stats, '_merge_rows', fail_once)
+    assert sqlite_stats.get_general_stats()['total_pomodoros'] == 0
+
+    # Следующий запуск видит базу без отметки о переносе и переносит историю заново
+    sqlite_stats.close()
+    assert sqlite_stats.get_general_stats()['total_pomodoros'] == 5
+    sqlite_stats.close()
+    assert sqlite_stats.get_general_stats()['total_pomodoros'] == 5
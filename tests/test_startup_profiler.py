@@ -0,0 +1,87 @@
+import pytest
+import os
+import subprocess
+import sys
+from src.utils.startup_profiler import StartupProfiler, process_age
+
+
+ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+@pytest.fixture(scope='function')
+def profiler():
+    now = [10.0]
+    startup_profiler = StartupProfiler(clock=lambda: now[0], age=lambda: 0.5)
+    yield startup_profiler, now
+
+
+
+# Positive tests
+@pytest.mark.startup
+def test_profiler_records_phases_positive(profiler):
+    startup_profiler, now = profiler
+    with startup_profiler.phase('Tk init'):
+        now[0] += 0.25
+    with startup_profiler.phase('create_interface'):
+        now[0] += 0.5
+
+    assert startup_profiler.phases == [('Tk init', 0.25), ('create_interface', 0.5)]
+    assert startup_profiler.total() == 0.75
+
+
+
+@pytest.mark.startup
+def test_profiler_report_lists_phases_positive(profiler):
+    startup_profiler, now = profiler
+    with startup_profiler.phase('import customtkinter'):
+        now[0] += 0.1234
+
+    report = startup_profiler.report()
+    assert 'interpreter start' in report
+    assert '500.0 ms' in report
+    assert 'import customtkinter' in report
+    assert '123.4 ms' in report
+
+
+
+@pytest.mark.startup
+def test_main_defers_heavy_imports_positive():
+    code = ('import sys, main; '
+            'print(sorted(m for m in ("pygame", "src.core.stats_manager", '
+            '"src.core.sqlite_stats_manager", "src.ui.ui_windows") if m in sys.modules))')
+    output = subprocess.check_output([sys.executable, '-c', code], cwd=ROOT, text=True)
+    assert output.strip().splitlines()[-1] == '[]'
+
+
+
+@pytest.mark.startup
+@pytest.mark.skipif(not sys.platform.startswith('linux'), reason='reads /proc')
+def test_process_age_is_wall_time_positive():
+    code = ('import time; time.sleep(0.3); '
+            'from src.utils.startup_profiler import process_age; print(process_age())')
+    output = subprocess.check_output([sys.executable, '-c', code], cwd=ROOT, text=True)
+    # Сон не тратит CPU, но входит во время с создания процесса
+    assert float(output.strip().splitlines()[-1]) >= 0.25
+
+
+
+# Border tests
+@pytest.mark.startup
+def test_profiler_without_process_age_labels_cpu_border():
+    startup_profiler = StartupProfiler(clock=lambda: 0.0, age=lambda: None)
+
+    assert startup_profiler.interpreter_start >= 0
+    assert 'interpreter (CPU lower bound)' in startup_profiler.report()
+
+
+
+# Negative tests
+@pytest.mark.startup
+def test_profiler_phase_recorded_on_error_negative(profiler):
+    startup_profiler, now = profiler
+    with pytest.raises(RuntimeError):
+        with startup_profiler.phase('create_interface'):
+            now[0] += 1
+            raise RuntimeError('no display')
+
+    assert startup_profiler.phases == [('create_interface', 1)]
@@ -0,0 +1,138 @@
+import pytest
+from datetime import date, timedelta
+from src.core.stats_analytics import StatsAnalytics
+
+
+TODAY = date(2024, 3, 14)  # Четверг
+
+
+def make_stats(*days):
+    return {(TODAY - timedelta(days=ago)).isoformat(): {'pomodoros': count, 'work_time': count * 1500}
+            for ago, count in days}
+
+
+@pytest.fixture(scope='function')
+def analytics():
+    # Две недели истории: серия из 3 дней до сегодня и серия из 4 дней раньше
+    stats = make_stats((0, 2), (1, 1), (2, 3), (5, 1), (6, 1), (7, 4), (8, 2), (13, 5))
+    yield StatsAnalytics(stats, today=TODAY)
+
+
+
+# Positive tests
+@pytest.mark.analytics
+def test_analytics_dense_arrays_positive(analytics):
+    assert len(analytics) == 14
+    assert analytics.first_day == TODAY - timedelta(days=13)
+    assert list(analytics.pomodoros) == [5, 0, 0, 0, 0, 2, 4, 1, 1, 0, 0, 3, 1, 2]
+    assert sum(analytics.work_time) == 19 * 1500
+
+
+
+@pytest.mark.analytics
+def test_analytics_streaks_positive(analytics):
+    assert analytics.streaks() == {'current': 3, 'longest': 4}
+
+
+
+@pytest.mark.analytics
+def test_analytics_rollups_positive(analytics):
+    weekly = analytics.weekly()
+    monthly = analytics.monthly()
+    yearly = analytics.yearly()
+
+    assert [week['start'] for week in weekly] == [date(2024, 2, 26), date(2024, 3, 4), date(2024, 3, 11)]
+    assert [week['pomodoros'] for week in weekly] == [5, 8, 6]
+    assert [(month['start'], month['pomodoros']) for month in monthly] == [(date(2024, 3, 1), 19)]
+    assert yearly[0]['work_time'] == 19 * 1500
+
+
+
+@pytest.mark.analytics
+def test_analytics_rolling_average_positive(analytics):
+    rolling = analytics.rolling_average(7)
+
+    assert len(rolling) == len(analytics)
+    assert rolling[-1] == pytest.approx((2 + 1 + 3 + 0 + 0 + 1 + 1) / 7)
+    assert rolling[0] == pytest.approx(5 / 7)
+
+
+
+@pytest.mark.analytics
+def test_analytics_weekday_distribution_positive(analytics):
+    distribution = {row['weekday']: row for row in analytics.weekday_distribution()}
+
+    assert distribution['Thursday']['pomodoros'] == 4 + 2
+    assert distribution['Thursday']['active_days'] == 2
+    assert distribution['Friday']['pomodoros'] == 5 + 1
+    assert distribution['Sunday']['active_days'] == 0
+    assert sum(row['pomodoros'] for row in distribution.values()) == 19
+
+
+
+@pytest.mark.analytics
+def test_analytics_summary_positive(analytics):
+    summary = analytics.summary()
+
+    assert summary['current_streak'] == 3
+    assert summary['this_week'] == 6
+    assert summary['this_month'] == 19
+    assert summary['best_weekday'] == 'Thursday'
+
+
+
+# Border tests
+@pytest.mark.analytics
+def test_analytics_empty_history_border():
+    analytics = StatsAnalytics({}, today=TODAY)
+
+    assert len(analytics) == 0
+    assert analytics.weekly() == []
+    assert analytics.streaks() == {'current': 0, 'longest': 0}
+    assert analytics.summary()['best_weekday'] is None
+
+
+
+@pytest.mark.analytics
+@pytest.mark.parametrize('days, expected_current', [
+    (((1, 1), (2, 1)), 2),
+    (((0, 1),), 1),
+    (((2, 1), (3, 1)), 0),
+])
+def test_analytics_current_streak_border(days, expected_current):
+    analytics = StatsAnalytics(make_stats(*days), today=TODAY)
+    assert analytics.streaks()['current'] == expected_current
+
+
+
+@pytest.mark.analytics
+def test_analytics_ten_years_border():
+    stats = make_stats(*((ago, ago % 5) for ago in range(3653)))
+
+    analytics = StatsAnalytics(stats, today=TODAY)
+    summary = analytics.summary()
+
+    assert len(analytics) == 3653
+    assert len(analytics.yearly()) == 11
+    assert sum(month['pomodoros'] for month in analytics.monthly()) == sum(ago % 5 for ago in range(3653))
+    assert summary['longest_streak'] == 4
+
+
+
+# Negative tests
+@pytest.mark.analytics
+def test_analytics_skips_invalid_dates_negative():
+    stats = make_stats((0, 1))
+    stats['not-a-date'] = {'pomodoros': 9, 'work_time': 0}
+
+    analytics = StatsAnalytics(stats, today=TODAY)
+
+    assert sum(analytics.pomodoros) == 1
+
+
+
+@pytest.mark.analytics
+@pytest.mark.parametrize('window', [0, -7])
+def test_analytics_invalid_window_negative(analytics, window):
+    with pytest.raises(ValueError):
+        analytics.rolling_average(window)
@@ -0,0 +1,258 @@
+import pytest
+import json
+import os
+import shutil
+import tempfile
+from datetime import date, timedelta
+from src.core.stats_analytics import StatsAnalytics
+from src.core.stats_archive import StatsArchive, combine_summaries, segment_summary
+from src.core.stats_manager import StatsManager
+
+
+@pytest.fixture(scope='function')
+def temp_dir():
+    path = tempfile.mkdtemp()
+    yield path
+    shutil.rmtree(path)
+
+
+@pytest.fixture(scope='function')
+def stats(temp_dir):
+    stats_manager = StatsManager()
+    stats_manager.stats_file = os.path.join(temp_dir, 'aPomodoro_stats.json')
+    yield stats_manager
+
+
+def make_history(first, last, inactive=lambda day: False):
+    history = {}
+    day = first
+    while day <= last:
+        if not inactive(day):
+            count = day.toordinal() % 7 + 1
+            history[day.isoformat()] = {'pomodoros': count, 'work_time': count * 1500}
+        day += timedelta(days=1)
+    return history
+
+
+def write_snapshot(stats_manager, history):
+    with open(stats_manager.stats_file, 'w', encoding='utf-8') as f:
+        json.dump(history, f)
+
+
+
+# Positive tests
+@pytest.mark.archive
+def test_segment_summary_streaks_positive():
+    days = make_history(date(2023, 1, 1), date(2023, 12, 31),
+                        lambda day: day in (date(2023, 1, 5), date(2023, 3, 1), date(2023, 3, 2)))
+
+    summary = segment_summary(2023, days)
+
+    assert summary['leading_streak'] == 4
+    assert summary['trailing_streak'] == 365 - 31 - 28 - 2
+    assert summary['longest_streak'] == summary['trailing_streak']
+    assert summary['active_days'] == 362
+    assert sum(summary['weekday_pomodoros']) == summary['pomodoros']
+
+
+
+@pytest.mark.archive
+def test_combine_summaries_chains_adjacent_years_positive():
+    headers = [{'year': year, 'summary': segment_summary(year, make_history(date(year, 1, 1), date(year, 12, 31)))}
+               for year in (2021, 2022)]
+    headers.append({'year': 2024, 'summary': segment_summary(2024, make_history(date(2024, 1, 1), date(2024, 1, 3)))})
+
+    combined = combine_summaries(headers)
+
+    assert combined['longest_streak'] == 365 + 365
+    assert combined['trailing_streak'] == 0
+    assert combined['last_year'] == 2024
+    assert combined['first_date'] == '2021-01-01'
+    assert combined['last_date'] == '2024-01-03'
+
+
+
+@pytest.mark.archive
+def test_archive_segment_roundtrip_positive(temp_dir):
+    archive = StatsArchive(os.path.join(temp_dir, 'archive'))
+    days = make_history(date(2022, 1, 1), date(2022, 12, 31))
+
+    first = archive.write_segment(2022, days)
+    second = archive.write_segment(2022, {'2022-06-01': {'pomodoros': 1, 'work_time': 60}}, first)
+
+    assert (first, second) == ('2022-1.seg', '2022-2.seg')
+    assert StatsArchive(archive.directory).read_header(second)['summary']['pomodoros'] == \
+        sum(day['pomodoros'] for day in days.values()) + 1
+    assert StatsArchive(archive.directory).load_days(second)['2022-06-01']['work_time'] == \
+        days['2022-06-01']['work_time'] + 60
+    assert os.path.getsize(os.path.join(archive.directory, second)) < len(json.dumps(days)) // 4
+
+
+
+@pytest.mark.archive
+def test_stats_archive_keeps_only_current_year_hot_positive(stats):
+    today = date.today()
+    history = make_history(today - timedelta(days=3 * 365), today, lambda day: day.toordinal() % 13 == 0)
+    write_snapshot(stats, history)
+    before = stats.get_general_stats()
+    days_before = [(day['pomodoros'], day['work_time']) for day in stats.get_days(0, 3 * 365)]
+
+    assert stats.archive_stats() is True
+
+    with open(stats.stats_file, encoding='utf-8') as f:
+        hot = json.load(f)
+    assert all(key.startswith(str(today.year)) for key in hot if key != '_meta')
+    assert len(hot['_meta']['archive']) == 3
+
+    reopened = StatsManager()
+    reopened.stats_file = stats.stats_file
+    assert reopened.get_general_stats() == before
+    assert [(day['pomodoros'], day['work_time']) for day in reopened.get_days(0, 3 * 365)] == days_before
+
+
+
+@pytest.mark.archive
+def test_stats_all_time_query_reads_only_headers_positive(stats, monkeypatch):
+    today = date.today()
+    write_snapshot(stats, make_history(today - timedelta(days=3 * 365), today))
+    stats.archive_stats()
+
+    reopened = StatsManager()
+    reopened.stats_file = stats.stats_file
+    loaded = []
+    original = reopened.archive.load_days
+    monkeypatch.setattr(reopened.archive, 'load_days', lambda name: loaded.append(name) or original(name))
+
+    reopened.get_general_stats()
+    reopened.get_history_length()
+    assert loaded == []
+
+    reopened.get_days(0, 30)
+    assert len(set(loaded)) <= 1
+
+
+
+@pytest.mark.archive
+@pytest.mark.parametrize('today', [date(2026, 1, 10), date(2026, 7, 1)])
+def test_stats_analytics_summary_survives_archive_positive(stats, today):
+    # Серия без пропусков с середины 2024 года переходит через два Новых года
+    history = make_history(date(2021, 3, 1), today,
+                           lambda day: day < date(2024, 6, 1) and day.toordinal() % 97 == 0)
+    write_snapshot(stats, history)
+    expected = StatsAnalytics(history, today).summary()
+
+    assert stats.compact_stats(today) is True
+
+    assert stats.get_analytics(today).summary() == expected
+
+
+
+# Border tests
+@pytest.mark.archive
+def test_stats_archive_without_past_years_border(stats):
+    stats.save_completed_pomodoro(1500)
+
+    assert stats.archive_stats() is True
+    assert not os.path.exists(stats.archive_dir)
+
+
+
+@pytest.mark.archive
+def test_stats_late_days_merge_into_new_segment_border(stats):
+    today = date.today()
+    write_snapshot(stats, make_history(date(today.year - 1, 1, 1), today))
+    stats.archive_stats()
+    old_segment = stats._segments[str(today.year - 1)]
+    total = stats.get_general_stats()['total_pomodoros']
+
+    with open(stats.journal_file, 'w', encoding='utf-8') as f:
+        f.write(json.dumps({'seq': 1, 'date': f'{today.year - 1}-02-02', 'pomodoros': 5, 'work_time': 300}) + '\n')
+    assert stats.get_general_stats()['total_pomodoros'] == total + 5
+    stats.compact_stats()
+
+    assert stats._segments[str(today.year - 1)] != old_segment
+    assert not os.path.exists(os.path.join(stats.archive_dir, old_segment))
+    assert stats.get_general_stats()['total_pomodoros'] == total + 5
+
+
+
+@pytest.mark.archive
+def test_stats_reset_clears_archive_border(stats):
+    today = date.today()
+    write_snapshot(stats, make_history(today - timedelta(days=800), today))
+    stats.archive_stats()
+
+    assert stats.reset_stats() is True
+    assert stats.get_general_stats()['total_pomodoros'] == 0
+    assert os.listdir(stats.archive_dir) == []
+
+
+
+# Negative tests
+@pytest.mark.archive
+def test_stats_failed_commit_does_not_double_count_negative(stats, monkeypatch):
+    today = date.today()
+    write_snapshot(stats, make_history(today - timedelta(days=800), today))
+    before = stats.get_general_stats()
+
+    def fail(*args):
+        raise OSError('disk full')
+    monkeypatch.setattr(stats, '_write_snapshot', fail)
+    assert stats.archive_stats() is False
+    monkeypatch.undo()
+
+    reopened = StatsManager()
+    reopened.stats_file = stats.stats_file
+    assert reopened.get_general_stats() == before
+
+
+
+@pytest.mark.archive
+def test_stats_lost_header_falls_back_to_segments_negative(stats):
+    today = date.today()
+    history = make_history(today - timedelta(days=800), today)
+    write_snapshot(stats, history)
+    stats.archive_stats()
+    before = stats.get_general_stats()
+
+    with open(stats.stats_file, encoding='utf-8') as f:
+        text = f.read()
+    with open(stats.stats_file, 'w', encoding='utf-8') as f:
+        f.write(text[text.index(f'"{today.year}-'):])
+
+    reopened = StatsManager()
+    reopened.stats_file = stats.stats_file
+    assert reopened.get_general_stats()['total_pomodoros'] == before['total_pomodoros']
+
+
+
+@pytest.mark.archive
+def test_archive_corrupted_segment_negative(temp_dir):
+    archive = StatsArchive(temp_dir)
+    name = archive.write_segment(2022, make_history(date(2022, 1, 1), date(2022, 1, 31)))
+    with open(os.path.join(temp_dir, name), 'r+b') as f:
+        f.seek(-5, os.SEEK_END)
+        f.write(b'xxxxx')
+
+    reopened = StatsArchive(temp_dir)
+    assert reopened.read_header(name)['days'] == 31
+    assert reopened.load_days(name) == {}
+
+
+
+@pytest.mark.archive
+def test_stats_unreadable_segment_is_not_replaced_negative(stats):
+    today = date.today()
+    write_snapshot(stats, make_history(date(today.year - 1, 1, 1), today))
+    stats.archive_stats()
+    old_segment = stats._segments[str(today.year - 1)]
+    with open(os.path.join(stats.archive_dir, old_segment), 'r+b') as f:
+        f.seek(-5, os.SEEK_END)
+        f.write(b'xxxxx')
+
+    late_day = {f'{today.year - 1}-02-02': {'pomodoros': 5, 'work_time': 300}}
+    assert stats.merge_days(late_day) is False
+    assert stats._segments[str(today.year - 1)] == old_segment
+    assert os.listdir(stats.archive_dir) == [old_segment]
+    with pytest.raises(ValueError):
+        stats.archive.read_days(old_segment)
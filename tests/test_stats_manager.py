@@ -1,7 +1,13 @@
 import pytest
+import json
+import multiprocessing
 import os
 import tempfile
+import threading
+from datetime import datetime, timedelta
 from src.core.stats_manager import StatsManager
+from src.utils.background_writer import BackgroundWriter
+from src.utils.file_lock import FileLock
 
 
 @pytest.fixture(scope='function')
@@ -14,8 +20,18 @@ def stats():
 
     yield stats_manager
 
-    if os.path.exists(temp_file.name):
-        os.remove(temp_file.name)
+    for path in (temp_file.name, stats_manager.journal_file, stats_manager.lock_file):
+        if os.path.exists(path):
+            os.remove(path)
+
+
+
+def save_pomodoros(stats_file, count, use_journal, compact_threshold):
+    stats_manager = StatsManager(use_journal=use_journal)
+    stats_manager.stats_file = stats_file
+    stats_manager.compact_threshold = compact_threshold
+    for _ in range(count):
+        stats_manager.save_completed_pomodoro(1500)
 
 
 
@@ -48,6 +64,154 @@ def test_stats_multiple_pomodoros_positive(stats, count, expected_total):
 
 
 
+@pytest.mark.stats
+def test_stats_journal_append_keeps_snapshot_positive(stats):
+    stats.save_completed_pomodoro(1500)
+    snapshot_before = os.path.getsize(stats.stats_file)
+
+    stats.save_completed_pomodoro(1500)
+
+    assert os.path.getsize(stats.stats_file) == snapshot_before
+    with open(stats.journal_file, encoding='utf-8') as f:
+        assert len(f.readlines()) == 2
+
+
+
+@pytest.mark.stats
+@pytest.mark.parametrize('use_journal', [True, False])
+def test_stats_compaction_keeps_totals_positive(stats, use_journal):
+    stats.use_journal = use_journal
+    for _ in range(3):
+        stats.save_completed_pomodoro(1500)
+
+    assert stats.compact_stats() is True
+    assert not os.path.exists(stats.journal_file)
+
+    result = stats.get_general_stats()
+    assert result['total_pomodoros'] == 3
+    assert result['total_time'] == 4500
+
+
+
+@pytest.mark.stats
+def test_stats_cache_skips_reload_positive(stats, monkeypatch):
+    stats.save_completed_pomodoro(1500)
+    stats.get_general_stats()
+
+    def fail_open(*args, **kwargs):
+        raise AssertionError('stats file was read again')
+
+    monkeypatch.setattr('builtins.open', fail_open)
+    assert stats.get_general_stats()['total_pomodoros'] == 1
+    assert len(stats.get_daily_stats(7)) == 7
+
+
+
+@pytest.mark.stats
+def test_stats_cache_sees_other_writer_positive(stats):
+    other = StatsManager()
+    other.stats_file = stats.stats_file
+
+    stats.save_completed_pomodoro(1500)
+    assert stats.get_general_stats()['total_pomodoros'] == 1
+
+    other.save_completed_pomodoro(1500)
+    assert stats.get_general_stats()['total_pomodoros'] == 2
+
+    other.compact_stats()
+    stats.save_completed_pomodoro(1500)
+    assert other.get_general_stats()['total_pomodoros'] == 3
+
+
+
+@pytest.mark.stats
+def test_stats_totals_header_persisted_positive(stats):
+    stats.save_completed_pomodoro(1500)
+    stats.save_completed_pomodoro(900)
+    stats.compact_stats()
+
+    with open(stats.stats_file, encoding='utf-8') as f:
+        header = json.load(f)['_meta']['totals']
+
+    assert header['pomodoros'] == 2
+    assert header['work_time'] == 2400
+    assert header['active_days'] == 1
+    assert header['first_date'] == header['last_date']
+
+
+
+@pytest.mark.stats
+def test_stats_repair_rebuilds_stale_header_positive(stats):
+    with open(stats.stats_file, 'w', encoding='utf-8') as f:
+        json.dump({
+            '_meta': {'journal_seq': 0, 'totals': {
+                'pomodoros': 99, 'work_time': 1, 'active_days': 7,
+                'first_date': '2020-01-01', 'last_date': '2020-01-01'}},
+            '2024-03-01': {'pomodoros': 2, 'work_time': 3000},
+            '2024-03-05': {'pomodoros': 1, 'work_time': 1500},
+        }, f)
+
+    assert stats.get_general_stats()['total_pomodoros'] == 99
+
+    assert stats.repair_stats_file() is True
+    result = stats.get_general_stats()
+    assert result['total_pomodoros'] == 3
+    assert result['total_time'] == 4500
+    assert result['total_days'] == 2
+    assert result['first_date'] == '2024-03-01'
+    assert result['last_date'] == '2024-03-05'
+
+
+
+@pytest.mark.stats
+def test_stats_get_days_pages_newest_first_positive(stats):
+    today = datetime.now()
+    days_ago = lambda n: (today - timedelta(days=n)).strftime('%Y-%m-%d')
+    with open(stats.stats_file, 'w', encoding='utf-8') as f:
+        json.dump({
+            days_ago(0): {'pomodoros': 1, 'work_time': 1500},
+            days_ago(3): {'pomodoros': 2, 'work_time': 3000},
+            days_ago(10): {'pomodoros': 4, 'work_time': 6000},
+        }, f)
+
+    first_page = stats.get_days(0, 5)
+    second_page = stats.get_days(5, 10)
+
+    assert [day['pomodoros'] for day in first_page] == [1, 0, 0, 2, 0]
+    assert first_page[0]['is_today'] is True
+    assert not any(day['is_today'] for day in second_page)
+    assert second_page[5]['pomodoros'] == 4
+    assert second_page[5]['date'].strftime('%Y-%m-%d') == days_ago(10)
+    assert stats.get_history_length() == 11
+
+
+
+@pytest.mark.stats
+@pytest.mark.parametrize('use_journal, compact_threshold', [
+    (True, 64 * 1024),
+    (True, 512),
+    (False, 64 * 1024),
+])
+def test_stats_concurrent_processes_positive(stats, use_journal, compact_threshold):
+    processes_count, per_process = 4, 50
+    context = multiprocessing.get_context('spawn')
+    processes = [context.Process(target=save_pomodoros,
+                                 args=(stats.stats_file, per_process, use_journal, compact_threshold))
+                 for _ in range(processes_count)]
+    for process in processes:
+        process.start()
+    for process in processes:
+        process.join(60)
+        assert process.exitcode == 0
+
+    result = stats.get_general_stats()
+    assert result['total_pomodoros'] == processes_count * per_process
+    assert result['total_time'] == processes_count * per_process * 1500
+    assert stats.repair_stats_file() is True
+    assert stats.get_general_stats()['total_pomodoros'] == processes_count * per_process
+
+
+
 # Border tests
 @pytest.mark.stats
 @pytest.mark.parametrize('duration, expected_time', [
@@ -72,6 +236,72 @@ def test_stats_get_daily_border(stats, days_count, expected_result):
     assert len(result) == expected_result
 
 
+@pytest.mark.stats
+@pytest.mark.parametrize('threshold, expected_journal', [
+    (1, False),
+    (64 * 1024, True),
+])
+def test_stats_compaction_threshold_border(stats, threshold, expected_journal):
+    stats.compact_threshold = threshold
+    stats.save_completed_pomodoro(1500)
+    stats.save_completed_pomodoro(1500)
+
+    assert os.path.exists(stats.journal_file) == expected_journal
+    assert stats.get_general_stats()['total_pomodoros'] == 2
+
+
+
+@pytest.mark.stats
+def test_stats_cache_invalidated_by_size_change_border(stats):
+    stats.save_completed_pomodoro(1500)
+    stats.compact_stats()
+    assert stats.get_general_stats()['total_pomodoros'] == 1
+
+    with open(stats.stats_file, 'w', encoding='utf-8') as f:
+        f.write('{"2024-01-01": {"pomodoros": 12, "work_time": 18000}}')
+
+    assert stats.get_general_stats()['total_pomodoros'] == 12
+
+
+
+@pytest.mark.stats
+def test_stats_reset_clears_totals_border(stats):
+    stats.save_completed_pomodoro(1500)
+    assert stats.reset_stats() is True
+
+    result = stats.get_general_stats()
+    assert result['total_pomodoros'] == 0
+    assert result['total_days'] == 0
+    assert result['avg_per_day'] == 0
+    assert result['first_date'] is None
+
+
+
+@pytest.mark.stats
+@pytest.mark.parametrize('offset, count', [
+    (0, 0),
+    (365, 1),
+    (3650, 60),
+])
+def test_stats_get_days_range_border(stats, offset, count):
+    stats.save_completed_pomodoro(1500)
+
+    result = stats.get_days(offset, count)
+
+    assert len(result) == count
+    assert sum(day['pomodoros'] for day in result) == 0
+
+
+
+@pytest.mark.stats
+def test_stats_history_length_minimum_border(stats):
+    assert stats.get_history_length() == 7
+    stats.save_completed_pomodoro(1500)
+    assert stats.get_history_length() == 7
+    assert stats.get_history_length(minimum=1) == 1
+
+
+
 # Negative tests
 @pytest.mark.stats
 @pytest.mark.parametrize('invalid_duration, expected_exception', [
@@ -85,4 +315,67 @@ def test_stats_save_invalid_duration_negative(stats, invalid_duration, expected_
         result = stats.get_general_stats()
         assert isinstance(result, dict)
     except expected_exception:
-        pass
\ No newline at end of file
+        pass
+
+
+
+@pytest.mark.stats
+def test_stats_save_lock_timeout_releases_manager_negative(stats):
+    # Занятая блокировка отдаётся вызывающему, а сам менеджер не остаётся занятым
+    stats.save_lock_timeout = 0.05
+    other = FileLock(stats.lock_file)
+    with other:
+        with pytest.raises(TimeoutError):
+            stats.save_completed_pomodoro(1500)
+        assert stats._lock.acquire(blocking=False)
+        stats._lock.release()
+
+    assert stats.get_general_stats()['total_pomodoros'] == 0
+    stats.save_completed_pomodoro(1500)
+    assert stats.get_general_stats()['total_pomodoros'] == 1
+
+
+
+@pytest.mark.stats
+def test_stats_busy_save_retried_by_writer_negative(stats):
+    # Другой процесс держит статистику дольше ожидания - фоновая запись повторяет помидор
+    stats.save_lock_timeout = 0.05
+    writer = BackgroundWriter(retry_delay=0.05)
+    other = FileLock(stats.lock_file)
+    other.acquire()
+    timer = threading.Timer(0.2, other.release)
+    timer.start()
+    try:
+        writer.submit(stats.save_completed_pomodoro, 1500, retries=20)
+        assert writer.flush(timeout=5) is True
+    finally:
+        timer.join()
+        writer.close()
+
+    assert stats.get_general_stats()['total_pomodoros'] == 1
+
+
+
+@pytest.mark.stats
+def test_stats_truncated_journal_line_negative(stats):
+    stats.save_completed_pomodoro(1500)
+    with open(stats.journal_file, 'a', encoding='utf-8') as f:
+        f.write('{"seq": 2, "date": "20')
+
+    result = stats.get_general_stats()
+    assert result['total_pomodoros'] == 1
+
+
+
+@pytest.mark.stats
+def test_stats_journal_already_compacted_negative(stats):
+    stats.save_completed_pomodoro(1500)
+    with open(stats.journal_file, encoding='utf-8') as f:
+        journal = f.read()
+
+    stats.compact_stats()
+    # Сбой между записью снимка и удалением журнала
+    with open(stats.journal_file, 'w', encoding='utf-8') as f:
+        f.write(journal)
+
+    assert stats.get_general_stats()['total_pomodoros'] == 1
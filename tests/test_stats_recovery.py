@@ -0,0 +1,184 @@
+import pytest
+import json
+import os
+import tempfile
+import tracemalloc
+from datetime import date, timedelta
+from src.core.stats_manager import StatsManager
+from src.core.stats_recovery import describe_salvage, salvage_stats
+
+
+@pytest.fixture(scope='function')
+def stats_path():
+    temp_dir = tempfile.mkdtemp()
+    yield os.path.join(temp_dir, 'aPomodoro_stats.json')
+
+    for name in os.listdir(temp_dir):
+        os.remove(os.path.join(temp_dir, name))
+    os.rmdir(temp_dir)
+
+
+@pytest.fixture(scope='function')
+def stats(stats_path):
+    stats_manager = StatsManager()
+    stats_manager.stats_file = stats_path
+    yield stats_manager
+
+
+def make_snapshot(days_count, journal_seq=0):
+    first = date(2020, 1, 1)
+    data = {'_meta': {'journal_seq': journal_seq, 'totals': {'pomodoros': 0, 'work_time': 0, 'active_days': 0}}}
+    for i in range(days_count):
+        data[(first + timedelta(days=i)).isoformat()] = {'pomodoros': i % 9 + 1, 'work_time': (i % 9 + 1) * 1500}
+    return data
+
+
+def write_text(path, text):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+
+# Positive tests
+@pytest.mark.recovery
+@pytest.mark.parametrize('chunk_size', [7, 100, 64 * 1024])
+def test_salvage_valid_file_matches_json_positive(stats_path, chunk_size):
+    data = make_snapshot(500, journal_seq=42)
+    write_text(stats_path, json.dumps(data, indent=2))
+
+    recovered, journal_seq, report = salvage_stats(stats_path, chunk_size=chunk_size)
+
+    del data['_meta']
+    assert recovered == data
+    assert journal_seq == 42
+    assert report['dropped'] == 0
+    assert report['meta'] is True
+
+
+
+@pytest.mark.recovery
+def test_salvage_truncated_file_positive(stats_path):
+    text = json.dumps(make_snapshot(300), indent=2)
+    cut = text.index('"2020-08-01"') + 30
+    write_text(stats_path, text[:cut])
+
+    recovered, _, report = salvage_stats(stats_path, chunk_size=256)
+
+    assert len(recovered) == 213
+    assert max(recovered) == '2020-07-31'
+    assert report['dropped'] == 1
+    assert '2020-08-01' in report['errors'][0]
+
+
+
+@pytest.mark.recovery
+def test_stats_manager_loads_salvaged_days_positive(stats):
+    text = json.dumps(make_snapshot(30), indent=2)
+    write_text(stats.stats_file, text[:-40])
+
+    general = stats.get_general_stats()
+
+    assert general['total_days'] == 29
+    assert stats.recovery_report['days'] == 29
+
+
+
+@pytest.mark.recovery
+def test_stats_repair_keeps_salvaged_days_and_backup_positive(stats):
+    text = json.dumps(make_snapshot(30), indent=2)
+    damaged = text[:200] + '\x00garbage\x00' + text[230:]
+    write_text(stats.stats_file, damaged)
+
+    assert stats.repair_stats_file() is True
+
+    with open(stats.backup_file, encoding='utf-8') as f:
+        assert f.read() == damaged
+    with open(stats.stats_file, encoding='utf-8') as f:
+        repaired = json.load(f)
+    assert len(repaired) - 1 == stats.get_general_stats()['total_days'] >= 28
+    assert stats.recovery_report is None
+
+
+
+# Border tests
+@pytest.mark.recovery
+def test_salvage_memory_is_bounded_border(stats_path):
+    with open(stats_path, 'wb') as f:
+        f.write(b'{"2020-01-01": {"pomodoros": 1, "work_time": 1500},' + b'x' * (8 * 1024 * 1024))
+
+    tracemalloc.start()
+    try:
+        recovered, _, _ = salvage_stats(stats_path)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    assert recovered == {'2020-01-01': {'pomodoros': 1, 'work_time': 1500}}
+    assert peak < 1024 * 1024
+
+
+
+@pytest.mark.recovery
+def test_salvage_duplicate_days_keep_last_border(stats_path):
+    write_text(stats_path, '{"2020-01-01": {"pomodoros": 1, "work_time": 1500}, '
+                           '"2020-01-01": {"pomodoros": 3, "work_time": 4500}')
+
+    recovered, _, report = salvage_stats(stats_path)
+
+    assert recovered['2020-01-01']['pomodoros'] == 3
+    assert report['duplicates'] == 1
+    assert 'duplicate' in describe_salvage(report)
+
+
+
+@pytest.mark.recovery
+def test_stats_empty_file_is_not_damaged_border(stats):
+    write_text(stats.stats_file, '')
+
+    assert stats.get_general_stats()['total_days'] == 0
+    assert stats.recovery_report is None
+
+
+
+# Negative tests
+@pytest.mark.recovery
+@pytest.mark.parametrize('day_text', [
+    '{"pomodoros": "many", "work_time": 1500}',
+    '{"pomodoros": 2, "work_time": [1]}',
+    '{"pomodoros": 2, "work_ti\x00me": 3',
+])
+def test_salvage_drops_invalid_day_negative(stats_path, day_text):
+    write_text(stats_path, '{"2020-01-01": ' + day_text + ', "2020-01-02": {"pomodoros": 2, "work_time": 3000}}')
+
+    recovered, _, report = salvage_stats(stats_path)
+
+    assert list(recovered) == ['2020-01-02']
+    assert report['dropped'] == 1
+
+
+
+@pytest.mark.recovery
+def test_salvage_garbage_file_negative(stats_path):
+    with open(stats_path, 'wb') as f:
+        f.write(os.urandom(4096).replace(b'"', b''))
+
+    recovered, journal_seq, report = salvage_stats(stats_path)
+
+    assert recovered == {}
+    assert journal_seq == 0
+    assert report['meta'] is False
+    assert 'header was lost' in describe_salvage(report)
+
+
+
+@pytest.mark.recovery
+def test_stats_journal_replayed_after_salvage_negative(stats):
+    text = json.dumps(make_snapshot(10, journal_seq=5), indent=2)
+    write_text(stats.stats_file, text[:-20])
+    with open(stats.journal_file, 'w', encoding='utf-8') as f:
+        f.write(json.dumps({'seq': 5, 'date': '2020-01-01', 'pomodoros': 1, 'work_time': 1500}) + '\n')
+        f.write(json.dumps({'seq': 6, 'date': '2020-01-01', 'pomodoros': 1, 'work_time': 1500}) + '\n')
+
+    stats.get_general_stats()
+
+    assert stats._load_stats()['2020-01-01']['pomodoros'] == 2
@@ -0,0 +1,200 @@
+import pytest
+import json
+import os
+import shutil
+import tempfile
+from datetime import date, timedelta
+from src.core.stats_manager import StatsManager
+from src.core.stats_transfer import describe_import, export_lines, export_stats, import_stats, split_ranges
+
+
+@pytest.fixture(scope='function')
+def temp_dir():
+    path = tempfile.mkdtemp()
+    yield path
+    shutil.rmtree(path)
+
+
+def make_manager(temp_dir, name='aPomodoro_stats.json'):
+    stats_manager = StatsManager()
+    stats_manager.stats_file = os.path.join(temp_dir, name)
+    return stats_manager
+
+
+def make_history(days_count):
+    today = date.today()
+    return {(today - timedelta(days=ago)).isoformat(): {'pomodoros': ago % 6 + 1, 'work_time': (ago % 6 + 1) * 1500}
+            for ago in range(days_count)}
+
+
+def write_file(path, text):
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(text)
+
+
+
+# Positive tests
+@pytest.mark.transfer
+@pytest.mark.parametrize('name', ['export.csv', 'export.jsonl'])
+def test_export_import_roundtrip_positive(temp_dir, name):
+    source = make_manager(temp_dir)
+    history = make_history(900)
+    write_file(source.stats_file, json.dumps(history))
+    source.archive_stats()
+
+    path = os.path.join(temp_dir, name)
+    assert export_stats(source, path) == 900
+
+    target = make_manager(temp_dir, 'target.json')
+    report = import_stats(target, path)
+
+    assert report == {'records': 900, 'days': 900, 'error_count': 0, 'errors': [], 'saved': True}
+    assert target.get_all_stats() == history
+    assert target.get_general_stats() == source.get_general_stats()
+
+
+
+@pytest.mark.transfer
+def test_import_parallel_matches_sequential_positive(temp_dir):
+    path = os.path.join(temp_dir, 'sessions.csv')
+    lines = ['date,work_time']
+    for i in range(3000):
+        lines.append(f'{(date.today() - timedelta(days=i % 400)).isoformat()}T09:{i % 60:02d}:00,1500')
+    write_file(path, '\n'.join(lines) + '\n')
+
+    sequential = make_manager(temp_dir, 'sequential.json')
+    parallel = make_manager(temp_dir, 'parallel.json')
+    first = import_stats(sequential, path, workers=1, chunk_size=4096)
+    second = import_stats(parallel, path, workers=2, chunk_size=4096)
+
+    assert first == second
+    assert first['records'] == 3000
+    assert parallel.get_general_stats()['total_pomodoros'] == 3000
+    assert parallel.get_all_stats() == sequential.get_all_stats()
+
+
+
+@pytest.mark.transfer
+def test_import_merges_in_one_write_positive(temp_dir, monkeypatch):
+    stats = make_manager(temp_dir)
+    stats.save_completed_pomodoro(1500)
+    path = os.path.join(temp_dir, 'import.jsonl')
+    today = date.today().isoformat()
+    write_file(path, ''.join(json.dumps({'date': today, 'pomodoros': 2, 'work_time': 3000}) + '\n'
+                             for _ in range(50)))
+
+    writes = []
+    original = stats._write_snapshot
+    monkeypatch.setattr(stats, '_write_snapshot', lambda *args: writes.append(1) or original(*args))
+    monkeypatch.setattr(stats, 'save_completed_pomodoro', None)
+    import_stats(stats, path)
+
+    assert len(writes) == 1
+    assert stats.get_general_stats()['total_pomodoros'] == 101
+
+
+
+@pytest.mark.transfer
+def test_export_lines_are_lazy_positive():
+    def days():
+        yield '2024-01-01', {'pomodoros': 1, 'work_time': 60}
+        raise AssertionError('read past the first day')
+
+    lines = export_lines(days(), 'csv')
+
+    assert next(lines) == 'date,pomodoros,work_time\n'
+    assert next(lines) == '2024-01-01,1,60\n'
+
+
+
+# Border tests
+@pytest.mark.transfer
+def test_import_csv_with_bom_and_crlf_border(temp_dir):
+    path = os.path.join(temp_dir, 'excel.csv')
+    with open(path, 'wb') as f:
+        f.write('﻿Date,Pomodoros,Work_Time\r\n2024-02-01,3,4500\r\n\r\n2024-02-02,1,\r\n'.encode('utf-8'))
+
+    stats = make_manager(temp_dir)
+    report = import_stats(stats, path)
+
+    assert report['records'] == 2
+    assert stats.get_all_stats() == {'2024-02-01': {'pomodoros': 3, 'work_time': 4500},
+                                     '2024-02-02': {'pomodoros': 1, 'work_time': 0}}
+
+
+
+@pytest.mark.transfer
+@pytest.mark.parametrize('chunk_size', [1, 10, 1000])
+def test_split_ranges_cover_whole_lines_border(temp_dir, chunk_size):
+    path = os.path.join(temp_dir, 'lines.jsonl')
+    write_file(path, ''.join(f'{{"n": {i}}}\n' for i in range(50)))
+
+    ranges = split_ranges(path, chunk_size)
+
+    assert ranges[0][0] == 0
+    assert ranges[-1][1] == os.path.getsize(path)
+    with open(path, 'rb') as f:
+        data = f.read()
+    for start, end in ranges:
+        assert data[end - 1:end] == b'\n'
+        assert start == 0 or data[start - 1:start] == b'\n'
+
+
+
+@pytest.mark.transfer
+def test_export_empty_stats_border(temp_dir):
+    path = os.path.join(temp_dir, 'empty.csv')
+
+    assert export_stats(make_manager(temp_dir), path) == 0
+    with open(path, encoding='utf-8') as f:
+        assert f.read() == 'date,pomodoros,work_time\n'
+
+
+
+# Negative tests
+@pytest.mark.transfer
+def test_import_reports_invalid_records_negative(temp_dir):
+    path = os.path.join(temp_dir, 'broken.jsonl')
+    write_file(path, '{"date": "2024-03-01", "pomodoros": 2}\n'
+                     '{"date": "yesterday"}\n'
+                     '[1, 2]\n'
+                     '{"date": "2024-03-02", "pomodoros": -1}\n'
+                     'not json\n'
+                     '{"date": "2024-03-03", "work_time": "90.5"}\n')
+
+    stats = make_manager(temp_dir)
+    report = import_stats(stats, path)
+
+    assert report['records'] == 2
+    assert report['error_count'] == 4
+    assert report['errors'][0].startswith('offset 39:')
+    assert 'Skipped 4 invalid records' in describe_import(report)
+    assert stats.get_all_stats()['2024-03-03'] == {'pomodoros': 1, 'work_time': 90}
+
+
+
+@pytest.mark.transfer
+@pytest.mark.parametrize('name, content', [
+    ('stats.txt', 'date\n2024-01-01\n'),
+    ('stats.csv', 'day,count\n2024-01-01,1\n'),
+])
+def test_import_rejects_unknown_layout_negative(temp_dir, name, content):
+    path = os.path.join(temp_dir, name)
+    write_file(path, content)
+
+    with pytest.raises(ValueError):
+        import_stats(make_manager(temp_dir), path)
+
+
+
+@pytest.mark.transfer
+def test_import_failed_save_negative(temp_dir, monkeypatch):
+    path = os.path.join(temp_dir, 'import.csv')
+    write_file(path, 'date,pomodoros\n2024-01-01,1\n')
+    stats = make_manager(temp_dir)
+    monkeypatch.setattr(stats, 'merge_days', lambda days: False)
+
+    report = import_stats(stats, path)
+
+    assert report['saved'] is False
+    assert 'could not be saved' in describe_import(report)
@@ -0,0 +1,194 @@
+import pytest
+import subprocess
+import sys
+from src.core.scheduler import Scheduler
+from src.core.timer_engine import TimerEngine
+from src.core.timer_state import TimerState
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+
+@pytest.fixture(scope='function')
+def engine():
+    clock = FakeClock()
+    timer_state = TimerState()
+    timer_state.clock = clock
+    timer_state.wall_clock = clock
+    timer_state.pomodoro_time = timer_state.current_time = 3
+    timer_state.short_break_time = 2
+    timer_state.long_break_time = 5
+
+    scheduler = Scheduler(clock=clock)
+    timer_engine = TimerEngine(timer_state, scheduler, auto_start_delay=1.0)
+    events = []
+    for event in ('period_started', 'period_resumed', 'period_paused', 'tick',
+                  'period_finished', 'cycle_completed', 'timer_reset'):
+        timer_engine.subscribe(event, lambda *args, event=event: events.append((event,) + args))
+
+    def run_for(seconds):
+        end = clock.now + seconds
+        while True:
+            due = scheduler.next_due()
+            if due is None or due > end:
+                break
+            clock.now = max(clock.now, due)
+            scheduler.run_pending()
+        clock.now = end
+
+    yield timer_engine, events, run_for
+
+
+
+# Positive tests
+@pytest.mark.engine
+def test_engine_runs_period_to_finish_positive(engine):
+    timer_engine, events, run_for = engine
+    timer_engine.start()
+    run_for(3.1)
+
+    names = [event[0] for event in events]
+    assert names[0] == 'period_started'
+    assert names.count('tick') == 4
+    assert ('period_finished', 'pomodoro', 'short_break') in events
+    assert timer_engine.timer_state.is_running is False
+
+
+
+@pytest.mark.engine
+def test_engine_auto_starts_next_period_positive(engine):
+    timer_engine, events, run_for = engine
+    timer_engine.start()
+    run_for(4.5)
+
+    assert ('period_started', 'short_break') in events
+    assert timer_engine.timer_state.is_running is True
+
+
+
+@pytest.mark.engine
+def test_engine_cycle_completed_after_four_pomodoros_positive(engine):
+    timer_engine, events, run_for = engine
+    timer_engine.start()
+    run_for(4 * 4 + 3 * 3 + 1)
+
+    finished = [event for event in events if event[0] == 'period_finished']
+    assert finished[-1] == ('period_finished', 'pomodoro', 'long_break')
+    assert events.count(('cycle_completed',)) == 1
+
+
+
+@pytest.mark.engine
+def test_engine_pause_and_resume_positive(engine):
+    timer_engine, events, run_for = engine
+    timer_engine.start()
+    run_for(1.5)
+    timer_engine.pause()
+    run_for(100)
+
+    assert events[-1] == ('period_paused', 'pomodoro')
+    assert timer_engine.timer_state.current_time == 2
+
+    timer_engine.start()
+    assert ('period_resumed', 'pomodoro') in events
+
+
+
+# Border tests
+@pytest.mark.engine
+def test_engine_reset_cancels_auto_start_border(engine):
+    timer_engine, events, run_for = engine
+    timer_engine.start()
+    run_for(3.5)
+    timer_engine.reset()
+    run_for(10)
+
+    assert events[-1] == ('timer_reset',)
+    assert timer_engine.timer_state.is_pomodoro_mode is True
+    assert timer_engine.timer_state.is_running is False
+
+
+
+@pytest.mark.engine
+def test_engine_without_auto_start_border(engine):
+    timer_engine, events, run_for = engine
+    timer_engine.auto_start_delay = None
+    timer_engine.start()
+    run_for(30)
+
+    assert [event[0] for event in events].count('period_started') == 1
+
+
+
+@pytest.mark.engine
+def test_engine_without_ticks_wakes_at_deadline_border(engine):
+    timer_engine, events, run_for = engine
+    timer_engine.timer_state.pomodoro_time = timer_engine.timer_state.current_time = 150
+    timer_engine.start()
+    timer_engine.set_ticks_enabled(False)
+    scheduler = timer_engine.scheduler
+
+    assert scheduler.next_due() == pytest.approx(100.0 + 60.0, abs=0.01)
+    run_for(100)
+    assert [event[0] for event in events].count('tick') == 1  # Только первый тик при старте
+
+    timer_engine.set_ticks_enabled(True)
+    assert events[-1] == ('tick', pytest.approx(50.0))
+
+    timer_engine.set_ticks_enabled(False)
+    run_for(50.1)
+    assert ('period_finished', 'pomodoro', 'short_break') in events
+
+
+
+@pytest.mark.engine
+def test_engine_headless_imports_border():
+    code = ('import sys; import src.core.timer_engine, src.core.scheduler; '
+            'print("customtkinter" in sys.modules or "pygame" in sys.modules)')
+    output = subprocess.check_output([sys.executable, '-c', code], text=True)
+    assert output.strip() == 'False'
+
+
+
+# Negative tests
+@pytest.mark.engine
+def test_engine_unknown_event_negative(engine):
+    timer_engine, events, run_for = engine
+    with pytest.raises(ValueError):
+        timer_engine.subscribe('exploded', print)
+
+
+
+@pytest.mark.engine
+def test_engine_double_start_negative(engine):
+    timer_engine, events, run_for = engine
+    timer_engine.start()
+    timer_engine.start()
+
+    assert [event[0] for event in events].count('period_started') == 1
+
+
+
+@pytest.mark.engine
+def test_engine_failing_subscriber_negative(engine):
+    timer_engine, events, run_for = engine
+    called = []
+
+    def broken(*args):
+        raise RuntimeError('handler failed')
+    timer_engine.subscribe('tick', broken)
+    timer_engine.subscribe('period_finished', broken)
+    timer_engine.subscribe('period_finished', lambda *args: called.append(args))
+
+    timer_engine.start()
+    run_for(4.5)
+
+    assert called == [('pomodoro', 'short_break')]
+    assert ('period_started', 'short_break') in events
+    assert timer_engine.timer_state.is_running is True
@@ -1,10 +1,11 @@
 import pytest
 import sys
 import os
+import time
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from src.core.timer_state import TimerState
+from src.core.timer_state import TimerState, period_name
 
 
 @pytest.fixture(scope='function')
@@ -13,6 +14,23 @@ def timer():
     yield timer
 
 
+
+@pytest.fixture(scope='function')
+def clocked_timer():
+    # Часы без учёта сна (как time.monotonic() на macOS): сон угадывается по настенным
+    clock = {'mono': 1000.0, 'wall': 1700000000.0}
+    timer = TimerState()
+    timer.clock = lambda: clock['mono']
+    timer.wall_clock = lambda: clock['wall']
+    timer.clock_counts_suspend = False
+
+    def advance(seconds, wall_seconds=None):
+        clock['mono'] += seconds
+        clock['wall'] += seconds if wall_seconds is None else wall_seconds
+
+    yield timer, advance
+
+
 # Positive tests
 @pytest.mark.timer
 @pytest.mark.parametrize('pomodoro_time, expected_result', [
@@ -66,6 +84,83 @@ def test_timer_reset_positive(timer):
     assert timer.is_running is False
 
 
+@pytest.mark.timer
+@pytest.mark.parametrize('elapsed, expected_time', [
+    (0.0, 1500),
+    (0.4, 1500),
+    (1.0, 1499),
+    (61.2, 1439),
+])
+def test_timer_countdown_from_deadline_positive(clocked_timer, elapsed, expected_time):
+    timer, advance = clocked_timer
+    timer.start_countdown()
+    advance(elapsed)
+
+    timer.sync_remaining()
+    assert timer.current_time == expected_time
+
+
+
+@pytest.mark.timer
+def test_timer_late_ticks_do_not_drift_positive(clocked_timer):
+    timer, advance = clocked_timer
+    timer.pomodoro_time = timer.current_time = 3600
+    timer.start_countdown()
+
+    # Каждый тик опаздывает на 30 мс - итог всё равно привязан к дедлайну
+    while timer.sync_remaining() > 0:
+        advance(timer.next_tick_delay() + 0.03)
+
+    assert timer.current_time == 0
+    assert timer.clock() - 1000.0 == pytest.approx(3600, abs=1.1)
+
+
+
+@pytest.mark.timer
+def test_timer_pause_resume_keeps_fraction_positive(clocked_timer):
+    timer, advance = clocked_timer
+    timer.start_countdown()
+    advance(10.6)
+    timer.stop_countdown()
+    advance(500)
+
+    timer.start_countdown()
+    advance(1489.4)
+    assert timer.sync_remaining() == pytest.approx(0)
+
+
+
+@pytest.mark.timer
+def test_timer_progress_is_sub_second_positive(clocked_timer):
+    timer, advance = clocked_timer
+    timer.pomodoro_time = timer.current_time = 100
+    timer.start_countdown()
+    advance(25.5)
+
+    assert timer.get_progress() == pytest.approx(0.745)
+    assert timer.current_time == 100  # get_progress не трогает состояние
+
+    timer.stop_countdown()
+    advance(10)
+    assert timer.get_progress() == pytest.approx(0.745)
+
+
+
+@pytest.mark.timer
+def test_timer_period_matches_helper_positive():
+    timer = TimerState()
+    for cycle_count, period, status, duration in ((0, 'long_break', 'Long break', 15 * 60),
+                                                   (2, 'short_break', 'Short break', 5 * 60)):
+        timer.is_pomodoro_mode = False
+        timer.cycle_count = cycle_count
+        assert period_name(False, cycle_count) == timer.get_current_period() == period
+        assert timer.get_current_period_name() == status
+        assert timer.get_initial_time() == duration
+
+    assert period_name(True, 3) == 'pomodoro'
+
+
+
 # Border tests
 @pytest.mark.timer
 @pytest.mark.parametrize('time_value, expected_result', [
@@ -106,6 +201,51 @@ def test_timer_get_initial_time_border(timer, mode, cycle, expected_time_source)
     assert result == expected
 
 
+@pytest.mark.timer
+@pytest.mark.parametrize('remaining, expected_delay', [
+    (1500.0, 1.005),
+    (1499.25, 0.255),
+    (0.5, 0.505),
+])
+def test_timer_tick_aligned_to_second_border(clocked_timer, remaining, expected_delay):
+    timer, advance = clocked_timer
+    timer.start_countdown()
+    advance(1500 - remaining)
+
+    assert timer.next_tick_delay() == pytest.approx(expected_delay)
+
+
+
+@pytest.mark.timer
+@pytest.mark.parametrize('sleep_seconds, expected_time', [
+    (1.0, 1491),
+    (600.0, 891),
+])
+def test_timer_system_suspend_border(clocked_timer, sleep_seconds, expected_time):
+    timer, advance = clocked_timer
+    timer.start_countdown()
+    advance(9)
+
+    # Монотонные часы стоят во время сна, настенные идут
+    advance(0, wall_seconds=sleep_seconds)
+    timer.sync_remaining()
+
+    assert timer.current_time == expected_time
+
+
+
+@pytest.mark.timer
+@pytest.mark.parametrize('current_time, expected_progress', [
+    (1500, 1.0),
+    (0, 0.0),
+    (3000, 1.0),
+])
+def test_timer_progress_bounds_border(timer, current_time, expected_progress):
+    timer.current_time = current_time
+    assert timer.get_progress() == expected_progress
+
+
+
 # Negative tests
 @pytest.mark.timer
 @pytest.mark.parametrize('invalid_time', [
@@ -163,3 +303,36 @@ def test_timer_inconsistent_state_negative(timer):
 
     initial_time = timer.get_initial_time()
     assert initial_time == timer.pomodoro_time
+
+
+
+
+@pytest.mark.timer
+def test_timer_wall_clock_set_forward_ignored_with_boottime_negative(clocked_timer):
+    # Часы, считающие сон (CLOCK_BOOTTIME): перевод настенных часов на 10 минут
+    # не съедает время помидора
+    timer, advance = clocked_timer
+    timer.clock_counts_suspend = True
+    timer.start_countdown()
+    advance(10, wall_seconds=600)
+
+    timer.sync_remaining()
+    assert timer.current_time == 1490
+
+
+
+@pytest.mark.timer
+def test_timer_default_clock_counts_suspend_where_available_negative(timer):
+    expected = hasattr(time, 'CLOCK_BOOTTIME') or sys.platform == 'win32'
+    assert timer.clock_counts_suspend is expected
+
+
+
+@pytest.mark.timer
+def test_timer_wall_clock_set_back_negative(clocked_timer):
+    timer, advance = clocked_timer
+    timer.start_countdown()
+    advance(10, wall_seconds=-3600)
+
+    timer.sync_remaining()
+    assert timer.current_time == 1490
@@ -0,0 +1,118 @@
+import pytest
+import threading
+import time
+from src.ui.tk_executor import TkExecutor
+
+
+class FakeRoot:
+    def __init__(self):
+        self.callbacks = {}
+        self._next_id = 0
+
+    def after(self, delay, callback):
+        self._next_id += 1
+        self.callbacks[self._next_id] = callback
+        return self._next_id
+
+    def after_cancel(self, handle):
+        self.callbacks.pop(handle, None)
+
+    def run_until_idle(self, timeout=2.0):
+        # Крутим "главный цикл", пока executor планирует опрос
+        deadline = time.monotonic() + timeout
+        while self.callbacks:
+            if time.monotonic() > deadline:
+                raise TimeoutError('executor did not finish')
+            time.sleep(0.01)
+            for handle in list(self.callbacks):
+                self.callbacks.pop(handle)()
+
+
+@pytest.fixture(scope='function')
+def executor():
+    root = FakeRoot()
+    executor = TkExecutor(root)
+    yield executor
+    executor.shutdown()
+
+
+
+# Positive tests
+@pytest.mark.loader
+def test_executor_callback_on_main_thread_positive(executor):
+    results = []
+    main_thread = threading.current_thread()
+
+    executor.submit(lambda a, b: (a + b, threading.current_thread()), 2, 3,
+                    callback=lambda result: results.append((result, threading.current_thread())))
+    executor.root.run_until_idle()
+
+    (value, worker_thread), callback_thread = results[0]
+    assert value == 5
+    assert worker_thread is not main_thread
+    assert callback_thread is main_thread
+    assert executor.pending_count == 0
+
+
+
+@pytest.mark.loader
+def test_executor_keeps_submit_order_positive(executor):
+    results = []
+
+    for i in range(10):
+        executor.submit(lambda value: value, i, callback=results.append)
+    executor.root.run_until_idle()
+
+    assert results == list(range(10))
+
+
+
+# Border tests
+@pytest.mark.loader
+def test_executor_stops_polling_when_idle_border(executor):
+    executor.submit(lambda: None)
+    executor.root.run_until_idle()
+
+    assert executor.root.callbacks == {}
+    assert executor.pending_count == 0
+
+
+
+@pytest.mark.loader
+def test_executor_shutdown_drops_results_border(executor):
+    gate = threading.Event()
+    results = []
+
+    executor.submit(gate.wait, callback=results.append)
+    executor.shutdown()
+    gate.set()
+    executor.submit(lambda: 1, callback=results.append)
+
+    assert executor.root.callbacks == {}
+    assert results == []
+
+
+
+# Negative tests
+@pytest.mark.loader
+def test_executor_error_goes_to_errback_negative(executor):
+    errors = []
+
+    executor.submit(lambda: 1 / 0, callback=lambda result: pytest.fail('unexpected result'),
+                    errback=errors.append)
+    executor.root.run_until_idle()
+
+    assert isinstance(errors[0], ZeroDivisionError)
+
+
+
+@pytest.mark.loader
+def test_executor_callback_error_does_not_stop_polling_negative(executor, capsys):
+    results = []
+
+    executor.submit(lambda: 1, callback=lambda result: 1 / 0)
+    executor.submit(lambda: 2, callback=results.append)
+    executor.root.run_until_idle()
+
+    assert results == [2]
+    assert 'Error handling background result' in capsys.readouterr().out
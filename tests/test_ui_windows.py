@@ -0,0 +1,255 @@
+import pytest
+import time
+from src.core.timer_state import TimerState
+from src.ui import ui_windows
+from src.ui.ui_windows import UIWindows
+
+
+class FakeRoot:
+    def __init__(self):
+        self.callbacks = {}
+        self._next_id = 0
+
+    def after(self, delay, callback):
+        self._next_id += 1
+        self.callbacks[self._next_id] = callback
+        return self._next_id
+
+    def after_cancel(self, handle):
+        self.callbacks.pop(handle, None)
+
+    def run_until_idle(self, timeout=2.0):
+        deadline = time.monotonic() + timeout
+        while self.callbacks:
+            if time.monotonic() > deadline:
+                raise TimeoutError('loader did not finish')
+            time.sleep(0.01)
+            for handle in list(self.callbacks):
+                self.callbacks.pop(handle)()
+
+
+class FakeWindow:
+    def __init__(self):
+        self.exists = True
+        self.calls = []
+        self.protocols = {}
+
+    def winfo_exists(self):
+        return self.exists
+
+    def protocol(self, name, callback):
+        self.protocols[name] = callback
+
+    def __getattr__(self, name):
+        # withdraw, deiconify, lift, focus_force, grab_set, grab_release
+        return lambda: self.calls.append(name)
+
+
+class FakeLabel:
+    def __init__(self):
+        self.text = None
+
+    def configure(self, text):
+        self.text = text
+
+
+class FakeDayList:
+    def __init__(self):
+        self.totals = []
+
+    def set_total(self, total_rows):
+        self.totals.append(total_rows)
+
+
+class FakeVar:
+    def __init__(self):
+        self.value = None
+
+    def set(self, value):
+        self.value = value
+
+    def get(self):
+        return self.value
+
+
+class FakeStatsManager:
+    def __init__(self):
+        self.history_requests = 0
+        self.repairs = 0
+        self.general_error = None
+        self.trends_error = None
+
+    def get_general_stats(self):
+        if self.general_error is not None:
+            raise self.general_error
+        return {'total_pomodoros': 12, 'total_time': 18000, 'total_days': 3, 'avg_per_day': 4.0}
+
+    def get_history_length(self):
+        self.history_requests += 1
+        return 40 + self.history_requests
+
+    def repair_stats_file(self):
+        self.repairs += 1
+
+    def get_analytics(self):
+        if self.trends_error is not None:
+            raise self.trends_error
+        return self
+
+    def summary(self):
+        return {'current_streak': 3, 'longest_streak': 5, 'this_week': 7, 'this_month': 12,
+                'this_year': 12, 'avg_7_days': 1.0, 'avg_30_days': 0.4, 'best_weekday': 'Monday'}
+
+
+@pytest.fixture(scope='function')
+def windows():
+    root = FakeRoot()
+    stats_manager = FakeStatsManager()
+    ui = UIWindows(root, TimerState(), None, lambda: stats_manager, lambda: None)
+    built = []
+
+    def make_builder(name):
+        def build():
+            window = FakeWindow()
+            built.append((name, window))
+            if name == 'settings':
+                ui._settings_vars = {key: FakeVar() for key in (
+                    'pomodoro_time', 'short_break_time', 'long_break_time', 'notification_type',
+                    'pomodoro_sound', 'short_break_sound', 'long_break_sound')}
+            elif name == 'stats':
+                ui._general_label = FakeLabel()
+                ui._trends_label = FakeLabel()
+                ui._day_list = FakeDayList()
+            return window
+        return build
+
+    for name in ('about', 'settings', 'stats'):
+        setattr(ui, f'_build_{name}', make_builder(name))
+
+    yield ui, root, built, stats_manager
+    ui.close()
+
+
+
+# Positive tests
+@pytest.mark.windows
+def test_windows_reused_between_shows_positive(windows):
+    ui, root, built, stats_manager = windows
+    ui.show_about()
+    ui.show_about()
+
+    assert [name for name, window in built] == ['about']
+    window = built[0][1]
+    assert window.calls.count('withdraw') == 1
+    assert window.calls.count('deiconify') == 2
+
+
+
+@pytest.mark.windows
+def test_windows_prebuild_builds_each_once_positive(windows):
+    ui, root, built, stats_manager = windows
+    ui.prebuild()
+    ui.show_about()
+    ui.show_settings()
+    ui.show_stats()
+    root.run_until_idle()
+
+    assert [name for name, window in built] == ['about', 'settings', 'stats']
+
+
+
+@pytest.mark.windows
+def test_windows_settings_refreshed_on_show_positive(windows):
+    ui, root, built, stats_manager = windows
+    ui.show_settings()
+    ui.timer_state.pomodoro_time = 30 * 60
+    ui.timer_state.long_break_sound = 'soft_bell'
+    ui.show_settings()
+
+    assert len(built) == 1
+    assert ui._settings_vars['pomodoro_time'].get() == '30'
+    assert ui._settings_vars['long_break_sound'].get() == 'Soft bell'
+
+
+
+@pytest.mark.windows
+def test_windows_stats_refreshed_on_show_positive(windows):
+    ui, root, built, stats_manager = windows
+    ui.show_stats()
+    assert ui._general_label.text == 'Loading...'
+    root.run_until_idle()
+
+    assert 'Total Pomodoros: 12' in ui._general_label.text
+    assert 'Current streak: 3 days' in ui._trends_label.text
+    assert ui._day_list.totals == [0, 41]
+
+    ui.show_stats()
+    root.run_until_idle()
+    assert len(built) == 1
+    assert ui._day_list.totals == [0, 41, 0, 42]
+
+
+
+# Border tests
+@pytest.mark.windows
+def test_windows_destroyed_window_recreated_border(windows):
+    ui, root, built, stats_manager = windows
+    ui.show_about()
+    built[0][1].exists = False
+    ui.show_about()
+
+    assert [name for name, window in built] == ['about', 'about']
+    assert ui._windows['about'] is built[1][1]
+
+
+
+@pytest.mark.windows
+def test_windows_close_button_hides_border(windows):
+    ui, root, built, stats_manager = windows
+    ui.show_about()
+    window = built[0][1]
+    window.protocols['WM_DELETE_WINDOW']()
+    ui.show_about()
+
+    assert window.calls[-6:] == ['grab_release', 'withdraw', 'deiconify', 'lift', 'focus_force', 'grab_set']
+    assert len(built) == 1
+
+
+
+@pytest.mark.windows
+def test_windows_stale_stats_response_ignored_border(windows):
+    ui, root, built, stats_manager = windows
+    ui.show_stats()
+    ui.show_stats()
+    root.run_until_idle()
+
+    # Ответ на первый запрос пришёл после второго show_stats и отброшен
+    assert ui._day_list.totals == [0, 0, 42]
+
+
+
+# Negative tests
+@pytest.mark.windows
+def test_windows_trends_error_shown_negative(windows):
+    ui, root, built, stats_manager = windows
+    stats_manager.trends_error = ValueError('broken analytics')
+    ui.show_stats()
+    root.run_until_idle()
+
+    assert ui._trends_label.text == "Couldn't load trends"
+    assert 'Total Pomodoros: 12' in ui._general_label.text
+
+
+
+@pytest.mark.windows
+def test_windows_stats_error_keeps_file_negative(windows, monkeypatch):
+    ui, root, built, stats_manager = windows
+    errors = []
+    monkeypatch.setattr(ui_windows.messagebox, 'showerror', lambda *args: errors.append(args))
+    stats_manager.general_error = OSError('disk error')
+    ui.show_stats()
+    root.run_until_idle()
+
+    assert ui._general_label.text == "Couldn't load statistics"
+    assert stats_manager.repairs == 1
+    assert len(errors) == 1